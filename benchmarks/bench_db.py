@@ -0,0 +1,371 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: benchmarky DB funkcí
+-------------------------------------------------------------------------------------------
+Popis:
+Reprodukovatelné měření výkonu DB funkcí na testovací databázi (proměnné DB_TEST_* z .env)
+při realistických velikostech tabulky 'ukoly' (výchozí 1 000 / 100 000 / 1 000 000 řádků).
+
+Pro každou velikost tabulky a úroveň souběžnosti (počet vláken, každé s vlastním připojením)
+se měří propustnost (operace/s, řádky/s) a latence p50/p99 jednotlivých i hromadných operací
+a výpisů. Výsledky se zapisují do JSON souboru a porovnávají s uloženou baseline;
+zhoršení nad toleranci se vypíše a skript skončí s návratovým kódem 1. Chybějící baseline
+nebo baseline jiného backendu je chyba (návratový kód 2) – porovnání se tiše nepřeskakuje;
+první baseline na daném stroji se uloží přepínačem --ulozit-baseline.
+
+Pokud MySQL/MariaDB server není dostupný (nebo je zadán přepínač --embedded či DB_BACKEND=sqlite),
+měří se proti vestavěnému backendu nad SQLite (task_manager_mysql/embedded_db.py) v dočasném
+souboru. Baseline se porovnává jen s výsledky stejného backendu.
+
+Cache výpisů je během měření vypnutá (měří se práce databáze) a výstup print() DB funkcí
+se zahazuje, aby měření neovlivňoval výpis na terminál.
+
+POZOR: skript na začátku každé velikosti vyprázdní tabulku 'ukoly' v testovací databázi.
+
+Spuštění (po pip install -e .):
+    python benchmarks/bench_db.py
+    python benchmarks/bench_db.py --velikosti 1000 100000 --soubeznost 1 4 --embedded
+    python benchmarks/bench_db.py --ulozit-baseline      # uloží výsledky jako novou baseline
+==============================================================================================
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import mysql.connector
+
+from task_manager_mysql.cache import cache_vypisu
+from task_manager_mysql.embedded_db import EmbeddedPripojeni
+from task_manager_mysql.ovladac import nacist_prostredi, zvoleny_backend
+from task_manager_mysql.pool import parametry_pripojeni
+from task_manager_mysql.pripravene import pripravene_zapnuty
+from task_manager_mysql.task_manager_mysql_p2 import (
+    NEDOKONCENE_STAVY,
+    aktualizovat_ukol_db,
+    aktualizovat_ukoly_db,
+    najit_ukol_db,
+    odstranit_ukol_db,
+    odstranit_ukoly_db,
+    pridat_ukol_db,
+    pridat_ukoly_db,
+    stranky_ukolu,
+    vytvoreni_tabulky,
+    zobrazit_ukoly,
+)
+
+ADRESAR = os.path.dirname(os.path.abspath(__file__))
+VELIKOST_DAVKY = 100        # počet řádků jedné hromadné operace
+
+
+# 1) Backend pro měření – MySQL testovací databáze nebo vestavěná náhrada (SQLite)
+class BackendMySQL:
+    nazev = "mysql"
+
+    def __init__(self):
+        self.parametry = parametry_pripojeni(test_db=True)
+
+    def pripojit(self):
+        return mysql.connector.connect(**self.parametry)
+
+    def pripravit(self):
+        conn = self.pripojit()
+        with _bez_vystupu():
+            vytvoreni_tabulky(conn)
+        cursor = conn.cursor()
+        cursor.execute("TRUNCATE TABLE ukoly")
+        cursor.close()
+        conn.close()
+
+
+class BackendEmbedded:
+    nazev = "embedded"
+
+    def __init__(self):
+        self._adresar = tempfile.mkdtemp(prefix="task_manager_bench_")
+        self.cesta = os.path.join(self._adresar, "ukoly.db")
+
+    def pripojit(self):
+        return EmbeddedPripojeni(self.cesta)
+
+    def pripravit(self):
+        for pripona in ("", "-wal", "-shm"):
+            if os.path.exists(self.cesta + pripona):
+                os.remove(self.cesta + pripona)
+        conn = self.pripojit()
+        with _bez_vystupu():
+            vytvoreni_tabulky(conn)     # stejné migrace jako na MySQL (rozdíly SQL dodává DialektSQLite)
+        conn.close()
+
+
+def zvolit_backend(vynutit_embedded):
+    nacist_prostredi()
+    if not vynutit_embedded and zvoleny_backend() == "mysql":
+        backend = BackendMySQL()
+        try:
+            backend.pripojit().close()
+            return backend
+        except mysql.connector.Error as err:
+            print(f"MySQL není dostupné ({err}), měří se proti vestavěnému backendu (SQLite).")
+    return BackendEmbedded()
+
+
+@contextlib.contextmanager
+def _bez_vystupu():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# 2) Naplnění tabulky – velikost řádků přes hromadné vkládání, stavy rovnoměrně rozložené (nezahájeno/probíhá/hotovo)
+def naplnit(backend, velikost):
+    backend.pripravit()
+    conn = backend.pripojit()
+    radky = ((f"úkol {i}", f"popis benchmarkového úkolu číslo {i}") for i in range(velikost))
+    with _bez_vystupu():
+        pridat_ukoly_db(radky, conn, batch_size=5000)
+    cursor = conn.cursor()
+    cursor.execute("UPDATE ukoly SET stav = 'probíhá' WHERE id % 3 = 1")
+    cursor.execute("UPDATE ukoly SET stav = 'hotovo' WHERE id % 3 = 2")
+    conn.commit()
+    cursor.execute("SELECT MIN(id), MAX(id) FROM ukoly")
+    rozsah = cursor.fetchone()
+    cursor.close()
+    conn.close()
+    return rozsah
+
+
+# 3) Měřené operace
+# každá operace dostane (conn, kontext, rng) a vrací počet zpracovaných řádků (0 = není co zpracovat, měření končí);
+# kontext obsahuje rozsah id naplněné tabulky a frontu id vložených během měření (pro výmazy)
+def _nahodne_id(kontext, rng):
+    return rng.randint(kontext["min_id"], kontext["max_id"])
+
+def _vzit_ke_smazani(kontext, pocet):
+    fronta = kontext["ke_smazani"]
+    ids = []
+    with kontext["zamek"]:
+        while fronta and len(ids) < pocet:
+            ids.append(fronta.popleft())
+    return ids
+
+def op_pridat(conn, kontext, rng):
+    return 1 if pridat_ukol_db("bench vložený", "úkol vložený benchmarkem", conn) else 0
+
+def op_pridat_davku(conn, kontext, rng):
+    vysledek = pridat_ukoly_db((("bench vložený", "úkol vložený benchmarkem"),) * VELIKOST_DAVKY, conn)
+    return vysledek[0] if vysledek else 0
+
+def op_najit(conn, kontext, rng):
+    return 1 if najit_ukol_db(_nahodne_id(kontext, rng), conn) else 0
+
+def op_aktualizovat(conn, kontext, rng):
+    aktualizovat_ukol_db(_nahodne_id(kontext, rng), rng.choice(("probíhá", "hotovo")), conn)
+    return 1
+
+def op_aktualizovat_davku(conn, kontext, rng):
+    ids = [_nahodne_id(kontext, rng) for _ in range(VELIKOST_DAVKY)]
+    vysledek = aktualizovat_ukoly_db(ids, rng.choice(("probíhá", "hotovo")), conn)
+    return len(vysledek[0]) if vysledek else 0
+
+def op_odstranit(conn, kontext, rng):
+    ids = _vzit_ke_smazani(kontext, 1)
+    return 1 if ids and odstranit_ukol_db(ids[0], conn) else 0
+
+def op_odstranit_davku(conn, kontext, rng):
+    ids = _vzit_ke_smazani(kontext, VELIKOST_DAVKY)
+    vysledek = odstranit_ukoly_db(ids, conn) if ids else False
+    return len(vysledek[0]) if vysledek else 0
+
+def op_vypis_nedokoncenych(conn, kontext, rng):
+    return len(zobrazit_ukoly(conn) or [])
+
+def op_prvni_stranka(conn, kontext, rng):
+    return len(next(stranky_ukolu(conn, NEDOKONCENE_STAVY, velikost_stranky=20), []))
+
+# pořadí je důležité: výmazy odstraňují úkoly vložené předchozími operacemi, velikost tabulky tak zůstává stálá
+OPERACE = [
+    ("pridat_ukol_db", op_pridat),
+    ("pridat_ukoly_db[100]", op_pridat_davku),
+    ("najit_ukol_db", op_najit),
+    ("aktualizovat_ukol_db", op_aktualizovat),
+    ("aktualizovat_ukoly_db[100]", op_aktualizovat_davku),
+    ("odstranit_ukol_db", op_odstranit),
+    ("odstranit_ukoly_db[100]", op_odstranit_davku),
+    ("stranky_ukolu[1. stránka]", op_prvni_stranka),
+    ("zobrazit_ukoly", op_vypis_nedokoncenych),
+]
+
+
+# 4) Měření jedné operace při dané souběžnosti
+# každé vlákno má vlastní připojení; měření začíná až po připojení všech vláken (Barrier);
+# vlákno končí po max_opakovani operacích, po vypršení limitu času nebo když operace nemá co zpracovat
+def zmerit(backend, operace, kontext, soubeznost, max_opakovani, limit_s, seed):
+    bariera = threading.Barrier(soubeznost)
+
+    def vlakno(index):
+        conn = backend.pripojit()
+        rng = random.Random(seed + index)
+        latence, radky = [], 0
+        try:
+            bariera.wait()
+            zacatek = time.perf_counter()
+            konec_limitu = zacatek + limit_s
+            for _ in range(max_opakovani):
+                t0 = time.perf_counter()
+                zpracovano = operace(conn, kontext, rng)
+                latence.append(time.perf_counter() - t0)
+                if not zpracovano:
+                    break
+                radky += zpracovano
+                if time.perf_counter() > konec_limitu:
+                    break
+            return zacatek, time.perf_counter(), latence, radky
+        finally:
+            conn.close()
+
+    with _bez_vystupu(), ThreadPoolExecutor(max_workers=soubeznost) as executor:
+        vysledky = list(executor.map(vlakno, range(soubeznost)))
+
+    zacatek = min(v[0] for v in vysledky)
+    konec = max(v[1] for v in vysledky)
+    latence = sorted(l for v in vysledky for l in v[2])
+    radky = sum(v[3] for v in vysledky)
+    doba = max(konec - zacatek, 1e-9)
+    return {
+        "pocet": len(latence),
+        "doba_s": round(doba, 4),
+        "ops_s": round(len(latence) / doba, 2),
+        "radky_s": round(radky / doba, 2),
+        "p50_ms": round(_percentil(latence, 50) * 1000, 3),
+        "p99_ms": round(_percentil(latence, 99) * 1000, 3),
+    }
+
+def _percentil(serazene, percentil):
+    if not serazene:
+        return 0.0
+    index = max(0, min(len(serazene) - 1, round(percentil / 100 * len(serazene)) - 1))
+    return serazene[index]
+
+
+# 5) Porovnání s baseline
+# zhoršení = propustnost nižší nebo latence p99 vyšší o více než tolerance (poměr, např. 0.2 = 20 %);
+# porovnávají se jen měření se stejným backendem, operací, velikostí a souběžností;
+# vrací seznam zhoršení nebo None (baseline byla naměřena na jiném backendu)
+def porovnat(vysledky, baseline, tolerance):
+    if baseline.get("meta", {}).get("backend") != vysledky["meta"]["backend"]:
+        return None
+    puvodni = {(m["operace"], m["velikost"], m["soubeznost"]): m for m in baseline.get("mereni", [])}
+    zhorseni = []
+    for mereni in vysledky["mereni"]:
+        zaklad = puvodni.get((mereni["operace"], mereni["velikost"], mereni["soubeznost"]))
+        if zaklad is None:
+            continue
+        if mereni["ops_s"] < zaklad["ops_s"] * (1 - tolerance) or mereni["p99_ms"] > zaklad["p99_ms"] * (1 + tolerance):
+            zhorseni.append((mereni, zaklad))
+    return zhorseni
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarky DB funkcí Task Manageru (testovací databáze).")
+    parser.add_argument("--velikosti", type=int, nargs="+", default=[1_000, 100_000, 1_000_000],
+                        help="velikosti tabulky 'ukoly' (počet řádků)")
+    parser.add_argument("--soubeznost", type=int, nargs="+", default=[1, 4, 16], help="počty souběžných vláken")
+    parser.add_argument("--opakovani", type=int, default=200, help="max. počet operací jednoho vlákna v jednom měření")
+    parser.add_argument("--limit", type=float, default=5.0, help="max. doba jednoho měření (s)")
+    parser.add_argument("--seed", type=int, default=42, help="seed generátoru náhodných ID (reprodukovatelnost)")
+    parser.add_argument("--embedded", action="store_true",
+                        help="měřit proti vestavěné náhradě (SQLite) i při dostupném MySQL")
+    parser.add_argument("--vystup", default=os.path.join(ADRESAR, "vysledky.json"), help="soubor pro výsledky (JSON)")
+    parser.add_argument("--baseline", default=os.path.join(ADRESAR, "baseline.json"), help="soubor s baseline (JSON)")
+    parser.add_argument("--ulozit-baseline", action="store_true", help="uložit výsledky zároveň jako novou baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="povolené zhoršení proti baseline (poměr)")
+    args = parser.parse_args(argv)
+
+    backend = zvolit_backend(args.embedded)
+    cache_vypisu.nastavit(ttl=0)          # měří se databáze, ne cache výpisů
+
+    vysledky = {
+        "meta": {
+            "backend": backend.nazev,
+            "pripravene_prikazy": pripravene_zapnuty(),
+            "datum": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platforma": platform.platform(),
+            "opakovani": args.opakovani,
+            "limit_s": args.limit,
+            "seed": args.seed,
+        },
+        "mereni": [],
+    }
+
+    for velikost in args.velikosti:
+        print(f"\nNaplňování tabulky 'ukoly' na {velikost} řádků ({backend.nazev})...")
+        t0 = time.perf_counter()
+        min_id, max_id = naplnit(backend, velikost)
+        print(f"Naplněno za {time.perf_counter() - t0:.1f} s.")
+        kontext = {"min_id": min_id, "max_id": max_id, "ke_smazani": deque(), "zamek": threading.Lock()}
+
+        for soubeznost in args.soubeznost:
+            for nazev, operace in OPERACE:
+                if nazev == "odstranit_ukol_db":
+                    kontext["ke_smazani"] = deque(_vlozene_behem_mereni(backend, max_id))
+                mereni = zmerit(backend, operace, kontext, soubeznost, args.opakovani, args.limit, args.seed)
+                mereni.update({"operace": nazev, "velikost": velikost, "soubeznost": soubeznost})
+                vysledky["mereni"].append(mereni)
+                print(f"{nazev:<28} n={velikost:<9} vlákna={soubeznost:<3} {mereni['ops_s']:>10.1f} op/s "
+                      f"{mereni['radky_s']:>11.1f} řádků/s  "
+                      f"p50={mereni['p50_ms']:.2f} ms  p99={mereni['p99_ms']:.2f} ms")
+
+    with open(args.vystup, "w", encoding="utf-8") as soubor:
+        json.dump(vysledky, soubor, ensure_ascii=False, indent=2)
+    print(f"\nVýsledky uloženy do {args.vystup}.")
+
+    if args.ulozit_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as soubor:
+            json.dump(vysledky, soubor, ensure_ascii=False, indent=2)
+        print(f"Baseline uložena do {args.baseline}.")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"CHYBA: baseline {args.baseline} neexistuje, výsledky nelze porovnat "
+              "(uložte ji přepínačem --ulozit-baseline).", file=sys.stderr)
+        return 2
+
+    with open(args.baseline, encoding="utf-8") as soubor:
+        baseline = json.load(soubor)
+    zhorseni = porovnat(vysledky, baseline, args.tolerance)
+    if zhorseni is None:
+        print(f"CHYBA: baseline {args.baseline} byla naměřena na backendu {baseline.get('meta', {}).get('backend')}, "
+              f"výsledky na backendu {backend.nazev} – porovnání není možné.", file=sys.stderr)
+        return 2
+    for mereni, zaklad in zhorseni:
+        print(f"ZHORŠENÍ: {mereni['operace']} n={mereni['velikost']} vlákna={mereni['soubeznost']}: "
+              f"{zaklad['ops_s']} -> {mereni['ops_s']} op/s, p99 {zaklad['p99_ms']} -> {mereni['p99_ms']} ms")
+    print(f"Porovnání s baseline: {len(zhorseni)} zhoršení (tolerance {args.tolerance:.0%}).")
+    return 1 if zhorseni else 0
+
+
+# id úkolů vložených během měření (nad rámec naplněné tabulky) – výmazy odstraňují právě je
+def _vlozene_behem_mereni(backend, max_id):
+    conn = backend.pripojit()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM ukoly WHERE id > %s ORDER BY id", (max_id,))
+    ids = [radek[0] for radek in cursor.fetchall()]
+    cursor.close()
+    conn.close()
+    return ids
+
+
+if __name__ == "__main__":
+    sys.exit(main())
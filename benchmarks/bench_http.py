@@ -0,0 +1,195 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: zátěžový test HTTP API
+-------------------------------------------------------------------------------------------
+Popis:
+Zátěžový test HTTP/JSON služby (task_manager_mysql/http_api.py) na localhost. Zadaný
+počet klientů posílá požadavky, každý po svém keep-alive spojení, po dobu --doba sekund
+pro každou operaci a úroveň souběžnosti. Vypisuje se propustnost (požadavky/s), latence
+p50/p90/p99 a počet chybových odpovědí (stavový kód mimo 2xx).
+
+    • najit         – GET /ukoly/{id} náhodného úkolu
+    • pridat        – POST /ukoly
+    • aktualizovat  – PATCH /ukoly/{id} se střídáním stavů
+    • vypis         – GET /ukoly?stav=hotovo (celý výpis jako chunked JSON, řádky/s)
+    • mix           – 70 % najit, 15 % aktualizovat, 10 % pridat, 5 % vypis
+
+Bez --adresa se server spustí ve vlákně tohoto procesu nad testovací databází (MySQL
+z .env, jinak vestavěná SQLite jako v bench_db.py), tabulka 'ukoly' se předem naplní
+--velikost řádky. Klienti a server pak sdílejí jeden proces (GIL) – přesnější čísla dá
+server spuštěný zvlášť (python -m task_manager_mysql.task_manager_mysql_p2 server --test-db)
+s přepínačem --adresa 127.0.0.1:8080 – tabulka se pak nenaplňuje a měří se nad stávajícími
+úkoly (id 1 až --velikost).
+
+POZOR: bez --adresa skript vyprázdní tabulku 'ukoly' v testovací databázi.
+
+Spuštění (po pip install -e .):
+    python benchmarks/bench_http.py
+    python benchmarks/bench_http.py --klientu 1 16 64 --doba 10 --vlaken 8
+    python benchmarks/bench_http.py --adresa 127.0.0.1:8080 --operace najit mix
+==============================================================================================
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+
+from bench_db import _bez_vystupu, _percentil, naplnit, zvolit_backend
+from task_manager_mysql.async_db import AsyncDB
+from task_manager_mysql.http_api import spustit_server
+
+OPERACE = ("najit", "pridat", "aktualizovat", "vypis", "mix")
+MIX = (("najit", 70), ("aktualizovat", 15), ("pridat", 10), ("vypis", 5))
+
+
+# 1) Server ve vlákně tohoto procesu – vlastní event loop; vrací (adresa, funkce pro zastavení)
+def spustit_v_vlakne(backend, vlaken):
+    parametry = getattr(backend, "parametry", None) or {"backend": "sqlite", "database": backend.cesta}
+    pripraveno = threading.Event()
+    stav = {}
+
+    async def beh():
+        db = AsyncDB(parametry=parametry, max_vlaken=vlaken, max_soubezne=vlaken * 64)
+        server = await spustit_server(db, "127.0.0.1", 0)
+        stav["adresa"] = server.sockets[0].getsockname()[:2]
+        stav["loop"] = asyncio.get_running_loop()
+        stav["konec"] = asyncio.Event()
+        pripraveno.set()
+        async with server:
+            await stav["konec"].wait()
+        db.zavrit()
+
+    vlakno = threading.Thread(target=asyncio.run, args=(beh(),), daemon=True)
+    vlakno.start()
+    pripraveno.wait()
+
+    def zastavit():
+        stav["loop"].call_soon_threadsafe(stav["konec"].set)
+        vlakno.join()
+
+    return stav["adresa"], zastavit
+
+
+# 2) Klient – HTTP/1.1 požadavek po keep-alive spojení; vrací (stavový kód, počet řádků výpisu / 1)
+async def pozadavek(reader, writer, metoda, cesta, data=None):
+    telo = b"" if data is None else json.dumps(data, ensure_ascii=False).encode()
+    writer.write(f"{metoda} {cesta} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(telo)}\r\n\r\n".encode() + telo)
+    hlavicka = await reader.readuntil(b"\r\n\r\n")
+    radky = hlavicka.decode("latin-1").lower().split("\r\n")
+    stav = int(radky[0].split(" ")[1])
+    if "transfer-encoding: chunked" in radky:
+        odpoved = bytearray()
+        while (delka := int(await reader.readline(), 16)) > 0:
+            odpoved += (await reader.readexactly(delka + 2))[:-2]
+        await reader.readline()
+        return stav, len(json.loads(odpoved))
+    delka = next((int(radek.split(":")[1]) for radek in radky if radek.startswith("content-length:")), 0)
+    await reader.readexactly(delka)
+    return stav, 1
+
+def _pozadavek_operace(operace, rng, kontext):
+    if operace == "mix":
+        operace = rng.choices([nazev for nazev, _ in MIX], [vaha for _, vaha in MIX])[0]
+    if operace == "najit":
+        return "GET", f"/ukoly/{rng.randint(kontext['min_id'], kontext['max_id'])}", None
+    if operace == "pridat":
+        return "POST", "/ukoly", {"nazev": f"http úkol {rng.randrange(10**6)}",
+                                  "popis": "popis úkolu ze zátěžového testu"}
+    if operace == "aktualizovat":
+        id_ukolu = rng.randint(kontext["min_id"], kontext["max_id"])
+        return "PATCH", f"/ukoly/{id_ukolu}", {"stav": rng.choice(("probíhá", "hotovo"))}
+    return "GET", "/ukoly?stav=hotovo", None
+
+
+# 3) Měření jedné operace – klientu souběžných klientů po dobu doba sekund
+async def zmerit(adresa, operace, klientu, doba, kontext, seed):
+    latence, chyby, radky = [], [0], [0]
+    konec = time.perf_counter() + doba
+
+    async def klient(index):
+        rng = random.Random(seed + index)
+        reader, writer = await asyncio.open_connection(*adresa)
+        try:
+            while time.perf_counter() < konec:
+                metoda, cesta, data = _pozadavek_operace(operace, rng, kontext)
+                zacatek = time.perf_counter()
+                stav, pocet = await pozadavek(reader, writer, metoda, cesta, data)
+                latence.append(time.perf_counter() - zacatek)
+                radky[0] += pocet
+                if not 200 <= stav < 300:
+                    chyby[0] += 1
+        finally:
+            writer.close()
+
+    zacatek = time.perf_counter()
+    await asyncio.gather(*(klient(index) for index in range(klientu)))
+    trvani = time.perf_counter() - zacatek
+    latence.sort()
+    return {
+        "operace": operace,
+        "klientu": klientu,
+        "pozadavku": len(latence),
+        "req_s": round(len(latence) / trvani, 1),
+        "radky_s": round(radky[0] / trvani, 1),
+        "p50_ms": round(_percentil(latence, 50) * 1000, 2),
+        "p90_ms": round(_percentil(latence, 90) * 1000, 2),
+        "p99_ms": round(_percentil(latence, 99) * 1000, 2),
+        "chyby": chyby[0],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Zátěžový test HTTP API Task Manageru (localhost).")
+    parser.add_argument("--adresa",
+                        help="HOST:PORT běžícího serveru (výchozí: server ve vlákně nad testovací databází)")
+    parser.add_argument("--velikost", type=int, default=10_000, help="počet řádků tabulky 'ukoly' pro server ve vlákně")
+    parser.add_argument("--klientu", type=int, nargs="+", default=[1, 16, 64],
+                        help="počty souběžných klientů (spojení)")
+    parser.add_argument("--operace", nargs="+", choices=OPERACE, default=list(OPERACE), help="měřené operace")
+    parser.add_argument("--doba", type=float, default=5.0, help="doba jednoho měření (s)")
+    parser.add_argument("--vlaken", type=int, default=4, help="počet připojení k DB serveru ve vlákně")
+    parser.add_argument("--seed", type=int, default=42, help="seed generátoru náhodných ID (reprodukovatelnost)")
+    parser.add_argument("--embedded", action="store_true",
+                        help="server ve vlákně nad vestavěnou náhradou (SQLite) i při dostupném MySQL")
+    parser.add_argument("--vystup", help="soubor pro výsledky (JSON)")
+    args = parser.parse_args(argv)
+
+    zastavit = None
+    if args.adresa:
+        host, _, port = args.adresa.rpartition(":")
+        adresa = (host, int(port))
+        kontext = {"min_id": 1, "max_id": args.velikost}
+    else:
+        backend = zvolit_backend(args.embedded)
+        print(f"Backend: {backend.nazev}, naplnění tabulky {args.velikost} řádky...")
+        min_id, max_id = naplnit(backend, args.velikost)
+        kontext = {"min_id": min_id, "max_id": max_id}
+        adresa, zastavit = spustit_v_vlakne(backend, args.vlaken)
+
+    vysledky = []
+    try:
+        for operace in args.operace:
+            for klientu in args.klientu:
+                with _bez_vystupu():                # hlášky DB funkcí serveru ve vlákně (jeden proces)
+                    mereni = asyncio.run(zmerit(adresa, operace, klientu, args.doba, kontext, args.seed))
+                vysledky.append(mereni)
+                print(f"{operace:<13} klientu={klientu:<4} {mereni['req_s']:>9.1f} req/s  "
+                      f"{mereni['radky_s']:>10.1f} řádků/s  p50={mereni['p50_ms']:.2f} ms  "
+                      f"p90={mereni['p90_ms']:.2f} ms  p99={mereni['p99_ms']:.2f} ms  chyby={mereni['chyby']}")
+    finally:
+        if zastavit:
+            zastavit()
+
+    if args.vystup:
+        with open(args.vystup, "w", encoding="utf-8") as soubor:
+            json.dump({"adresa": f"{adresa[0]}:{adresa[1]}", "mereni": vysledky}, soubor, ensure_ascii=False, indent=2)
+    return 1 if any(mereni["chyby"] for mereni in vysledky) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: benchmark připravených SQL příkazů
+-------------------------------------------------------------------------------------------
+Popis:
+Porovnání doby jednoho volání nejčastějších DB funkcí (pridat_ukol_db, najit_ukol_db,
+aktualizovat_ukol_db, odstranit_ukol_db) s připravenými příkazy (binární protokol, viz
+pripravene.py) a s textovým protokolem (každé volání posílá text SQL příkazu k parsování).
+
+Obě varianty se měří střídavě na stejné tabulce se stejným seedem; vypisuje se latence
+p50/p99 a úspora na jedno volání. Měření používá stejné funkce jako bench_db.py.
+
+Proti vestavěné náhradě (SQLite, --embedded nebo nedostupné MySQL) se připravené příkazy
+neuplatní a rozdíl je jen šum – smysluplné je měření proti MySQL.
+
+Spuštění (po pip install -e .):
+    python benchmarks/bench_pripravene.py
+    python benchmarks/bench_pripravene.py --velikost 100000 --opakovani 2000 --kola 5
+==============================================================================================
+"""
+
+import argparse
+import sys
+import threading
+from collections import deque
+
+from bench_db import (
+    _vlozene_behem_mereni,
+    naplnit,
+    op_aktualizovat,
+    op_najit,
+    op_odstranit,
+    op_pridat,
+    zmerit,
+    zvolit_backend,
+)
+from task_manager_mysql.cache import cache_vypisu
+from task_manager_mysql.pripravene import nastavit_pripravene
+
+OPERACE = [
+    ("pridat_ukol_db", op_pridat),
+    ("najit_ukol_db", op_najit),
+    ("aktualizovat_ukol_db", op_aktualizovat),
+    ("odstranit_ukol_db", op_odstranit),
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Připravené SQL příkazy vs. textový protokol (testovací databáze).")
+    parser.add_argument("--velikost", type=int, default=100_000, help="velikost tabulky 'ukoly' (počet řádků)")
+    parser.add_argument("--opakovani", type=int, default=1000, help="počet volání v jednom kole měření")
+    parser.add_argument("--kola", type=int, default=3, help="počet střídavých kol obou variant (bere se medián p50)")
+    parser.add_argument("--seed", type=int, default=42, help="seed generátoru náhodných ID (reprodukovatelnost)")
+    parser.add_argument("--embedded", action="store_true", help="měřit proti vestavěné náhradě (SQLite)")
+    args = parser.parse_args(argv)
+
+    backend = zvolit_backend(args.embedded)
+    cache_vypisu.nastavit(ttl=0)
+    print(f"Naplňování tabulky 'ukoly' na {args.velikost} řádků ({backend.nazev})...")
+    min_id, max_id = naplnit(backend, args.velikost)
+    kontext = {"min_id": min_id, "max_id": max_id, "ke_smazani": deque(), "zamek": threading.Lock()}
+
+    print(f"\n{'operace':<22} {'text p50':>10} {'připr. p50':>11} {'úspora/volání':>14}   p99 text / připr.")
+    try:
+        for nazev, operace in OPERACE:
+            p50 = {True: [], False: []}
+            p99 = {True: [], False: []}
+            for kolo in range(args.kola):
+                for pripravene in (False, True):
+                    nastavit_pripravene(pripravene)
+                    if nazev == "odstranit_ukol_db":
+                        kontext["ke_smazani"] = deque(_vlozene_behem_mereni(backend, max_id))
+                    mereni = zmerit(backend, operace, kontext, 1, args.opakovani, 60.0, args.seed + kolo)
+                    p50[pripravene].append(mereni["p50_ms"])
+                    p99[pripravene].append(mereni["p99_ms"])
+            text, pripr = _median(p50[False]), _median(p50[True])
+            uspora = text - pripr
+            print(f"{nazev:<22} {text:>8.3f}ms {pripr:>9.3f}ms {uspora * 1000:>10.1f} µs ({uspora / text:>4.0%})"
+                  f"   {_median(p99[False]):.3f} / {_median(p99[True]):.3f} ms")
+    finally:
+        nastavit_pripravene(True)
+    return 0
+
+
+def _median(hodnoty):
+    serazene = sorted(hodnoty)
+    return serazene[len(serazene) // 2] if serazene else 0.0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
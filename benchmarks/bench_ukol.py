@@ -0,0 +1,100 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: benchmark záznamu Ukol proti slovníkům
+-------------------------------------------------------------------------------------------
+Popis:
+Porovnání načítání výpisu úkolů jako slovníků (cursor(dictionary=True)) a jako záznamů
+Ukol (běžný kurzor + Ukol._make, viz ukol.py):
+
+    • paměť na řádek – měřeno tracemalloc při sestavení velikost řádků z týchž n-tic
+      (bez vlivu databáze a ovladače)
+    • řádky/s – načtení celé tabulky 'ukoly' z testovací databáze (medián z několika kol)
+
+Backend (MySQL nebo vestavěná náhrada nad SQLite) se volí stejně jako v bench_db.py.
+POZOR: skript vyprázdní tabulku 'ukoly' v testovací databázi.
+
+Spuštění (po pip install -e .):
+    python benchmarks/bench_ukol.py
+    python benchmarks/bench_ukol.py --velikost 500000 --kola 5 --embedded
+==============================================================================================
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import date
+
+from bench_db import naplnit, zvolit_backend
+from task_manager_mysql.ukol import SLOUPCE_UKOLU, SQL_SLOUPCE, Ukol
+
+SQL_VSECHNY = f"SELECT {SQL_SLOUPCE} FROM ukoly"
+
+
+# 1) Paměť na řádek – sestavení seznamu slovníků / záznamů Ukol z připravených n-tic
+def pamet_na_radek(velikost):
+    radky = [(i, f"úkol {i}", f"popis benchmarkového úkolu číslo {i}", "nezahájeno", date(2025, 1, 1))
+             for i in range(velikost)]
+    vysledky = {}
+    for nazev, prevod in (("dict", lambda: [dict(zip(SLOUPCE_UKOLU, radek)) for radek in radky]),
+                          ("Ukol", lambda: list(map(Ukol._make, radky)))):
+        tracemalloc.start()
+        zaznamy = prevod()
+        pamet, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        vysledky[nazev] = pamet / velikost
+        del zaznamy
+    return vysledky
+
+
+# 2) Řádky/s – načtení celé tabulky slovníkovým kurzorem / běžným kurzorem s převodem na Ukol
+def nacist_slovniky(conn):
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute(SQL_VSECHNY)
+    ukoly = cursor.fetchall()
+    cursor.close()
+    return ukoly
+
+def nacist_zaznamy(conn):
+    cursor = conn.cursor()
+    cursor.execute(SQL_VSECHNY)
+    ukoly = list(map(Ukol._make, cursor.fetchall()))
+    cursor.close()
+    return ukoly
+
+def radky_za_sekundu(backend, nacist, kola):
+    conn = backend.pripojit()
+    try:
+        vykony = []
+        for _ in range(kola):
+            zacatek = time.perf_counter()
+            pocet = len(nacist(conn))
+            vykony.append(pocet / max(time.perf_counter() - zacatek, 1e-9))
+        return sorted(vykony)[len(vykony) // 2]
+    finally:
+        conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Záznam Ukol vs. slovníky – paměť na řádek a řádky/s.")
+    parser.add_argument("--velikost", type=int, default=200_000, help="počet řádků (tabulka 'ukoly' i měření paměti)")
+    parser.add_argument("--kola", type=int, default=3, help="počet kol měření načtení (bere se medián)")
+    parser.add_argument("--embedded", action="store_true", help="měřit proti vestavěné náhradě (SQLite)")
+    args = parser.parse_args(argv)
+
+    pamet = pamet_na_radek(args.velikost)
+    print(f"Paměť na řádek ({args.velikost} řádků): dict {pamet['dict']:.0f} B, Ukol {pamet['Ukol']:.0f} B "
+          f"({1 - pamet['Ukol'] / pamet['dict']:.0%} úspora)")
+
+    backend = zvolit_backend(args.embedded)
+    print(f"Naplňování tabulky 'ukoly' na {args.velikost} řádků ({backend.nazev})...")
+    naplnit(backend, args.velikost)
+    slovniky = radky_za_sekundu(backend, nacist_slovniky, args.kola)
+    zaznamy = radky_za_sekundu(backend, nacist_zaznamy, args.kola)
+    print(f"Načtení celé tabulky: dict {slovniky:,.0f} řádků/s, Ukol {zaznamy:,.0f} řádků/s "
+          f"({zaznamy / slovniky - 1:+.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,10 @@ Balíček task_manager_mysql
 Součást projektu Task Manager – Python + MySQL.
 
 Obsahuje zdrojové funkce aplikace pro správu úkolů (CRUD operace)
-a jejich připojení k MySQL databázi.
+a jejich připojení k MySQL databázi (jednotlivé připojení, odolné připojení nebo pool připojení).
+Místo MySQL serveru lze použít vestavěnou databázi SQLite (DB_BACKEND=sqlite v .env).
+Ovladač mysql.connector, soubor .env, asyncio API, zápis na pozadí, import/export CSV / JSONL,
+vestavěná databáze a HTTP API se načítají až při prvním použití.
 """
 
 from .task_manager_mysql_p2 import (
@@ -12,12 +15,80 @@ from .task_manager_mysql_p2 import (
     vytvoreni_tabulky,
     pridat_ukol,
     pridat_ukol_db,
+    pridat_ukoly_db,
     zobrazit_ukoly,
     zobrazit_vsechny_ukoly,
+    stranky_ukolu,
+    prochazet_ukoly,
+    zobrazit_ukoly_strankovane,
+    existuji_ukoly,
+    najit_ukol_db,
     aktualizovat_ukol,
     aktualizovat_ukol_db,
+    aktualizovat_ukoly_db,
     odstranit_ukol,
     odstranit_ukol_db,
+    odstranit_ukoly_db,
     hlavni_menu,
     main
 )
+from .ukol import Ukol
+from .cache import CacheVypisu, cache_vypisu
+from .metriky import (
+    zapnout_metriky,
+    vypnout_metriky,
+    pridat_hook,
+    odebrat_hook,
+    statistiky,
+    pomale_dotazy,
+    prometheus_text,
+    vynulovat_metriky
+)
+from .migrace import MIGRACE, aplikovat_migrace
+from .pool import PoolDB, ziskat_pool
+from .odolne import OdolnePripojeni, RozpocetOpakovani
+from .pripravene import nastavit_pripravene
+from .archiv import archivovat_ukoly, najit_v_archivu
+from .hledani import hledat_ukoly, hledat_ukol
+from .vypis import nastavit_vypis, vypsat_ukoly, strankovat
+from .transakce import vnejsi_transakce
+from .zmeny import zmeny_od, vycistit_smazane
+from .souhrn import (
+    pocty_podle_stavu,
+    pocty_podle_dnu,
+    zobrazit_souhrn,
+    zkontrolovat_citace,
+    nastavit_citace
+)
+
+# asyncio API (async_db.py), zápis na pozadí (zapis_na_pozadi.py), import/export (prenos.py, paralelni_import.py),
+# vestavěná databáze (embedded_db.py) a HTTP API (http_api.py) se importují až při prvním použití některého z jejich
+# názvů – import asyncio, concurrent.futures a sqlite3 by jinak zpomaloval každé spuštění programu
+_ODLOZENE_NAZVY = {
+    "AsyncDB": "async_db",
+    "pridat_ukol_db_async": "async_db",
+    "pridat_ukoly_db_async": "async_db",
+    "zobrazit_ukoly_async": "async_db",
+    "zobrazit_vsechny_ukoly_async": "async_db",
+    "zobrazit_ukoly_strankovane_async": "async_db",
+    "stranky_ukolu_async": "async_db",
+    "existuji_ukoly_async": "async_db",
+    "najit_ukol_db_async": "async_db",
+    "aktualizovat_ukol_db_async": "async_db",
+    "aktualizovat_ukoly_db_async": "async_db",
+    "odstranit_ukol_db_async": "async_db",
+    "odstranit_ukoly_db_async": "async_db",
+    "ZapisNaPozadi": "zapis_na_pozadi",
+    "importovat_ukoly": "prenos",
+    "exportovat_ukoly": "prenos",
+    "importovat_paralelne": "paralelni_import",
+    "EmbeddedPripojeni": "embedded_db",
+    "HttpApi": "http_api",
+    "spustit_server": "http_api",
+}
+
+def __getattr__(nazev):
+    if nazev in _ODLOZENE_NAZVY:
+        import importlib
+        return getattr(importlib.import_module(f".{_ODLOZENE_NAZVY[nazev]}", __name__), nazev)
+    raise AttributeError(f"module {__name__!r} has no attribute {nazev!r}")
@@ -0,0 +1,119 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: archivace dokončených úkolů
+-------------------------------------------------------------------------------------------
+Popis:
+Dokončené úkoly (stav 'hotovo') starší než zadaný počet dní se přesouvají z tabulky
+'ukoly' do tabulky 'ukoly_archiv' (migrace 7), aby tabulka 'ukoly', se kterou pracují
+výpisy i změny úkolů, nerostla s každým dokončeným úkolem.
+
+    • přesun probíhá po malých dávkách (batch_size úkolů), každá dávka je jedna krátká
+      transakce: zamknutí vybraných řádků, INSERT ... SELECT do archivu, DELETE, commit
+    • mezi dávkami se čeká pauza sekund, aby archivace nezatěžovala server souběžně
+      s provozem aplikace; max_davek omezuje počet dávek jednoho spuštění
+    • archivace je navazovatelná – archivované úkoly v tabulce 'ukoly' už nejsou, takže
+      další spuštění (i po přerušení) pokračuje se zbývajícími úkoly
+    • stáří úkolu se počítá od jeho poslední změny (sloupec upraveno, migrace 9) – úkol
+      dokončený včera se nearchivuje, i když byl vytvořen dávno; výchozí počet dní
+      je v .env ARCHIVE_AFTER_DAYS (30)
+    • archiv má vlastní klíč archiv_id (migrace 11) – id úkolu, které MySQL 5.7 po restartu
+      přidělí znovu (AUTO_INCREMENT = max(id) + 1), se dá archivovat opakovaně
+
+Archivované úkoly lze načíst podle id: najit_ukol_db(id_ukolu, conn, archiv=True)
+nebo najit_v_archivu(id_ukolu, conn) – při opakovaném id se vrátí naposledy archivovaný úkol.
+Spuštění z příkazové řádky: podpříkaz archivovat.
+==============================================================================================
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from .cache import cache_vypisu
+from .dialekt import dialekt
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .souhrn import zmenit_citace
+from .transakce import _odvolat, _potvrdit
+from .ukol import SQL_SLOUPCE, Ukol
+from .zmeny import zaznamenat_smazani
+
+SQL_NAJIT_V_ARCHIVU = f"SELECT {SQL_SLOUPCE} FROM ukoly_archiv WHERE id = %s ORDER BY archiv_id DESC LIMIT 1"
+
+
+# 1) Archivace
+# funkce přesouvá úkoly 'hotovo' bez změny (upraveno) déle než starsi_nez_dnu dní do tabulky 'ukoly_archiv';
+# vrací dvojici (počet archivovaných úkolů, id posledního archivovaného úkolu) nebo False při SQL chybě
+# (dávky potvrzené před chybou zůstávají archivované, další spuštění pokračuje zbývajícími úkoly)
+def archivovat_ukoly(conn, starsi_nez_dnu=None, batch_size=500, pauza=0.1, max_davek=None):
+    if starsi_nez_dnu is None:
+        starsi_nez_dnu = int(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+    if batch_size < 1 or starsi_nez_dnu < 0:
+        raise ValueError("Parametr batch_size musí být alespoň 1 a starsi_nez_dnu nesmí být záporný.")
+    hranice = datetime.now().replace(microsecond=0) - timedelta(days=starsi_nez_dnu)
+
+    archivovano, posledni_id, davek = 0, 0, 0
+    try:
+        while max_davek is None or davek < max_davek:
+            if davek and pauza:
+                time.sleep(pauza)       # omezení zátěže serveru mezi dávkami
+            ids = _archivovat_davku(conn, hranice, posledni_id, batch_size)
+            davek += 1
+            if ids:
+                archivovano += len(ids)
+                posledni_id = ids[-1]
+            if len(ids) < batch_size:   # neúplná dávka = žádné další úkoly k archivaci
+                break
+
+        print(f"Archivováno úkolů: {archivovano} (dokončené úkoly bez změny od {hranice.isoformat(' ')}).")
+        return archivovano, posledni_id
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při archivaci úkolů (archivováno {archivovano} úkolů): {err}")
+        return False
+
+# přesun jedné dávky v jedné transakci; úkoly se vybírají přes index (stav, id) od posledního archivovaného id,
+# vybrané řádky se zamknou (FOR UPDATE) jen do commitu dávky; vrací seznam archivovaných id
+def _archivovat_davku(conn, hranice, posledni_id, batch_size):
+    with spojeni(conn) as conn:
+        cursor = kurzor(conn)
+        try:
+            sql = "SELECT id FROM ukoly WHERE stav = 'hotovo' AND id > %s AND upraveno < %s ORDER BY id LIMIT %s"
+            cursor.execute(dialekt(conn).pro_zapis(conn, sql), (posledni_id, hranice, batch_size))
+            ids = [radek[0] for radek in cursor.fetchall()]
+            if not ids:
+                _odvolat(conn)
+                return ids
+
+            zastupne = ", ".join(["%s"] * len(ids))
+            cursor.execute(
+                f"INSERT INTO ukoly_archiv ({SQL_SLOUPCE}, archivovano) "
+                f"SELECT {SQL_SLOUPCE}, NOW() FROM ukoly WHERE id IN ({zastupne})", tuple(ids))
+            cursor.execute(f"DELETE FROM ukoly WHERE id IN ({zastupne})", tuple(ids))
+            zmenit_citace(conn, {"hotovo": -len(ids)})      # čítače souhrnu počítají jen tabulku 'ukoly'
+            zaznamenat_smazani(conn, ids)                   # pro přehled změn (zmeny.py) úkol z 'ukoly' zmizel
+            _potvrdit(conn)
+        except mysql.connector.Error:
+            _odvolat(conn)
+            raise
+        finally:
+            cursor.close()
+        cache_vypisu.zneplatnit(conn, ids=ids, stavy=("hotovo",))
+    return ids
+
+
+# 2) Načtení archivovaného úkolu podle id
+# funkce vrací záznam Ukol, None (úkol v archivu není) nebo False při SQL chybě
+def najit_v_archivu(id_ukolu, conn):
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            cursor.execute(SQL_NAJIT_V_ARCHIVU, (id_ukolu,))
+            radek = cursor.fetchone()
+            cursor.close()
+        return Ukol._make(radek) if radek else None
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolu z archivu: {err}")
+        return False
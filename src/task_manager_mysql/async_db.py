@@ -0,0 +1,205 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: asyncio API pro DB funkce
+-------------------------------------------------------------------------------------------
+Popis:
+Asynchronní varianty DB funkcí pro použití v asyncio službách (např. webový server),
+aby dotaz do databáze neblokoval event loop.
+
+DB funkce běží v omezeném počtu pracovních vláken (ThreadPoolExecutor); každé vlákno má
+své vlastní připojení k DB, které se vytvoří při prvním použití a drží se po celou dobu
+života objektu AsyncDB. Async funkce volají stejné synchronní DB funkce, takže vracejí
+stejné hodnoty (True / False / list / []) a stejně pracují i s cache výpisů – volající
+tak mohou přecházet na async variantu postupně.
+
+    • max_vlaken    – počet pracovních vláken = počet připojení k DB
+    • max_soubezne  – kolik volání smí najednou čekat ve frontě nebo běžet (dál se čeká v asyncio)
+    • timeout       – výchozí limit (s) pro jedno volání, při překročení asyncio.TimeoutError
+
+Zrušení (cancel) nebo timeout volání, jehož dotaz už v DB běží, ukončí i samotný dotaz
+na serveru (KILL QUERY), aby neblokoval pracovní vlákno; volání, které ještě čeká ve frontě,
+se vůbec nespustí.
+
+Použití:
+    db = AsyncDB(test_db=True)
+    await pridat_ukol_db_async("název", "popis", db)
+    ukoly = await zobrazit_ukoly_async(db)
+    async for stranka in stranky_ukolu_async(db, velikost_stranky=100):
+        ...
+    db.zavrit()
+==============================================================================================
+"""
+
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .ovladac import mysql
+from .pool import parametry_pripojeni, pripojit
+from .task_manager_mysql_p2 import (
+    pridat_ukol_db,
+    pridat_ukoly_db,
+    zobrazit_ukoly,
+    zobrazit_vsechny_ukoly,
+    stranky_ukolu,
+    zobrazit_ukoly_strankovane,
+    existuji_ukoly,
+    najit_ukol_db,
+    aktualizovat_ukol_db,
+    aktualizovat_ukoly_db,
+    odstranit_ukol_db,
+    odstranit_ukoly_db,
+    NEDOKONCENE_STAVY,
+    VELIKOST_STRANKY,
+)
+
+
+class AsyncDB:
+    def __init__(self, test_db=False, max_vlaken=4, max_soubezne=None, timeout=None, parametry=None):
+        self.parametry = dict(parametry) if parametry is not None else parametry_pripojeni(test_db)
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_vlaken, thread_name_prefix="task_manager_db")
+        self._semafor = asyncio.Semaphore(max_soubezne or max_vlaken * 4)
+        self._lokalni = threading.local()       # připojení pracovního vlákna
+        self._spojeni = []                      # všechna otevřená připojení (kvůli zavrit())
+        self._bezici = {}                       # číslo volání -> připojení, na kterém volání právě běží
+        self._cisla = itertools.count()
+        self._zamek = threading.Lock()
+
+    # spuštění synchronní DB funkce v pracovním vlákně; funkce dostane připojení vlákna jako poslední parametr (conn)
+    async def spustit(self, funkce, *parametry, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        cislo = next(self._cisla)
+        async with self._semafor:
+            loop = asyncio.get_running_loop()
+            budouci = loop.run_in_executor(self._executor, self._v_pracovnim_vlakne, cislo, funkce, parametry)
+            try:
+                return await asyncio.wait_for(budouci, timeout)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                self._zrusit_dotaz(cislo)
+                raise
+
+    def _v_pracovnim_vlakne(self, cislo, funkce, parametry):
+        conn = getattr(self._lokalni, "conn", None)
+        if conn is None or not conn.is_connected():
+            try:
+                conn = pripojit(self.parametry)
+            except mysql.connector.Error as err:
+                print(f"Chyba při připojování k databázi '{self.parametry.get('database')}': {err}")
+                return False
+            self._lokalni.conn = conn
+            with self._zamek:
+                self._spojeni.append(conn)
+
+        with self._zamek:
+            self._bezici[cislo] = conn
+        try:
+            return funkce(*parametry, conn)
+        finally:
+            with self._zamek:
+                self._bezici.pop(cislo, None)
+            _ukoncit_transakci(conn)
+
+    # ukončení dotazu zrušeného volání na serveru (KILL QUERY z krátkého pomocného připojení);
+    # provádí se ve vlastním vlákně, aby neblokovalo event loop;
+    # pokud volání ještě neběží nebo už doběhlo, nic se neděje
+    def _zrusit_dotaz(self, cislo):
+        with self._zamek:
+            bezici = self._bezici.get(cislo)
+        if bezici is None:
+            return
+        if hasattr(bezici, "zrusit_dotaz"):         # vestavěná databáze (embedded_db.py) – dotaz se přeruší přímo
+            bezici.zrusit_dotaz()
+            return
+        connection_id = bezici.connection_id
+
+        def zrusit():
+            try:
+                conn = pripojit(self.parametry)
+                try:
+                    cursor = conn.cursor()
+                    cursor.execute(f"KILL QUERY {int(connection_id)}")
+                    cursor.close()
+                finally:
+                    conn.close()
+            except mysql.connector.Error as err:
+                print(f"Chyba při rušení dotazu: {err}")
+
+        threading.Thread(target=zrusit, daemon=True).start()
+
+    # ukončení – počká na doběhnutí rozpracovaných volání a zavře připojení všech pracovních vláken
+    def zavrit(self):
+        self._executor.shutdown(wait=True)
+        with self._zamek:
+            spojeni, self._spojeni = self._spojeni, []
+        for conn in spojeni:
+            try:
+                conn.close()
+            except mysql.connector.Error:
+                pass
+
+
+# ukončení transakce po volání (stejně jako PoolDB.vratit()) – připojení vlákna má vypnutý autocommit a čtecí DB funkce
+# nepotvrzují, takže by snímek dat z prvního čtení (InnoDB REPEATABLE READ) zůstal otevřený po celý život vlákna
+# a vlákno by nevidělo změny potvrzené jinými vlákny nebo procesy; chyba ztraceného připojení se zde nehlásí
+def _ukoncit_transakci(conn):
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except mysql.connector.Error:
+        pass
+
+
+# Async varianty DB funkcí – stejné parametry a návratové hodnoty jako synchronní varianty,
+# místo conn dostávají objekt AsyncDB; nepovinný parametr timeout (s) přepisuje výchozí timeout AsyncDB
+async def pridat_ukol_db_async(nazev, popis, db, timeout=None):
+    return await db.spustit(pridat_ukol_db, nazev, popis, timeout=timeout)
+
+async def pridat_ukoly_db_async(ukoly, db, batch_size=1000, timeout=None):
+    return await db.spustit(lambda conn: pridat_ukoly_db(ukoly, conn, batch_size), timeout=timeout)
+
+async def zobrazit_ukoly_async(db, timeout=None):
+    return await db.spustit(zobrazit_ukoly, timeout=timeout)
+
+async def zobrazit_vsechny_ukoly_async(db, timeout=None):
+    return await db.spustit(zobrazit_vsechny_ukoly, timeout=timeout)
+
+async def aktualizovat_ukol_db_async(id_ukolu, novy_stav, db, timeout=None):
+    return await db.spustit(aktualizovat_ukol_db, id_ukolu, novy_stav, timeout=timeout)
+
+async def odstranit_ukol_db_async(id_ukolu, db, timeout=None):
+    return await db.spustit(odstranit_ukol_db, id_ukolu, timeout=timeout)
+
+async def aktualizovat_ukoly_db_async(ids, novy_stav, db, stav=None, starsi_nez=None, batch_size=1000, timeout=None):
+    return await db.spustit(lambda conn: aktualizovat_ukoly_db(ids, novy_stav, conn, stav, starsi_nez, batch_size),
+                            timeout=timeout)
+
+async def odstranit_ukoly_db_async(ids, db, stav=None, starsi_nez=None, batch_size=1000, timeout=None):
+    return await db.spustit(lambda conn: odstranit_ukoly_db(ids, conn, stav, starsi_nez, batch_size), timeout=timeout)
+
+async def najit_ukol_db_async(id_ukolu, db, archiv=False, timeout=None):
+    return await db.spustit(lambda conn: najit_ukol_db(id_ukolu, conn, archiv), timeout=timeout)
+
+async def existuji_ukoly_async(db, timeout=None):
+    return await db.spustit(existuji_ukoly, timeout=timeout)
+
+# UI funkce – čeká na volbu uživatele (input()) a po celou dobu výpisu drží jedno pracovní vlákno
+async def zobrazit_ukoly_strankovane_async(db, stavy=NEDOKONCENE_STAVY, velikost_stranky=None, timeout=None):
+    return await db.spustit(lambda conn: zobrazit_ukoly_strankovane(conn, stavy, velikost_stranky), timeout=timeout)
+
+# async generátor stránek – každá stránka je samostatné volání v pracovním vlákně
+# (keyset podle id jako stranky_ukolu()), vlákno se mezi stránkami neblokuje; timeout platí pro načtení jedné stránky;
+# generátor nemůže vrátit False – při SQL chybě nebo nedostupné DB vyvolá výjimku mysql.connector.Error
+async def stranky_ukolu_async(db, stavy=None, velikost_stranky=VELIKOST_STRANKY, od_id=0, timeout=None):
+    while True:
+        stranka = await db.spustit(lambda conn: next(stranky_ukolu(conn, stavy, velikost_stranky, od_id), []),
+                                   timeout=timeout)
+        if stranka is False:
+            raise mysql.connector.Error(f"Nelze se připojit k databázi '{db.parametry.get('database')}'.")
+        if not stranka:
+            return
+        yield stranka
+        if len(stranka) < velikost_stranky:
+            return
+        od_id = stranka[-1].id
@@ -0,0 +1,138 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: cache výpisů úkolů
+-------------------------------------------------------------------------------------------
+Popis:
+Read-through cache v paměti procesu pro výpisy zobrazit_ukoly() a zobrazit_vsechny_ukoly()
+a pro stránky výpisu zobrazit_ukoly_strankovane() (volba 2 menu a výpis před volbami 3 a 4).
+Opakovaný výpis bez mezitímní změny dat se vrátí z cache bez dotazu do databáze.
+
+    • omezená velikost – nejdéle nepoužitý výpis se vyřadí (LRU)
+    • TTL – výpis starší než ttl sekund se načte z DB znovu (omezuje zastarání dat při
+      zápisech z jiných procesů, o kterých cache neví)
+    • zneplatnění – DB funkce pro zápis (přidání, změna stavu, výmaz) po úspěšném commitu
+      zneplatní jen ty výpisy, kterých se změna může týkat:
+          – přidání úkolu: výpisy, jejichž filtr stavů obsahuje stav nového úkolu
+          – změna stavu:   výpisy obsahující daný úkol a výpisy s filtrem na nový stav
+          – výmaz úkolu:   výpisy obsahující daný úkol
+      Stejná pravidla platí pro stránky – stránka keyset stránkování (úkoly s id > od_id)
+      závisí jen na svých řádcích a na úkolech, které do filtru nově přibudou.
+    • čítače zásahů/minutí (statistiky()) pro ověření, že se cache vyplácí
+
+Výpisy jsou v cache odděleny podle databáze (host, port, název db), prod a test db se tedy nemíchají.
+Výpisy načtené uvnitř vnější transakce (transakce.py) se do cache neukládají – mohou obsahovat
+nepotvrzené změny, které ostatní připojení nevidí.
+Nastavení z .env (nepovinné): CACHE_MAX_SIZE (výchozí 128), CACHE_TTL (výchozí 5 s, 0 = cache vypnuta).
+==============================================================================================
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from .pool import PoolDB
+from .transakce import ve_vnejsi_transakci
+
+
+class CacheVypisu:
+    def __init__(self, max_polozek=128, ttl=5.0):
+        self.max_polozek = max_polozek
+        self.ttl = ttl
+        self._polozky = OrderedDict()   # (identita db, stavy, stránka) -> (čas načtení, úkoly, množina id)
+        self._generace = {}             # identita db -> počet zneplatnění (ochrana proti uložení zastaralého výpisu)
+        self._epocha = 0                # počet vyprázdnění celé cache
+        self._zamek = threading.Lock()
+        self.zasahy = 0
+        self.minuti = 0
+        self.vyrazeno = 0
+        self.zneplatneno = 0
+
+    def nastavit(self, max_polozek=None, ttl=None):
+        with self._zamek:
+            if max_polozek is not None:
+                self.max_polozek = max_polozek
+            if ttl is not None:
+                self.ttl = ttl
+            self._polozky.clear()
+            self._epocha += 1
+
+    # načtení výpisu přes cache;
+    # stavy = n-tice stavů filtru výpisu (None = všechny úkoly), nacist = funkce bez parametrů, která výpis načte z DB;
+    # stranka = (od_id, velikost stránky) u jedné stránky výpisu po stránkách, None = celý výpis;
+    # vrací kopii seznamu úkolů (volající může seznam měnit, aniž by tím poškodil cache;
+    # záznamy Ukol jsou neměnné a sdílejí se)
+    def ziskat(self, conn, stavy, nacist, stranka=None):
+        if self.ttl <= 0 or self.max_polozek < 1 or ve_vnejsi_transakci(conn):
+            return nacist()
+
+        identita = identita_db(conn)
+        klic = (identita, stavy, stranka)
+        with self._zamek:
+            polozka = self._polozky.get(klic)
+            if polozka is not None and time.monotonic() - polozka[0] < self.ttl:
+                self._polozky.move_to_end(klic)
+                self.zasahy += 1
+                return list(polozka[1])
+            self.minuti += 1
+            generace = (self._epocha, self._generace.get(identita, 0))
+
+        ukoly = nacist()
+
+        with self._zamek:
+            # pokud mezitím proběhl zápis do stejné db, načtený výpis už nemusí platit a do cache se neuloží
+            if (self._epocha, self._generace.get(identita, 0)) == generace:
+                self._polozky[klic] = (time.monotonic(), ukoly, {ukol["id"] for ukol in ukoly})
+                self._polozky.move_to_end(klic)
+                while len(self._polozky) > self.max_polozek:
+                    self._polozky.popitem(last=False)
+                    self.vyrazeno += 1
+        return list(ukoly)
+
+    # zneplatnění výpisů dané db po zápisu;
+    # ids = id úkolů, kterých se zápis týkal, stavy = stavy, ve kterých se úkoly po zápisu nacházejí
+    def zneplatnit(self, conn, ids=(), stavy=()):
+        identita = identita_db(conn)
+        ids = set(ids)
+        with self._zamek:
+            self._generace[identita] = self._generace.get(identita, 0) + 1
+            for klic in list(self._polozky):
+                identita_klice, stavy_filtru, _ = klic
+                if identita_klice != identita:
+                    continue
+                obsahuje_ukol = not ids.isdisjoint(self._polozky[klic][2])
+                if stavy_filtru is None:
+                    odpovida_filtru = bool(stavy)
+                else:
+                    odpovida_filtru = any(stav in stavy_filtru for stav in stavy)
+                if obsahuje_ukol or odpovida_filtru:
+                    del self._polozky[klic]
+                    self.zneplatneno += 1
+
+    # vyprázdnění celé cache (např. po zápisu mimo DB funkce aplikace)
+    def vycistit(self):
+        with self._zamek:
+            self._polozky.clear()
+            self._epocha += 1
+
+    def statistiky(self):
+        with self._zamek:
+            return {
+                "zasahy": self.zasahy,
+                "minuti": self.minuti,
+                "vyrazeno": self.vyrazeno,
+                "zneplatneno": self.zneplatneno,
+                "polozek": len(self._polozky),
+            }
+
+
+# identita databáze, ke které patří připojení nebo pool – (host, port, název db);
+# u připojení se čtou hodnoty z jeho konfigurace (bez dotazu do DB)
+def identita_db(conn):
+    if isinstance(conn, PoolDB):
+        parametry = conn.parametry
+        return (parametry.get("host"), parametry.get("port", 3306), parametry.get("database"))
+    return (getattr(conn, "server_host", None), getattr(conn, "server_port", None), getattr(conn, "_database", None))
+
+
+# sdílená cache výpisů pro celý proces (nastavení z .env provádí task_manager_mysql_p2 po načtení proměnných prostředí)
+cache_vypisu = CacheVypisu()
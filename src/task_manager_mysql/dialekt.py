@@ -0,0 +1,107 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: dialekty SQL backendů (MySQL / vestavěná SQLite)
+-------------------------------------------------------------------------------------------
+Popis:
+Příkazy, které se v MySQL a v SQLite zapisují jinak, sestavuje dialekt backendu – DB funkce
+si ho zjistí z připojení nebo kurzoru funkcí dialekt(conn) a ostatní SQL mají společné
+pro oba backendy. Dialekt MySQL je zde, dialekt SQLite ve vestavěné databázi
+(embedded_db.DialektSQLite – sqlite3 se načte jen při jejím použití).
+
+    • připojení       – pripojit(parametry) otevře připojení backendu, kurzory se vytvářejí
+                        jeho metodou cursor() (rozhraní mysql.connector)
+    • tabulky         – automatické id, výčet povolených hodnot (ENUM), text omezené délky
+    • migrace         – existence indexu a sloupce, přidání indexu a FULLTEXT indexu, sloupec
+                        času poslední změny řádku, náhradní primární klíč, zámek proti
+                        souběžným migracím
+    • zámek řádků     – pro_zapis(conn, sql): SELECT, jehož řádky zůstanou zamčené pro zápis
+                        do konce transakce (MySQL FOR UPDATE)
+    • hledání         – fulltext: zda backend umí MATCH ... AGAINST (viz hledani.py)
+==============================================================================================
+"""
+
+from .ovladac import mysql
+
+
+# 1) Dialekt MySQL
+class DialektMySQL:
+    nazev = "mysql"
+    fulltext = True
+    automaticke_id = "INT AUTO_INCREMENT PRIMARY KEY"
+
+    def pripojit(self, parametry):
+        return mysql.connector.connect(**parametry)
+
+    # a) typy sloupců pro CREATE TABLE
+    def vycet(self, sloupec, hodnoty):
+        return f"ENUM({', '.join(repr(hodnota) for hodnota in hodnoty)})"
+
+    def text(self, sloupec, delka):
+        return f"VARCHAR({delka})"
+
+    # b) kroky migrací (migrace.py) – kontroly existence přes information_schema aktuální databáze
+    def index_existuje(self, cursor, tabulka, nazev_indexu):
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s",
+            (tabulka, nazev_indexu),
+        )
+        return cursor.fetchone()[0] > 0
+
+    def sloupec_existuje(self, cursor, tabulka, sloupec):
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.columns "
+            "WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s",
+            (tabulka, sloupec),
+        )
+        return cursor.fetchone()[0] > 0
+
+    # index se vytváří online (ALGORITHM=INPLACE, LOCK=NONE) – tabulka není po dobu vytváření zamčena pro zápis
+    def pridat_index(self, cursor, tabulka, nazev_indexu, sloupce):
+        cursor.execute(f"ALTER TABLE {tabulka} ADD INDEX {nazev_indexu} ({sloupce}), ALGORITHM=INPLACE, LOCK=NONE")
+
+    # InnoDB vytváří FULLTEXT index bez LOCK=NONE – první FULLTEXT index tabulky ji přestaví (skrytý sloupec
+    # FTS_DOC_ID), proto LOCK=SHARED: čtení běží dál, zápisy počkají
+    def pridat_fulltext(self, cursor, tabulka, nazev_indexu, sloupce):
+        cursor.execute(
+            f"ALTER TABLE {tabulka} ADD FULLTEXT INDEX {nazev_indexu} ({sloupce}), ALGORITHM=INPLACE, LOCK=SHARED")
+
+    # čas vložení nebo poslední změny řádku nastavuje MySQL sám (DEFAULT / ON UPDATE CURRENT_TIMESTAMP);
+    # sloupec se přidává bez ALGORITHM / LOCK – MySQL zvolí nejrychlejší dostupný způsob (INSTANT nebo online INPLACE)
+    def pridat_cas_zmeny(self, cursor, tabulka, sloupec):
+        cursor.execute(f"ALTER TABLE {tabulka} ADD COLUMN {sloupec} DATETIME(6) NOT NULL "
+                       "DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)")
+
+    # náhradní primární klíč (automatické id) místo dosavadního – jeden příkaz ALTER TABLE, dosavadní sloupec klíče
+    # zůstává jako obyčejný sloupec
+    def pridat_nahradni_klic(self, cursor, tabulka, sloupec):
+        cursor.execute(f"ALTER TABLE {tabulka} DROP PRIMARY KEY, ADD COLUMN {sloupec} {self.automaticke_id} FIRST")
+
+    # zámek serveru podle názvu (GET_LOCK) – vrací True, pokud se ho do cekani sekund podařilo získat
+    def ziskat_zamek(self, cursor, nazev, cekani):
+        cursor.execute("SELECT GET_LOCK(%s, %s)", (nazev, cekani))
+        return cursor.fetchone()[0] == 1
+
+    def uvolnit_zamek(self, cursor, nazev):
+        cursor.execute("SELECT RELEASE_LOCK(%s)", (nazev,))
+        cursor.fetchall()
+
+    # c) zámek vybraných řádků do konce transakce – vrací SELECT příkaz doplněný o FOR UPDATE
+    def pro_zapis(self, conn, sql):
+        return f"{sql} FOR UPDATE"
+
+
+MYSQL = DialektMySQL()
+
+
+# 2) Dialekt připojení nebo kurzoru – vestavěná databáze ho nese v atributu dialekt, ostatní připojení jsou MySQL
+# (obaly připojení a kurzorů – OdolnePripojeni, MerenyKurzor, ... – atribut předávají dál)
+def dialekt(conn):
+    return getattr(conn, "dialekt", MYSQL)
+
+# dialekt podle parametrů připojení z parametry_pripojeni() (klíč backend, výchozí MySQL)
+def dialekt_backendu(parametry):
+    if parametry.get("backend") == "sqlite":
+        from .embedded_db import SQLITE         # sqlite3 se načítá jen při použití vestavěné databáze
+        return SQLITE
+    return MYSQL
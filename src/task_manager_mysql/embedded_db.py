@@ -0,0 +1,349 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: vestavěný backend nad SQLite (bez MySQL serveru)
+-------------------------------------------------------------------------------------------
+Popis:
+Připojení k SQLite databázi (soubor nebo :memory:) s rozhraním, které DB funkce aplikace
+očekávají od mysql.connector – DB funkce, pool, migrace i testy tak běží beze změny
+nad MySQL i nad SQLite. Backend se volí v .env: DB_BACKEND=sqlite, cesta k databázi
+DB_SQLITE_PATH (prod) a DB_TEST_SQLITE_PATH (test), viz pool.parametry_pripojeni().
+
+    • příkazy, které se v SQLite zapisují jinak než v MySQL (typy sloupců, indexy a sloupec
+      času změny v migracích, zámek řádků, hledání), sestavuje DialektSQLite (viz dialekt.py);
+      kurzor jen převádí zástupné znaky %s na ? a dodává funkce CURDATE(), NOW() a NOW(6)
+    • pro_zapis() zahájí transakci se zámkem pro zápis (BEGIN IMMEDIATE) místo FOR UPDATE –
+      SQLite zamyká celou databázi, souběžné zápisy se tedy provádějí postupně
+    • sloupec času změny (DEFAULT / ON UPDATE CURRENT_TIMESTAMP v MySQL) udržují triggery
+    • FULLTEXT index SQLite nemá (DialektSQLite.fulltext = False), hledani.py proto hledá
+      podle začátku názvu
+    • hodnoty date / datetime se ukládají jako text ISO 8601 a sloupce DATE / DATETIME se při
+      čtení převádějí zpět – převod provádí kurzor každého připojení podle deklarovaných typů
+      sloupců, globální registr sqlite3 (register_adapter / register_converter) se nemění
+    • chyby SQLite se převádějí na výjimky mysql.connector (zamčená databáze = 1205,
+      neexistující tabulka = 1146, přerušený dotaz = 1317), takže je DB funkce zachytí
+      a vrátí False stejně jako při práci s MySQL
+
+Databáze :memory: je jedna sdílená databáze v paměti procesu (všechna připojení k :memory:
+ji vidí, zaniká s koncem procesu); souběžná připojení se v ní střídají po tabulkách,
+pro souběžnou práci je vhodnější soubor (režim WAL – čtení neblokuje zápis).
+Porovnání a řazení textu se řídí pravidly SQLite (LIKE nerozlišuje velikost písmen
+jen u znaků ASCII).
+==============================================================================================
+"""
+
+import datetime
+import functools
+import itertools
+import sqlite3
+import time
+
+from .ovladac import mysql
+
+PAMET = ":memory:"
+URI_PAMETI = "file:task_manager_pamet?mode=memory&cache=shared"
+TIMEOUT = 30.0              # jak dlouho (s) se čeká na zámek databáze, pak chyba 1205 (jako innodb_lock_wait_timeout)
+
+# převod textu ISO 8601 podle deklarovaného typu sloupce (bez délky, např. DATETIME(6) -> DATETIME)
+PREVODNIKY = {"DATE": datetime.date.fromisoformat, "DATETIME": datetime.datetime.fromisoformat}
+
+_cisla_pripojeni = itertools.count(1)
+_kotva_pameti = None        # připojení, které drží sdílenou databázi :memory: naživu po celý běh procesu
+_verze_schematu = 0         # zvyšuje se po každém CREATE / ALTER / DROP – připojení pak znovu načtou typy sloupců
+
+
+# 1) Dialekt SQLite – stejné metody jako DialektMySQL (dialekt.py), příkazy zapsané pro SQLite
+class DialektSQLite:
+    nazev = "sqlite"
+    fulltext = False
+    automaticke_id = "INTEGER PRIMARY KEY AUTOINCREMENT"
+
+    def pripojit(self, parametry):
+        return EmbeddedPripojeni(parametry["database"])
+
+    # a) typy sloupců – ENUM a délku VARCHAR SQLite nekontroluje, hlídají je CHECK constraints
+    def vycet(self, sloupec, hodnoty):
+        return f"TEXT CHECK ({sloupec} IN ({', '.join(repr(hodnota) for hodnota in hodnoty)}))"
+
+    def text(self, sloupec, delka):
+        return f"VARCHAR({delka}) CHECK (length({sloupec}) <= {delka})"
+
+    # b) kroky migrací – kontroly existence přes sqlite_master a pragma_table_info
+    def index_existuje(self, cursor, tabulka, nazev_indexu):
+        cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s",
+                       (tabulka, nazev_indexu))
+        return cursor.fetchone()[0] > 0
+
+    def sloupec_existuje(self, cursor, tabulka, sloupec):
+        cursor.execute("SELECT COUNT(*) FROM pragma_table_info(%s) WHERE name = %s", (tabulka, sloupec))
+        return cursor.fetchone()[0] > 0
+
+    def pridat_index(self, cursor, tabulka, nazev_indexu, sloupce):
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {nazev_indexu} ON {tabulka} ({sloupce})")
+
+    def pridat_fulltext(self, cursor, tabulka, nazev_indexu, sloupce):
+        pass                    # SQLite FULLTEXT index nemá (hledání bez něj viz fulltext = False)
+
+    # SQLite nepřidá sloupec s proměnnou výchozí hodnotou ani nezná ON UPDATE – čas nastavují triggery po vložení
+    # a po změně řádku, která sloupec sama nenastavila; existující řádky dostanou čas migrace
+    def pridat_cas_zmeny(self, cursor, tabulka, sloupec):
+        nastavit = f"UPDATE {tabulka} SET {sloupec} = NOW(6) WHERE rowid = NEW.rowid"
+        cursor.execute(f"ALTER TABLE {tabulka} ADD COLUMN {sloupec} DATETIME(6)")
+        cursor.execute(f"UPDATE {tabulka} SET {sloupec} = NOW(6)")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS tr_{tabulka}_{sloupec}_vlozeni AFTER INSERT ON {tabulka} "
+                       f"WHEN NEW.{sloupec} IS NULL BEGIN {nastavit}; END")
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS tr_{tabulka}_{sloupec}_zmena AFTER UPDATE ON {tabulka} "
+                       f"WHEN NEW.{sloupec} IS OLD.{sloupec} BEGIN {nastavit}; END")
+
+    # primární klíč ALTER TABLE v SQLite nezmění – tabulka se přestaví podle své definice v sqlite_master
+    # (nová tabulka s klíčem sloupec, kopie řádků, výměna); kopie a výměna proběhnou v transakci, kterou potvrdí
+    # až zápis verze migrace – po pádu se rozpracovaná tabulka zahodí a přestavba se zopakuje;
+    # dosavadní sloupec klíče zůstane NOT NULL jako v MySQL
+    def pridat_nahradni_klic(self, cursor, tabulka, sloupec):
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = %s", (tabulka,))
+        definice = cursor.fetchone()[0]
+        sloupce = definice[definice.index("(") + 1:definice.rindex(")")].replace(" PRIMARY KEY", " NOT NULL", 1)
+        cursor.execute("SELECT name FROM pragma_table_info(%s)", (tabulka,))
+        nazvy = ", ".join(radek[0] for radek in cursor.fetchall())
+        cursor.execute(f"DROP TABLE IF EXISTS {tabulka}_prestavba")
+        cursor.execute(f"CREATE TABLE {tabulka}_prestavba ({sloupec} {self.automaticke_id}, {sloupce})")
+        cursor.execute(f"INSERT INTO {tabulka}_prestavba ({nazvy}) SELECT {nazvy} FROM {tabulka}")
+        cursor.execute(f"DROP TABLE {tabulka}")
+        cursor.execute(f"ALTER TABLE {tabulka}_prestavba RENAME TO {tabulka}")
+
+    # souběh migrací z více procesů řeší zámek databáze SQLite při zápisu, zámek podle názvu se vždy "získá"
+    def ziskat_zamek(self, cursor, nazev, cekani):
+        return True
+
+    def uvolnit_zamek(self, cursor, nazev):
+        pass
+
+    # c) zámek pro zápis – conn = připojení nebo jeho kurzor; FOR UPDATE SQLite nezná, zamyká se celá databáze
+    def pro_zapis(self, conn, sql):
+        conn.zahajit_zapis()
+        return sql
+
+
+SQLITE = DialektSQLite()
+
+
+# 2) Převody mezi Pythonem a SQLite
+# zástupné znaky %s (paramstyle mysql.connector) -> ? a zda jde o změnu schématu;
+# převod každého textu příkazu se provede jen jednou (příkazy aplikace se opakují)
+@functools.lru_cache(maxsize=256)
+def _prikaz(sql):
+    return sql.replace("%s", "?"), sql.lstrip()[:5].upper() in ("CREAT", "ALTER", "DROP ")
+
+# hodnoty date / datetime jako text ISO 8601 pevné délky (řazení textu = řazení času), ostatní hodnoty beze změny
+def _parametry(parametry):
+    parametry = tuple(parametry or ())
+    if not any(isinstance(hodnota, datetime.date) for hodnota in parametry):
+        return parametry
+    return tuple(_text_casu(hodnota) if isinstance(hodnota, datetime.date) else hodnota for hodnota in parametry)
+
+def _text_casu(hodnota):
+    if isinstance(hodnota, datetime.datetime):
+        return hodnota.isoformat(" ", "microseconds")
+    return hodnota.isoformat()
+
+def _preklad_chyby(err):
+    zprava = str(err)
+    if isinstance(err, sqlite3.IntegrityError):
+        return mysql.connector.errors.IntegrityError(msg=zprava)
+    if isinstance(err, sqlite3.ProgrammingError):
+        return mysql.connector.errors.InterfaceError(msg=zprava)
+    if isinstance(err, sqlite3.OperationalError):
+        if "locked" in zprava:
+            return mysql.connector.errors.OperationalError(msg=zprava, errno=1205)
+        if "no such table" in zprava:
+            return mysql.connector.errors.ProgrammingError(msg=zprava, errno=1146)
+        if "interrupted" in zprava:
+            return mysql.connector.errors.DatabaseError(msg=zprava, errno=1317)
+        return mysql.connector.errors.OperationalError(msg=zprava)
+    return mysql.connector.errors.DatabaseError(msg=zprava)
+
+# provedení příkazu s převodem chyb; ve sdílené databázi :memory: se na zámek tabulky čeká opakovaně
+# (SQLite u ní nepoužije čekání podle timeout připojení)
+def _provest(pripojeni, provest, sql, parametry):
+    konec = time.monotonic() + TIMEOUT
+    while True:
+        try:
+            return provest(sql, parametry)
+        except sqlite3.OperationalError as err:
+            if pripojeni.cesta == PAMET and "locked" in str(err) and time.monotonic() < konec:
+                time.sleep(0.005)
+                continue
+            raise _preklad_chyby(err) from err
+        except sqlite3.Error as err:
+            raise _preklad_chyby(err) from err
+
+
+# 3) Kurzor – execute / executemany / fetch* jako u kurzoru mysql.connector (dictionary=True vrací slovníky)
+class EmbeddedKurzor:
+    dialekt = SQLITE
+
+    def __init__(self, pripojeni, dictionary=False):
+        self._pripojeni = pripojeni
+        self._kurzor = pripojeni._sqlite.cursor()
+        self._slovniky = dictionary
+        self._prevody = ()
+        self.rowcount = -1
+        self.lastrowid = None
+
+    def execute(self, sql, parametry=()):
+        global _verze_schematu
+        prikaz, zmena_schematu = _prikaz(sql)
+        _provest(self._pripojeni, self._kurzor.execute, prikaz, _parametry(parametry))
+        if zmena_schematu:
+            _verze_schematu += 1
+        self._prevody = self._pripojeni._prevody(self._kurzor.description) if self._kurzor.description else ()
+        self.rowcount = self._kurzor.rowcount
+        self.lastrowid = self._kurzor.lastrowid
+
+    def executemany(self, sql, sekvence_parametru):
+        prikaz, _ = _prikaz(sql)
+        sekvence = [_parametry(parametry) for parametry in sekvence_parametru]
+        _provest(self._pripojeni, self._kurzor.executemany, prikaz, sekvence)
+        self._prevody = ()
+        self.rowcount = self._kurzor.rowcount
+
+    def zahajit_zapis(self):
+        self._pripojeni.zahajit_zapis()
+
+    @property
+    def column_names(self):
+        return tuple(sloupec[0] for sloupec in self._kurzor.description or ())
+
+    @property
+    def description(self):
+        return self._kurzor.description
+
+    # převod řádku: text sloupců DATE / DATETIME na date / datetime, při dictionary=True slovník
+    def _radek(self, radek):
+        if radek is None:
+            return radek
+        if self._prevody:
+            radek = list(radek)
+            for index, prevod in self._prevody:
+                if radek[index] is not None:
+                    radek[index] = prevod(radek[index])
+            radek = tuple(radek)
+        if self._slovniky:
+            return dict(zip(self.column_names, radek))
+        return radek
+
+    def fetchone(self):
+        return self._radek(self._kurzor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._radek(radek) for radek in self._kurzor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._radek(radek) for radek in self._kurzor.fetchall()]
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._kurzor.close()
+
+
+# 4) Připojení – cesta = soubor databáze nebo :memory:
+class EmbeddedPripojeni:
+    autocommit = False
+    dialekt = SQLITE
+
+    def __init__(self, cesta=PAMET):
+        self.cesta = cesta
+        self._otevrit()
+        # identita pro cache výpisů (viz cache.identita_db)
+        self.server_host = "embedded"
+        self.server_port = None
+        self._database = cesta
+
+    def _otevrit(self):
+        global _kotva_pameti
+        cesta = self.cesta
+        if cesta == PAMET:
+            if _kotva_pameti is None:
+                _kotva_pameti = sqlite3.connect(URI_PAMETI, uri=True, check_same_thread=False)
+            self._sqlite = sqlite3.connect(URI_PAMETI, uri=True, timeout=TIMEOUT, check_same_thread=False)
+        else:
+            self._sqlite = sqlite3.connect(cesta, timeout=TIMEOUT, check_same_thread=False)
+            self._sqlite.execute("PRAGMA journal_mode=WAL")
+        self._sqlite.create_function("CURDATE", 0, lambda: datetime.date.today().isoformat())
+        self._sqlite.create_function("NOW", 0, lambda: datetime.datetime.now().isoformat(" ", "seconds"))
+        self._sqlite.create_function("NOW", 1, lambda presnost: datetime.datetime.now().isoformat(" ", "microseconds"))
+        self._typy_sloupcu, self._verze_typu = {}, None
+        self.connection_id = next(_cisla_pripojeni)
+
+    # převody sloupců výsledku (index, převodník) podle deklarovaných typů sloupců tabulek schématu;
+    # sloupce se hledají podle názvu (stejnojmenné sloupce mají ve schématu aplikace stejný typ), výrazy se nepřevádějí
+    def _prevody(self, description):
+        if self._verze_typu != _verze_schematu:
+            radky = _provest(self, self._sqlite.execute,
+                             "SELECT p.name, p.type FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+                             "WHERE m.type = 'table'", ()).fetchall()
+            self._typy_sloupcu = {nazev: PREVODNIKY.get(typ.split("(")[0].upper()) for nazev, typ in radky}
+            self._verze_typu = _verze_schematu
+        return tuple((index, prevod) for index, sloupec in enumerate(description)
+                     if (prevod := self._typy_sloupcu.get(sloupec[0])) is not None)
+
+    @property
+    def database(self):
+        return self.cesta
+
+    @property
+    def in_transaction(self):
+        return self._sqlite.in_transaction
+
+    def cursor(self, dictionary=False, **_):        # prepared, buffered – SQLite připravuje a čte příkazy vždy stejně
+        if not self.is_connected():
+            raise mysql.connector.errors.OperationalError(msg="Připojení k vestavěné databázi je uzavřené.")
+        return EmbeddedKurzor(self, dictionary=dictionary)
+
+    def start_transaction(self):
+        if self.in_transaction:
+            raise mysql.connector.errors.ProgrammingError(msg="Transaction already in progress")
+        self._sqlite.execute("BEGIN")
+
+    # transakce se zámkem pro zápis hned od prvního čtení (BEGIN IMMEDIATE), viz DialektSQLite.pro_zapis()
+    def zahajit_zapis(self):
+        if not self.in_transaction:
+            _provest(self, self._sqlite.execute, "BEGIN IMMEDIATE", ())
+
+    def commit(self):
+        try:
+            self._sqlite.commit()
+        except sqlite3.Error as err:
+            raise _preklad_chyby(err) from err
+
+    def rollback(self):
+        try:
+            self._sqlite.rollback()
+        except sqlite3.Error as err:
+            raise _preklad_chyby(err) from err
+
+    # přerušení právě běžícího dotazu z jiného vlákna (obdoba KILL QUERY), viz async_db.py
+    def zrusit_dotaz(self):
+        self._sqlite.interrupt()
+
+    def is_connected(self):
+        try:
+            self._sqlite.total_changes
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+    def ping(self, reconnect=False, attempts=1, delay=0):
+        if not self.is_connected():
+            raise mysql.connector.errors.InterfaceError(msg="Připojení k vestavěné databázi je uzavřené.")
+
+    # znovupřipojení – rozpracovaná transakce se odvolá, připojení dostane nové connection_id (jako u mysql.connector)
+    def reconnect(self, attempts=1, delay=0):
+        self.close()
+        self._otevrit()
+
+    def close(self):
+        self._sqlite.close()
+
+    disconnect = close
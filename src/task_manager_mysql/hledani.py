@@ -0,0 +1,122 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: vyhledávání úkolů (FULLTEXT)
+-------------------------------------------------------------------------------------------
+Popis:
+Vyhledávání úkolů podle slov v názvu a popisu přes FULLTEXT index ft_ukoly_nazev_popis
+(migrace 6) – výsledky jsou seřazené podle relevance, volitelně jen v zadaných stavech
+a po stránkách; volba 6 z hlavního menu.
+
+    • hledané výrazy se hledají jako předpony slov a musí se vyskytnout všechny
+      (MATCH ... AGAINST ('+slovo* +slovo*' IN BOOLEAN MODE)); znaky operátorů
+      BOOLEAN MODE se z výrazu odstraní, slova kratší než MIN_DELKA_SLOVA se vynechají
+      (FULLTEXT index je neobsahuje)
+    • náhradní hledání, pokud FULLTEXT nelze použít (index na serveru chybí, backend
+      FULLTEXT nemá – vestavěná SQLite, výraz obsahuje jen krátká slova): předpona
+      názvu úkolu (nazev LIKE 'výraz%') přes index
+      ix_ukoly_nazev (migrace 5), seřazeno podle názvu – dotaz prochází index v pořadí
+      výsledku a končí po LIMIT řádcích, takže je omezený i na velké tabulce;
+      popis se v náhradním hledání neprohledává (LIKE '%...%' by procházel celou tabulku)
+
+Chybějící FULLTEXT index se zjistí z chyby serveru při prvním hledání a do konce běhu
+procesu se pak používá jen náhradní hledání.
+==============================================================================================
+"""
+
+from .dialekt import dialekt
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .ukol import SQL_SLOUPCE, Ukol
+from .vypis import strankovat, velikost_stranky_vypisu
+
+VELIKOST_STRANKY_HLEDANI = 20
+MIN_DELKA_SLOVA = 3         # innodb_ft_min_token_size – kratší slova FULLTEXT index neobsahuje
+
+# chyby serveru, po kterých se přechází na náhradní hledání:
+# 1191 = FULLTEXT index pro zadané sloupce neexistuje, 1214 = tabulka FULLTEXT index nepodporuje
+CHYBY_BEZ_FULLTEXTU = (1191, 1214)
+
+_OPERATORY = str.maketrans({znak: " " for znak in '+-<>()~*"@'})
+_fulltext_dostupny = True
+
+
+# 1) Vyhledání úkolů
+# vyraz = hledaná slova; stavy = n-tice stavů (None = všechny úkoly); stranka = číslo stránky od 0;
+# funkce vrací seznam záznamů Ukol na zadané stránce (nejrelevantnější první), [] (nic nenalezeno / prázdný výraz)
+# nebo False při SQL chybě
+def hledat_ukoly(conn, vyraz, stavy=None, stranka=0, velikost_stranky=VELIKOST_STRANKY_HLEDANI):
+    global _fulltext_dostupny
+    if velikost_stranky < 1 or stranka < 0:
+        raise ValueError("Parametr velikost_stranky musí být alespoň 1 a stranka nesmí být záporná.")
+    vyraz = vyraz.strip()
+    if not vyraz:
+        return []
+
+    filtr, parametry_filtru = "", ()
+    if stavy:
+        filtr = f" AND stav IN ({', '.join(['%s'] * len(stavy))})"
+        parametry_filtru = tuple(stavy)
+    strankovani = (velikost_stranky, stranka * velikost_stranky)
+
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                dotaz = _dotaz_fulltext(vyraz)
+                if dotaz and _fulltext_dostupny and dialekt(conn).fulltext:
+                    try:
+                        cursor.execute(
+                            f"SELECT {SQL_SLOUPCE} FROM ukoly "
+                            f"WHERE MATCH (nazev, popis) AGAINST (%s IN BOOLEAN MODE){filtr} "
+                            f"ORDER BY MATCH (nazev, popis) AGAINST (%s IN BOOLEAN MODE) DESC, id LIMIT %s OFFSET %s",
+                            (dotaz, *parametry_filtru, dotaz, *strankovani))
+                        return list(map(Ukol._make, cursor.fetchall()))
+                    except mysql.connector.Error as err:
+                        if err.errno not in CHYBY_BEZ_FULLTEXTU:
+                            raise
+                        _fulltext_dostupny = False
+                        print("FULLTEXT index není k dispozici, hledá se jen podle začátku názvu úkolu.")
+
+                # náhradní hledání: předpona názvu přes index ix_ukoly_nazev, pořadí podle indexu;
+                # escape znak LIKE se uvádí výslovně (v MySQL je výchozí zpětné lomítko, SQLite žádný výchozí nemá)
+                cursor.execute(
+                    f"SELECT {SQL_SLOUPCE} FROM ukoly WHERE nazev LIKE %s ESCAPE '!'{filtr} "
+                    f"ORDER BY nazev, id LIMIT %s OFFSET %s",
+                    (_predpona_like(vyraz), *parametry_filtru, *strankovani))
+                return list(map(Ukol._make, cursor.fetchall()))
+            finally:
+                cursor.close()
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při hledání úkolů: {err}")
+        return False
+
+# výraz pro BOOLEAN MODE – každé slovo povinné (+) a hledané jako předpona (*);
+# None, pokud nezbylo žádné dost dlouhé slovo
+def _dotaz_fulltext(vyraz):
+    slova = [slovo for slovo in vyraz.translate(_OPERATORY).split() if len(slovo) >= MIN_DELKA_SLOVA]
+    return " ".join(f"+{slovo}*" for slovo in slova) or None
+
+# vzor LIKE pro předponu – znaky %, _ a ! (escape znak) z výrazu se hledají doslova
+def _predpona_like(vyraz):
+    return vyraz.replace("!", "!!").replace("%", "!%").replace("_", "!_") + "%"
+
+
+# 2) Hledání z hlavního menu
+# UI funkce – načte hledaný výraz a vypíše výsledky po stránkách
+# (Enter = další, p = předchozí stránka, k = konec; viz vypis.py),
+# volba 6 z hlavního menu; velikost_stranky=None = nastavená velikost stránky výpisu;
+# funkce vrací True (něco bylo nalezeno), [] (nic nenalezeno) nebo False (prázdný výraz nebo SQL chyba)
+def hledat_ukol(conn, velikost_stranky=None):
+    vyraz = input("Zadejte hledaný text (název nebo popis úkolu): ").strip()
+    if not vyraz:
+        print("Nebyl zadán hledaný text.")
+        return False
+
+    velikost_stranky = velikost_stranky or velikost_stranky_vypisu()
+    vysledek = strankovat(lambda cislo: hledat_ukoly(conn, vyraz, stranka=cislo, velikost_stranky=velikost_stranky),
+                          "NALEZENÉ ÚKOLY:", velikost_stranky)
+    if vysledek == []:
+        print("Žádný úkol neodpovídá hledanému textu.")
+    return vysledek
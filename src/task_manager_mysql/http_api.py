@@ -0,0 +1,316 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: HTTP/JSON služba nad DB funkcemi (asyncio)
+-------------------------------------------------------------------------------------------
+Popis:
+Lehký HTTP/1.1 server ze standardní knihovny (asyncio streams), přes který k úkolům
+přistupuje více uživatelů najednou – místo vlastního procesu s hlavním menu a vlastním
+připojením k DB pro každého uživatele. Endpointy volají stejné DB funkce jako menu:
+
+    GET    /ukoly[?stav=...]    – výpis úkolů (stranky_ukolu), volitelně jen v zadaných stavech
+    POST   /ukoly               – přidání úkolu {"nazev": ..., "popis": ...} (pridat_ukol_db); odpověď 201
+                                  obsahuje id nového úkolu a hlavičku Location: /ukoly/{id}
+    GET    /ukoly/{id}          – jeden úkol (najit_ukol_db)
+    PATCH  /ukoly/{id}          – změna stavu {"stav": ...} (aktualizovat_ukol_db)
+    DELETE /ukoly/{id}          – odstranění úkolu (odstranit_ukol_db)
+
+    • připojení k DB  – DB funkce běží v omezeném počtu pracovních vláken AsyncDB (async_db.py),
+                        každé s jedním připojením; počet připojení nezávisí na počtu klientů,
+                        nadbytečné požadavky čekají ve frontě AsyncDB
+    • keep-alive      – jedno TCP spojení obslouží libovolně mnoho požadavků po sobě (HTTP/1.1
+                        výchozí, HTTP/1.0 s Connection: keep-alive); nečinné spojení se zavře
+                        po necinnost sekundách
+    • výpis úkolů     – posílá se jako JSON pole po stránkách (Transfer-Encoding: chunked);
+                        další stránka se načte až po odeslání předchozí, takže paměť serveru
+                        nezávisí na velikosti tabulky a pomalý klient zpomalí jen své načítání;
+                        HTTP/1.0 chunked nezná – klient HTTP/1.0 dostane tělo bez chunků
+                        a konec těla pozná podle zavření spojení (i s Connection: keep-alive)
+
+Chyby se vracejí jako JSON {"chyba": "..."} se stavovým kódem 400 / 404 / 405 / 413 / 503
+(databáze nedostupná). Potvrzující a chybové hlášky DB funkcí se vypisují na stdout jako log.
+Server poslouchá ve výchozím nastavení jen na localhost (API_HOST, API_PORT v .env).
+Spuštění z příkazové řádky: podpříkaz server.
+==============================================================================================
+"""
+
+import asyncio
+import json
+import os
+from urllib.parse import parse_qs, urlsplit
+
+from .async_db import AsyncDB
+from .ovladac import mysql
+from .prenos import _hodnoty
+from .task_manager_mysql_p2 import (
+    _pridat_ukol,
+    _validace_ukolu,
+    aktualizovat_ukol_db,
+    najit_ukol_db,
+    odstranit_ukol_db,
+    stranky_ukolu,
+)
+from .ukol import SLOUPCE_UKOLU, STAVY_UKOLU
+
+NECINNOST = 15.0                # sekundy – nečinné keep-alive spojení se po této době zavře
+MAX_HLAVICKY = 16 * 1024        # největší délka řádku požadavku a hlaviček (bajty)
+MAX_TELO = 64 * 1024            # největší délka těla požadavku (bajty)
+VELIKOST_STRANKY_API = 500      # počet úkolů jedné stránky (jednoho chunku) výpisu
+
+_DUVODY = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+           501: "Not Implemented", 503: "Service Unavailable"}
+
+
+class HttpChyba(Exception):
+    def __init__(self, stav, zprava, hlavicky=None):
+        super().__init__(zprava)
+        self.stav = stav
+        self.zprava = zprava
+        self.hlavicky = hlavicky or {}
+
+
+# 1) Server
+# db = AsyncDB se sdílenými připojeními pracovních vláken;
+# obsluhovat() je callback asyncio.start_server() pro jedno spojení
+class HttpApi:
+    def __init__(self, db, necinnost=NECINNOST, velikost_stranky=VELIKOST_STRANKY_API):
+        self.db = db
+        self.necinnost = necinnost
+        self.velikost_stranky = velikost_stranky
+
+    # a) jedno TCP spojení – požadavky se čtou a obsluhují postupně, dokud klient nebo server spojení neukončí
+    async def obsluhovat(self, reader, writer):
+        try:
+            while True:
+                try:
+                    pozadavek = await asyncio.wait_for(_cist_pozadavek(reader), self.necinnost)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return                                          # nečinnost nebo klient spojení zavřel
+                except HttpChyba as chyba:                          # poškozený požadavek – zbytek spojení nelze číst
+                    await _odeslat(writer, chyba.stav, {"chyba": chyba.zprava}, False, chyba.hlavicky)
+                    return
+                metoda, cesta, dotaz, telo, keep_alive, http11 = pozadavek
+                try:
+                    if not await self._zpracovat(writer, metoda, cesta, dotaz, telo, keep_alive, http11):
+                        return
+                except HttpChyba as chyba:
+                    await _odeslat(writer, chyba.stav, {"chyba": chyba.zprava}, keep_alive, chyba.hlavicky)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.CancelledError):          # klient odešel uprostřed odpovědi / ukončení serveru
+            return
+        finally:
+            writer.close()
+
+    # b) směrování na endpointy; vrací False, pokud se spojení po odpovědi musí zavřít (přerušený výpis)
+    async def _zpracovat(self, writer, metoda, cesta, dotaz, telo, keep_alive, http11):
+        casti = [cast for cast in cesta.split("/") if cast]
+        hlavicky = {}
+        if casti == ["ukoly"]:
+            if metoda == "GET":
+                return await self._vypsat(writer, _stavy(dotaz), keep_alive, http11)
+            if metoda == "POST":
+                stav, odpoved = await self._pridat(_json(telo))
+                hlavicky["Location"] = f"/ukoly/{odpoved['id']}"
+            else:
+                raise HttpChyba(405, "Nepodporovaná metoda.", {"Allow": "GET, POST"})
+        elif len(casti) == 2 and casti[0] == "ukoly" and casti[1].isdecimal():
+            id_ukolu = int(casti[1])
+            if metoda == "GET":
+                stav, odpoved = await self._najit(id_ukolu)
+            elif metoda == "PATCH":
+                stav, odpoved = await self._aktualizovat(id_ukolu, _json(telo))
+            elif metoda == "DELETE":
+                stav, odpoved = await self._odstranit(id_ukolu)
+            else:
+                raise HttpChyba(405, "Nepodporovaná metoda.", {"Allow": "GET, PATCH, DELETE"})
+        else:
+            raise HttpChyba(404, "Neznámý endpoint.")
+        await _odeslat(writer, stav, odpoved, keep_alive, hlavicky)
+        return True
+
+    # c) endpointy – DB funkce běží v pracovním vlákně AsyncDB, False z DB funkce (SQL chyba) = 503
+    async def _pridat(self, data):
+        nazev, popis = data.get("nazev"), data.get("popis")
+        chyba = _validace_ukolu((nazev, popis))
+        if chyba:
+            raise HttpChyba(400, chyba)
+        id_ukolu = await self.db.spustit(_pridat_ukol, nazev, popis)
+        if id_ukolu is False:
+            raise HttpChyba(503, "Úkol se nepodařilo uložit.")
+        return 201, {"id": id_ukolu, "nazev": nazev, "popis": popis, "stav": "nezahájeno"}
+
+    async def _najit(self, id_ukolu):
+        return _ukol_nebo_chyba(await self.db.spustit(najit_ukol_db, id_ukolu))
+
+    # změna na stav, který úkol už má, není chyba – odpověď obsahuje úkol po změně
+    async def _aktualizovat(self, id_ukolu, data):
+        novy_stav = data.get("stav")
+        if novy_stav not in STAVY_UKOLU:
+            raise HttpChyba(400, f"Neplatný stav, povolené stavy: {', '.join(STAVY_UKOLU)}.")
+
+        def aktualizovat(conn):
+            aktualizovat_ukol_db(id_ukolu, novy_stav, conn)     # False i při stejném stavu – výsledek určí načtený úkol
+            return najit_ukol_db(id_ukolu, conn)
+
+        stav, odpoved = _ukol_nebo_chyba(await self.db.spustit(aktualizovat))
+        if odpoved["stav"] != novy_stav:
+            raise HttpChyba(503, "Stav úkolu se nepodařilo změnit.")
+        return stav, odpoved
+
+    async def _odstranit(self, id_ukolu):
+        def odstranit(conn):
+            return True if odstranit_ukol_db(id_ukolu, conn) else najit_ukol_db(id_ukolu, conn)
+
+        vysledek = await self.db.spustit(odstranit)
+        if vysledek is True:
+            return 204, None
+        _ukol_nebo_chyba(vysledek)                                  # None = 404, False = 503
+        raise HttpChyba(503, "Úkol se nepodařilo odstranit.")
+
+    # d) výpis po stránkách jako chunked JSON pole; chyba DB po odeslání hlavičky už nemůže změnit stavový kód,
+    # proto se spojení zavře bez ukončovacího chunku – klient pozná neúplnou odpověď;
+    # chunked jen pro HTTP/1.1 – u HTTP/1.0 (i s keep-alive) tělo končí zavřením spojení
+    async def _vypsat(self, writer, stavy, keep_alive, http11):
+        stranka = await self._stranka(stavy, 0)
+        chunked = keep_alive and http11
+        hlavicky = {"Transfer-Encoding": "chunked"} if chunked else {}
+        writer.write(_hlavicka(200, "application/json; charset=utf-8", chunked, hlavicky))
+        oddelovac = b"["
+        while True:
+            if stranka:
+                data = oddelovac + ",".join(json.dumps(_slovnik(ukol), ensure_ascii=False) for ukol in stranka).encode()
+                oddelovac = b","
+                writer.write(_chunk(data) if chunked else data)
+                await writer.drain()            # pomalý klient – další stránka se načte až po odeslání
+            if len(stranka) < self.velikost_stranky:
+                break
+            try:
+                stranka = await self._stranka(stavy, stranka[-1].id)
+            except HttpChyba:
+                return False
+        konec = b"]" if oddelovac == b"," else b"[]"
+        writer.write(_chunk(konec) + b"0\r\n\r\n" if chunked else konec)
+        await writer.drain()
+        return chunked
+
+    async def _stranka(self, stavy, od_id):
+        def nacist(conn):
+            try:
+                return next(stranky_ukolu(conn, stavy, self.velikost_stranky, od_id), [])
+            except mysql.connector.Error as err:
+                print(f"Chyba při načítání úkolů: {err}")
+                return False
+
+        stranka = await self.db.spustit(nacist)
+        if stranka is False:
+            raise HttpChyba(503, "Úkoly se nepodařilo načíst.")
+        return stranka
+
+
+# 2) Čtení požadavku a zápis odpovědi
+# vrací (metoda, cesta, parametry dotazu, tělo, keep_alive, http11);
+# poškozený nebo příliš velký požadavek vyvolá HttpChyba
+async def _cist_pozadavek(reader):
+    try:
+        hlavicka = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.LimitOverrunError:
+        raise HttpChyba(431, "Příliš dlouhá hlavička požadavku.") from None
+    radky = hlavicka.decode("latin-1").split("\r\n")
+    try:
+        metoda, adresa, verze = radky[0].split(" ")
+    except ValueError:
+        raise HttpChyba(400, "Neplatný řádek požadavku.") from None
+    hlavicky = {}
+    for radek in radky[1:]:
+        nazev, _, hodnota = radek.partition(":")
+        if nazev:
+            hlavicky[nazev.strip().lower()] = hodnota.strip()
+
+    spojeni = hlavicky.get("connection", "").lower()
+    http11 = verze == "HTTP/1.1"
+    keep_alive = spojeni != "close" if http11 else spojeni == "keep-alive"
+    if "transfer-encoding" in hlavicky:
+        raise HttpChyba(501, "Tělo požadavku s Transfer-Encoding není podporováno.")
+    try:
+        delka = int(hlavicky.get("content-length", "0"))
+    except ValueError:
+        raise HttpChyba(400, "Neplatná hlavička Content-Length.") from None
+    if delka > MAX_TELO:
+        raise HttpChyba(413, f"Tělo požadavku může mít nejvýše {MAX_TELO} bajtů.")
+    telo = await reader.readexactly(delka) if delka > 0 else b""
+
+    adresa = urlsplit(adresa)
+    return metoda, adresa.path, parse_qs(adresa.query), telo, keep_alive, http11
+
+async def _odeslat(writer, stav, odpoved, keep_alive, hlavicky=None):
+    data = b"" if odpoved is None else json.dumps(odpoved, ensure_ascii=False).encode()
+    writer.write(_hlavicka(stav, "application/json; charset=utf-8", keep_alive,
+                           {**(hlavicky or {}), "Content-Length": str(len(data))}) + data)
+    await writer.drain()
+
+def _hlavicka(stav, typ, keep_alive, hlavicky):
+    radky = [f"HTTP/1.1 {stav} {_DUVODY[stav]}", f"Content-Type: {typ}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    radky += [f"{nazev}: {hodnota}" for nazev, hodnota in hlavicky.items()]
+    return ("\r\n".join(radky) + "\r\n\r\n").encode("latin-1")
+
+def _chunk(data):
+    return f"{len(data):x}\r\n".encode() + data + b"\r\n"
+
+# pomocné funkce endpointů
+def _json(telo):
+    try:
+        data = json.loads(telo or b"{}")
+    except ValueError:
+        raise HttpChyba(400, "Tělo požadavku není platný JSON.") from None
+    if not isinstance(data, dict):
+        raise HttpChyba(400, "Tělo požadavku musí být JSON objekt.")
+    return data
+
+def _stavy(dotaz):
+    stavy = tuple(dotaz.get("stav", ()))
+    for stav in stavy:
+        if stav not in STAVY_UKOLU:
+            raise HttpChyba(400, f"Neplatný stav, povolené stavy: {', '.join(STAVY_UKOLU)}.")
+    return stavy or None
+
+def _slovnik(ukol):
+    return dict(zip(SLOUPCE_UKOLU, _hodnoty(ukol)))
+
+# výsledek najit_ukol_db(): Ukol = 200, None = 404, False = 503
+def _ukol_nebo_chyba(ukol):
+    if ukol is None:
+        raise HttpChyba(404, "Úkol s tímto ID neexistuje.")
+    if ukol is False:
+        raise HttpChyba(503, "Databáze není dostupná.")
+    return 200, _slovnik(ukol)
+
+
+# 3) Spuštění serveru
+# vrací asyncio.Server (server.sockets[0].getsockname() = skutečná adresa, port=0 = volný port)
+async def spustit_server(db, host=None, port=None, necinnost=NECINNOST):
+    host = host or os.getenv("API_HOST", "127.0.0.1")
+    port = int(os.getenv("API_PORT", "8080")) if port is None else port
+    api = HttpApi(db, necinnost=necinnost)
+    return await asyncio.start_server(api.obsluhovat, host, port, limit=MAX_HLAVICKY)
+
+# běh serveru až do přerušení (Ctrl+C); vlaken = počet připojení k DB (výchozí API_DB_THREADS, 4)
+def spustit(test_db=False, host=None, port=None, vlaken=None):
+    vlaken = vlaken or int(os.getenv("API_DB_THREADS", "4"))
+
+    async def beh():
+        db = AsyncDB(test_db=test_db, max_vlaken=vlaken)
+        server = await spustit_server(db, host, port)
+        adresa = server.sockets[0].getsockname()
+        print(f"HTTP API běží na http://{adresa[0]}:{adresa[1]}/ukoly (ukončení Ctrl+C).")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            db.zavrit()
+
+    try:
+        asyncio.run(beh())
+    except KeyboardInterrupt:
+        print("HTTP API ukončeno.")
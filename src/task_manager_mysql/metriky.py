@@ -0,0 +1,260 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: měření SQL dotazů (metriky, pomalé dotazy)
+-------------------------------------------------------------------------------------------
+Popis:
+Instrumentace všech kurzorů, které DB funkce aplikace vytvářejí (funkce kurzor()).
+Pro každý SQL příkaz se zaznamená:
+    • typ příkazu (SELECT / INSERT / UPDATE / DELETE / ...)
+    • doba provedení (execute) a doba načtení výsledku (fetch)
+    • počet změněných řádků (rowcount) a počet načtených řádků
+    • případná chyba
+Zvlášť se měří i doba navazování připojení (typ CONNECT).
+
+Záznamy se předávají registrovaným hookům (pridat_hook()) a vestavěnému sběrači, který drží
+souhrnné čítače a histogram dob podle typu příkazu a log pomalých dotazů (nad nastaveným prahem).
+Výstupy: statistiky() (slovník), pomale_dotazy() (seznam) a prometheus_text() (textový formát
+Prometheus pro export metrik).
+
+Měření je ve výchozím stavu vypnuté – kurzor() pak vrací přímo kurzor připojení a jediná
+režie je kontrola jednoho příznaku. Zapnutí: zapnout_metriky() nebo v .env DB_METRICS=1
+(práh pomalých dotazů DB_SLOW_QUERY_MS, výchozí 100 ms).
+==============================================================================================
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+
+# záznam jednoho SQL příkazu předávaný hookům (doby v sekundách, chyba = výjimka nebo None)
+ZaznamDotazu = namedtuple(
+    "ZaznamDotazu",
+    ["typ", "sql", "doba_provedeni", "doba_nacteni", "radky_zmenene", "radky_nactene", "chyba"],
+)
+
+# horní meze košů histogramu dob příkazů (s), poslední koš je +Inf
+KOSE_HISTOGRAMU = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_zapnuto = False
+_hooky = []
+_zamek = threading.Lock()
+_souhrn = {}                    # typ příkazu -> čítače a histogram
+_pomale = deque(maxlen=100)
+_prah_pomalych = 0.1
+_pocet_pomalych = 0
+
+
+# 1) Zapnutí / vypnutí měření a hooky
+def zapnout_metriky(prah_pomalych_ms=100, velikost_logu=100):
+    global _zapnuto, _prah_pomalych, _pomale
+    with _zamek:
+        _prah_pomalych = prah_pomalych_ms / 1000
+        if _pomale.maxlen != velikost_logu:
+            _pomale = deque(_pomale, maxlen=velikost_logu)
+        _zapnuto = True
+
+def vypnout_metriky():
+    global _zapnuto
+    _zapnuto = False
+
+def metriky_zapnuty():
+    return _zapnuto
+
+# hook = funkce s jedním parametrem (ZaznamDotazu), volá se po dokončení každého příkazu
+# ve vlákně, které příkaz provedlo;
+# chyba v hooku se neošetřuje – hook musí být rychlý a nesmí vyvolat výjimku
+def pridat_hook(hook):
+    with _zamek:
+        _hooky.append(hook)
+
+def odebrat_hook(hook):
+    with _zamek:
+        if hook in _hooky:
+            _hooky.remove(hook)
+
+def vynulovat_metriky():
+    global _pocet_pomalych
+    with _zamek:
+        _souhrn.clear()
+        _pomale.clear()
+        _pocet_pomalych = 0
+
+
+# 2) Kurzor pro DB funkce
+# při vypnutém měření vrací přímo kurzor připojení, při zapnutém měřený kurzor (MerenyKurzor)
+def kurzor(conn, **parametry):
+    return obalit(conn.cursor(**parametry))
+
+# obalení již vytvořeného kurzoru (např. sdíleného kurzoru připraveného příkazu, viz pripravene.py)
+def obalit(cursor):
+    if not _zapnuto:
+        return cursor
+    return MerenyKurzor(cursor)
+
+# měření doby navazování připojení (volá pool a pripojeni_db() po mysql.connector.connect())
+def zaznamenat_pripojeni(doba, chyba=None):
+    if _zapnuto:
+        _zaznamenat(ZaznamDotazu("CONNECT", "", doba, 0.0, 0, 0, chyba))
+
+
+# měřený kurzor – obal kurzoru připojení;
+# příkaz se zaznamená při dalším execute(), při close() nebo ihned při chybě, aby zahrnoval i načtení výsledku (fetch)
+class MerenyKurzor:
+    def __init__(self, cursor):
+        self._kurzor = cursor
+        self._rozpracovany = None        # [typ, sql, doba provedení, změněné řádky, načtené řádky, doba načtení]
+
+    def execute(self, sql, *args, **kwargs):
+        return self._provest(self._kurzor.execute, sql, args, kwargs)
+
+    def executemany(self, sql, *args, **kwargs):
+        return self._provest(self._kurzor.executemany, sql, args, kwargs)
+
+    def _provest(self, metoda, sql, args, kwargs):
+        self._dokoncit()
+        typ = _typ_prikazu(sql)
+        zacatek = time.perf_counter()
+        try:
+            vysledek = metoda(sql, *args, **kwargs)
+        except Exception as err:
+            _zaznamenat(ZaznamDotazu(typ, sql, time.perf_counter() - zacatek, 0.0, 0, 0, err))
+            raise
+        doba = time.perf_counter() - zacatek
+        zmenene = self._kurzor.rowcount if typ != "SELECT" and self._kurzor.rowcount > 0 else 0
+        self._rozpracovany = [typ, sql, doba, zmenene, 0, 0.0]
+        return vysledek
+
+    def _nacist(self, metoda, *args):
+        zacatek = time.perf_counter()
+        vysledek = metoda(*args)
+        if self._rozpracovany is not None:
+            self._rozpracovany[5] += time.perf_counter() - zacatek
+            if isinstance(vysledek, list):
+                self._rozpracovany[4] += len(vysledek)
+            elif vysledek is not None:
+                self._rozpracovany[4] += 1
+        return vysledek
+
+    def fetchone(self):
+        return self._nacist(self._kurzor.fetchone)
+
+    def fetchmany(self, *args):
+        return self._nacist(self._kurzor.fetchmany, *args)
+
+    def fetchall(self):
+        return self._nacist(self._kurzor.fetchall)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def close(self):
+        self._dokoncit()
+        return self._kurzor.close()
+
+    def _dokoncit(self):
+        if self._rozpracovany is not None:
+            typ, sql, doba, zmenene, nactene, doba_nacteni = self._rozpracovany
+            self._rozpracovany = None
+            _zaznamenat(ZaznamDotazu(typ, sql, doba, doba_nacteni, zmenene, nactene, None))
+
+    # ostatní atributy (rowcount, lastrowid, column_names, ...) se čtou přímo z kurzoru připojení
+    def __getattr__(self, nazev):
+        return getattr(self._kurzor, nazev)
+
+
+def _typ_prikazu(sql):
+    slova = sql.lstrip().split(None, 1)
+    return slova[0].upper() if slova else ""
+
+
+# 3) Sběr záznamů – souhrnné čítače, histogram a log pomalých dotazů
+def _zaznamenat(zaznam):
+    global _pocet_pomalych
+    doba = zaznam.doba_provedeni + zaznam.doba_nacteni
+    with _zamek:
+        souhrn = _souhrn.get(zaznam.typ)
+        if souhrn is None:
+            souhrn = _souhrn[zaznam.typ] = {
+                "pocet": 0, "chyby": 0, "doba_s": 0.0, "doba_nacteni_s": 0.0,
+                "radky_zmenene": 0, "radky_nactene": 0, "kose": [0] * (len(KOSE_HISTOGRAMU) + 1),
+            }
+        souhrn["pocet"] += 1
+        souhrn["chyby"] += zaznam.chyba is not None
+        souhrn["doba_s"] += doba
+        souhrn["doba_nacteni_s"] += zaznam.doba_nacteni
+        souhrn["radky_zmenene"] += zaznam.radky_zmenene
+        souhrn["radky_nactene"] += zaznam.radky_nactene
+        souhrn["kose"][_index_kose(doba)] += 1
+
+        if doba >= _prah_pomalych:
+            _pocet_pomalych += 1
+            _pomale.append({
+                "cas": time.time(),
+                "typ": zaznam.typ,
+                "sql": " ".join(zaznam.sql.split())[:500],
+                "doba_ms": round(doba * 1000, 3),
+                "radky_zmenene": zaznam.radky_zmenene,
+                "radky_nactene": zaznam.radky_nactene,
+                "chyba": str(zaznam.chyba) if zaznam.chyba is not None else None,
+            })
+        hooky = list(_hooky)
+
+    for hook in hooky:
+        hook(zaznam)
+
+def _index_kose(doba):
+    for index, mez in enumerate(KOSE_HISTOGRAMU):
+        if doba <= mez:
+            return index
+    return len(KOSE_HISTOGRAMU)
+
+
+# 4) Pull API a export
+# statistiky(): souhrn podle typu příkazu (kopie), histogram jako seznam počtů v koších KOSE_HISTOGRAMU + [+Inf]
+def statistiky():
+    with _zamek:
+        return {typ: dict(souhrn, kose=list(souhrn["kose"])) for typ, souhrn in _souhrn.items()}
+
+# pomale_dotazy(): posledních N pomalých dotazů (nejstarší první)
+def pomale_dotazy():
+    with _zamek:
+        return list(_pomale)
+
+# prometheus_text(): metriky v textovém formátu Prometheus (exposition format 0.0.4)
+def prometheus_text():
+    with _zamek:
+        souhrny = sorted((typ, dict(souhrn, kose=list(souhrn["kose"]))) for typ, souhrn in _souhrn.items())
+        pocet_pomalych = _pocet_pomalych
+
+    radky = []
+    def metrika(nazev, typ_metriky, popis, hodnoty):
+        radky.append(f"# HELP {nazev} {popis}")
+        radky.append(f"# TYPE {nazev} {typ_metriky}")
+        radky.extend(hodnoty)
+
+    metrika("task_manager_db_statements_total", "counter", "Počet SQL příkazů podle typu.",
+            [f'task_manager_db_statements_total{{typ="{typ}"}} {s["pocet"]}' for typ, s in souhrny])
+    metrika("task_manager_db_statement_errors_total", "counter", "Počet SQL příkazů ukončených chybou.",
+            [f'task_manager_db_statement_errors_total{{typ="{typ}"}} {s["chyby"]}' for typ, s in souhrny])
+    metrika("task_manager_db_rows_affected_total", "counter", "Počet změněných řádků.",
+            [f'task_manager_db_rows_affected_total{{typ="{typ}"}} {s["radky_zmenene"]}' for typ, s in souhrny])
+    metrika("task_manager_db_rows_fetched_total", "counter", "Počet načtených řádků.",
+            [f'task_manager_db_rows_fetched_total{{typ="{typ}"}} {s["radky_nactene"]}' for typ, s in souhrny])
+    metrika("task_manager_db_fetch_seconds_total", "counter", "Celková doba načítání výsledků (s).",
+            [f'task_manager_db_fetch_seconds_total{{typ="{typ}"}} {s["doba_nacteni_s"]:.6f}' for typ, s in souhrny])
+
+    histogram = []
+    for typ, s in souhrny:
+        kumulativne = 0
+        for mez, pocet in zip(KOSE_HISTOGRAMU + ("+Inf",), s["kose"]):
+            kumulativne += pocet
+            histogram.append(
+                f'task_manager_db_statement_duration_seconds_bucket{{typ="{typ}",le="{mez}"}} {kumulativne}')
+        histogram.append(f'task_manager_db_statement_duration_seconds_sum{{typ="{typ}"}} {s["doba_s"]:.6f}')
+        histogram.append(f'task_manager_db_statement_duration_seconds_count{{typ="{typ}"}} {s["pocet"]}')
+    metrika("task_manager_db_statement_duration_seconds", "histogram",
+            "Doba SQL příkazu včetně načtení výsledku (s).", histogram)
+
+    metrika("task_manager_db_slow_statements_total", "counter", "Počet pomalých SQL příkazů (nad prahem).",
+            [f"task_manager_db_slow_statements_total {pocet_pomalych}"])
+    return "\n".join(radky) + "\n"
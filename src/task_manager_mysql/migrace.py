@@ -0,0 +1,227 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: migrace schématu databáze
+-------------------------------------------------------------------------------------------
+Popis:
+Verzované migrace schématu databáze (prod nebo test). Každá migrace má své číslo verze,
+popis a funkci, která provede změnu schématu. Aplikované verze se evidují v tabulce
+'schema_verze', takže se každá migrace provede jen jednou a nové migrace lze přidávat
+na konec seznamu MIGRACE i pro už existující produkční tabulku.
+
+Pravidla pro migrace:
+    • čísla verzí se nikdy nemění ani nepoužívají znovu, nová migrace = nové vyšší číslo
+    • DDL příkazy v MySQL provádějí implicitní commit, proto musí být každý krok
+      idempotentní (CREATE ... IF NOT EXISTS, kontrola existence indexu), aby šel
+      bezpečně zopakovat po pádu mezi změnou schématu a zápisem verze
+    • indexy se přidávají online (ALGORITHM=INPLACE, LOCK=NONE), tabulka zůstává
+      během vytváření indexu přístupná pro čtení i zápis; výjimkou je FULLTEXT index,
+      při jehož vytváření InnoDB dovoluje jen čtení (LOCK=SHARED)
+
+Migrace se aplikují při startu aplikace z main() a ve fixtures testů (přes vytvoreni_tabulky()).
+Souběžný start více procesů je ošetřen zámkem GET_LOCK().
+Příkazy, které se v MySQL a SQLite zapisují jinak (typy sloupců, indexy, kontroly existence,
+zámek), sestavuje dialekt připojení (dialekt.py) – kroky migrací jsou pro oba backendy společné.
+==============================================================================================
+"""
+
+from .dialekt import dialekt
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .souhrn import prepsat_citace
+from .ukol import STAVY_UKOLU
+
+# název zámku pro GET_LOCK() a doba čekání na něj (s), pokud migrace právě provádí jiný proces
+ZAMEK_MIGRACE = "task_manager_migrace"
+CEKANI_NA_ZAMEK = 60
+
+
+# 1) Kroky migrací
+# každá funkce dostane kurzor a provede jednu změnu schématu; musí jít bezpečně spustit opakovaně;
+# typy sloupců, které se v MySQL a SQLite zapisují jinak, dodává dialekt kurzoru (d.vycet(), d.text(), d.automaticke_id)
+
+# migrace 1: výchozí tabulka 'ukoly' (shodná s původní definicí ve vytvoreni_tabulky(), existující tabulka se nemění);
+# datový typ ENUM pro sloupec 'stav' zajišťuje pouze 3 povolené hodnoty s default hodnotou 'nezahájeno'
+# CHECK constraint u sloupců 'nazev', 'popis' zajišťuje, že hodnota nesmí být null (prázdná)
+# a ani to nesmí být prázdný řetězec
+def _vytvorit_tabulku_ukoly(cursor):
+    d = dialekt(cursor)
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS ukoly (
+            id {d.automaticke_id},
+            nazev {d.text("nazev", 30)} NOT NULL CHECK (nazev <> ''),
+            popis {d.text("popis", 100)} NOT NULL CHECK (popis <> ''),
+            stav {d.vycet("stav", STAVY_UKOLU)} NOT NULL DEFAULT 'nezahájeno',
+            datum_vytvoreni DATE
+        )
+    ''')
+
+# migrace 2: index pro výpisy filtrované podle stavu a stránkované podle id
+# (WHERE stav IN ('nezahájeno', 'probíhá') AND id > %s ORDER BY id LIMIT n)
+def _index_stav_id(cursor):
+    _pridat_index(cursor, "ukoly", "ix_ukoly_stav_id", "stav, id")
+
+# migrace 3: index pro dotazy podle stavu a stáří úkolu (např. úkoly 'probíhá' starší než dané datum, souhrny po dnech)
+def _index_stav_datum(cursor):
+    _pridat_index(cursor, "ukoly", "ix_ukoly_stav_datum", "stav, datum_vytvoreni")
+
+# migrace 4: tabulka čítačů úkolů podle stavu pro souhrn (souhrn.py) – pro každý stav SLOTY_CITACU řádků (slotů),
+# naplní se skutečnými počty z tabulky 'ukoly'; při opakování kroku se čítače jen znovu přepočtou
+def _tabulka_citace(cursor):
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS ukoly_citace (
+            stav {dialekt(cursor).vycet("stav", STAVY_UKOLU)} NOT NULL,
+            slot TINYINT UNSIGNED NOT NULL,
+            pocet INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (stav, slot)
+        )
+    ''')
+    cursor.execute("SELECT stav, COUNT(*) FROM ukoly GROUP BY stav")
+    prepsat_citace(cursor, dict(cursor.fetchall()))
+
+# migrace 5: index názvu pro náhradní hledání podle začátku názvu (nazev LIKE 'výraz%' ORDER BY nazev, viz hledani.py)
+def _index_nazev(cursor):
+    _pridat_index(cursor, "ukoly", "ix_ukoly_nazev", "nazev")
+
+# migrace 6: FULLTEXT index pro vyhledávání v názvu a popisu (MATCH (nazev, popis) AGAINST ..., viz hledani.py)
+def _fulltext_nazev_popis(cursor):
+    _pridat_fulltext(cursor, "ukoly", "ft_ukoly_nazev_popis", "nazev, popis")
+
+# migrace 7: archiv dokončených úkolů (archiv.py) – stejné sloupce jako 'ukoly' (id se zachovává) a čas archivace
+def _tabulka_archiv(cursor):
+    d = dialekt(cursor)
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS ukoly_archiv (
+            id INT PRIMARY KEY,
+            nazev {d.text("nazev", 30)} NOT NULL,
+            popis {d.text("popis", 100)} NOT NULL,
+            stav {d.vycet("stav", STAVY_UKOLU)} NOT NULL,
+            datum_vytvoreni DATE,
+            archivovano DATETIME NOT NULL
+        )
+    ''')
+
+# migrace 8: pozice paralelního importu (paralelni_import.py) – pro každou část vstupního souboru
+# (klíč importu, začátek části) bajtová pozice, do které jsou řádky vložené a potvrzené, a počty řádků;
+# po pádu importu se v části pokračuje od pozice
+def _tabulka_import(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ukoly_import (
+            klic CHAR(40) NOT NULL,
+            zacatek BIGINT NOT NULL,
+            konec BIGINT NOT NULL,
+            pozice BIGINT NOT NULL,
+            radku INT NOT NULL DEFAULT 0,
+            vlozeno INT NOT NULL DEFAULT 0,
+            odmitnuto INT NOT NULL DEFAULT 0,
+            PRIMARY KEY (klic, zacatek)
+        )
+    ''')
+
+# migrace 9: čas poslední změny úkolu pro přehled změn (zmeny.py) – MySQL ho nastavuje sám při každém vložení a změně
+# řádku (DEFAULT / ON UPDATE CURRENT_TIMESTAMP, v SQLite triggery), existující úkoly dostanou čas migrace;
+# index (upraveno, id) pro čtení změn od značky
+def _sloupec_upraveno(cursor):
+    d = dialekt(cursor)
+    if not d.sloupec_existuje(cursor, "ukoly", "upraveno"):
+        d.pridat_cas_zmeny(cursor, "ukoly", "upraveno")
+    _pridat_index(cursor, "ukoly", "ix_ukoly_upraveno", "upraveno, id")
+
+# migrace 10: záznamy o smazaných úkolech (zmeny.py) – id a čas smazání, index (smazano, id) pro čtení smazání od značky
+def _tabulka_smazane(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ukoly_smazane (
+            id INT PRIMARY KEY,
+            smazano DATETIME(6) NOT NULL
+        )
+    ''')
+    _pridat_index(cursor, "ukoly_smazane", "ix_ukoly_smazane_smazano", "smazano, id")
+
+# migrace 11: vlastní klíč archivu (archiv_id) místo id úkolu – MySQL 5.7 po restartu přidělí AUTO_INCREMENT
+# znovu od max(id) + 1, id archivovaného úkolu se tak může opakovat a archivace stejného id by skončila chybou
+# duplicitního klíče; archivovaný úkol se dál hledá podle id (index, nejnovější záznam)
+def _klic_archivu(cursor):
+    d = dialekt(cursor)
+    if not d.sloupec_existuje(cursor, "ukoly_archiv", "archiv_id"):
+        d.pridat_nahradni_klic(cursor, "ukoly_archiv", "archiv_id")
+    _pridat_index(cursor, "ukoly_archiv", "ix_ukoly_archiv_id", "id")
+
+
+# seznam migrací: (verze, popis, funkce); nové migrace se přidávají pouze na konec s vyšším číslem verze
+MIGRACE = [
+    (1, "tabulka ukoly", _vytvorit_tabulku_ukoly),
+    (2, "index ukoly(stav, id)", _index_stav_id),
+    (3, "index ukoly(stav, datum_vytvoreni)", _index_stav_datum),
+    (4, "tabulka ukoly_citace", _tabulka_citace),
+    (5, "index ukoly(nazev)", _index_nazev),
+    (6, "fulltext ukoly(nazev, popis)", _fulltext_nazev_popis),
+    (7, "tabulka ukoly_archiv", _tabulka_archiv),
+    (8, "tabulka ukoly_import", _tabulka_import),
+    (9, "sloupec ukoly.upraveno a index (upraveno, id)", _sloupec_upraveno),
+    (10, "tabulka ukoly_smazane", _tabulka_smazane),
+    (11, "klíč ukoly_archiv(archiv_id) a index (id)", _klic_archivu),
+]
+
+
+# 2) Aplikace migrací
+# funkce aplikuje všechny dosud neaplikované migrace v pořadí podle čísla verze;
+# každá migrace se po úspěšném provedení zapíše do tabulky 'schema_verze' (verze, popis, čas aplikace);
+# funkce vrací seznam čísel nově aplikovaných verzí ([] = schéma je aktuální) nebo False při chybě;
+# při chybě se další migrace už neprovádějí, dříve aplikované zůstávají zapsané
+def aplikovat_migrace(conn, migrace=MIGRACE):
+    aplikovane = []
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                # zámek proti souběžným migracím z více procesů (např. start více instancí aplikace)
+                d = dialekt(conn)
+                if not d.ziskat_zamek(cursor, ZAMEK_MIGRACE, CEKANI_NA_ZAMEK):
+                    print("Migrace právě provádí jiný proces, zámek se nepodařilo získat.")
+                    return False
+
+                try:
+                    cursor.execute(f'''
+                        CREATE TABLE IF NOT EXISTS schema_verze (
+                            verze INT PRIMARY KEY,
+                            popis {d.text("popis", 200)} NOT NULL,
+                            aplikovano DATETIME NOT NULL
+                        )
+                    ''')
+                    cursor.execute("SELECT verze FROM schema_verze")
+                    hotove = {radek[0] for radek in cursor.fetchall()}
+
+                    for verze, popis, krok in sorted(migrace, key=lambda m: m[0]):
+                        if verze in hotove:
+                            continue
+                        krok(cursor)
+                        cursor.execute("INSERT INTO schema_verze (verze, popis, aplikovano) VALUES (%s, %s, NOW())",
+                                       (verze, popis))
+                        conn.commit()
+                        aplikovane.append(verze)
+                        print(f"Migrace {verze} ({popis}) byla aplikována.")
+                finally:
+                    d.uvolnit_zamek(cursor, ZAMEK_MIGRACE)
+            finally:
+                cursor.close()
+        return aplikovane
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při migraci schématu databáze: {err}")
+        return False
+
+
+# 3) Pomocné funkce pro kroky migrací
+# přidání indexu, pouze pokud index s daným názvem ještě neexistuje (idempotentní krok);
+# způsob vytvoření (v MySQL online – ALGORITHM=INPLACE, LOCK=NONE) určuje dialekt kurzoru
+def _pridat_index(cursor, tabulka, nazev_indexu, sloupce):
+    d = dialekt(cursor)
+    if not d.index_existuje(cursor, tabulka, nazev_indexu):
+        d.pridat_index(cursor, tabulka, nazev_indexu, sloupce)
+
+# přidání FULLTEXT indexu, pouze pokud ještě neexistuje; v MySQL jsou po dobu vytváření povolena jen čtení
+# (LOCK=SHARED), backend bez FULLTEXT indexu (SQLite) krok přeskočí
+def _pridat_fulltext(cursor, tabulka, nazev_indexu, sloupce):
+    d = dialekt(cursor)
+    if not d.index_existuje(cursor, tabulka, nazev_indexu):
+        d.pridat_fulltext(cursor, tabulka, nazev_indexu, sloupce)
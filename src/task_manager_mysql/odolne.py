@@ -0,0 +1,273 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: odolné připojení (ping po nečinnosti, znovupřipojení)
+-------------------------------------------------------------------------------------------
+Popis:
+Hlavní menu drží jedno připojení otevřené po celou dobu běhu programu. Server nečinné
+připojení po čase zavře (wait_timeout) a každá další DB funkce by pak jen vracela False.
+OdolnePripojeni se předává místo conn a připojení udržuje živé:
+
+    • kontrola_po   – připojení nečinné déle než kontrola_po sekund se před dalším
+                      použitím ověří pingem; nefunkční připojení se nahradí novým
+    • opakování     – čtecí dotaz (SELECT, SHOW) přerušený ztrátou připojení nebo vypršením
+                      čekání na zámek se zopakuje (po ztrátě na novém připojení); zápisy se
+                      neopakují – zopakovaný zápis by se mohl provést dvakrát
+    • backoff       – před opakováním a dalším pokusem o připojení se čeká náhodnou dobu
+                      z intervalu 0 až zaklad_ms, 2 · zaklad_ms, 4 · zaklad_ms, ... (nejvýše
+                      max_ms), aby se klienti po výpadku serveru nepřipojovali všichni naráz
+    • rozpočet      – všechna opakování procesu čerpají ze společného rozpočtu (RozpocetOpakovani,
+                      doplňuje se průběžně); vyčerpaný rozpočet opakování zastaví, DB funkce
+                      pak vrátí False jako bez odolného připojení
+
+Rozpracovaná transakce se po ztrátě připojení neobnovuje: dotaz po zápisu bez commitu
+nebo ve vnější transakci (transakce.py) chybu propustí a nové připojení se naváže až
+při dalším použití.
+
+Nastavení z .env (nepovinné): DB_PING_AFTER, DB_RETRY_ATTEMPTS, DB_RETRY_BACKOFF_MS,
+DB_RETRY_BACKOFF_MAX_MS, DB_RETRY_BUDGET.
+==============================================================================================
+"""
+
+import os
+import threading
+import time
+
+from .metriky import _typ_prikazu, zaznamenat_pripojeni
+from .ovladac import mysql
+from .pool import _zavrit_tise, pripojit
+
+# chyby klienta po ztrátě připojení k serveru (nelze se připojit, server odešel, spojení ztraceno)
+CHYBY_SPOJENI = (2002, 2003, 2006, 2013, 2055)
+# přechodné chyby, po kterých stačí příkaz zopakovat na stejném připojení (vypršelo čekání na zámek)
+CHYBY_PRECHODNE = (1205,)
+# příkazy, jejichž opakování nemůže nic změnit dvakrát
+PRIKAZY_CTENI = ("SELECT", "SHOW")
+
+
+# 1) Rozpočet opakování – společný pro všechna odolná připojení procesu
+# kapacita = nejvýše tolik opakování naráz, doplneni = počet opakování, která přibudou za sekundu;
+# po výpadku serveru tak proces opakuje jen omezeně, místo aby každé volání zkoušelo znovu
+class RozpocetOpakovani:
+    def __init__(self, kapacita=10, doplneni=0.5):
+        self._zamek = threading.Lock()
+        self.nastavit(kapacita, doplneni)
+
+    def nastavit(self, kapacita=None, doplneni=None):
+        with self._zamek:
+            if kapacita is not None:
+                if kapacita < 0:
+                    raise ValueError("Kapacita rozpočtu opakování nesmí být záporná.")
+                self.kapacita = kapacita
+                self._zbyva = float(kapacita)
+                self._doplneno = time.monotonic()
+            if doplneni is not None:
+                self.doplneni = doplneni
+
+    # vrací True (opakování povoleno, rozpočet se snížil o 1) nebo False (rozpočet vyčerpán)
+    def cerpat(self):
+        with self._zamek:
+            ted = time.monotonic()
+            self._zbyva = min(self.kapacita, self._zbyva + (ted - self._doplneno) * self.doplneni)
+            self._doplneno = ted
+            if self._zbyva < 1:
+                return False
+            self._zbyva -= 1
+            return True
+
+    @property
+    def zbyva(self):
+        return int(self._zbyva)
+
+rozpocet_opakovani = RozpocetOpakovani()
+_rozpocet_nastaven = False      # kapacita z DB_RETRY_BUDGET se nastaví jen při prvním odolném připojení
+
+
+# 2) Odolné připojení
+# parametry = slovník z parametry_pripojeni(); připojení se naváže hned
+# (chyba připojení se propustí jako mysql.connector.Error);
+# ostatní atributy a metody (connection_id, is_connected, database, ...) se předávají aktuálnímu připojení
+class OdolnePripojeni:
+    def __init__(self, parametry, kontrola_po=30.0, pokusy=3, zaklad_ms=100, max_ms=2000, rozpocet=None):
+        if pokusy < 1:
+            raise ValueError("Počet pokusů musí být alespoň 1.")
+        self.parametry = dict(parametry)
+        self.kontrola_po = kontrola_po
+        self.pokusy = pokusy
+        self.zaklad_ms = zaklad_ms
+        self.max_ms = max_ms
+        self.rozpocet = rozpocet if rozpocet is not None else rozpocet_opakovani
+        self.znovupripojeni = 0         # počet nahrazení ztraceného připojení novým
+        self._zapis = False             # od posledního commit / rollback proběhl zápis (nebo běží vnější transakce)
+        self._ztraceno = False          # poslední chyba byla ztráta připojení – další použití naváže nové bez pingu
+        self._zavreno = False
+        self._conn = self._pripojit()
+        self._pouzito = time.monotonic()
+
+    def __getattr__(self, nazev):
+        if "_conn" not in self.__dict__:
+            raise AttributeError(nazev)
+        return getattr(self.__dict__["_conn"], nazev)
+
+    # kurzor aktuálního připojení; mimo rozpracovaný zápis se ztracené připojení nahradí novým
+    # i při chybě vytvoření kurzoru
+    def cursor(self, **parametry):
+        if self._zavreno:
+            raise mysql.connector.errors.OperationalError(msg="Odolné připojení je uzavřené.")
+        self._zajistit()
+        try:
+            cursor = self._conn.cursor(**parametry)
+        except mysql.connector.Error as err:
+            if self._zapis or not self._je_ztrata(err):
+                raise
+            self._obnovit()
+            cursor = self._conn.cursor(**parametry)
+        return _OdolnyKurzor(self, cursor, parametry)
+
+    def start_transaction(self, *args, **kwargs):
+        self._conn.start_transaction(*args, **kwargs)
+        self._zapis = True
+
+    def commit(self):
+        self._conn.commit()
+        self._zapis = False
+
+    # rollback ztraceného připojení se nehlásí jako chyba – server rozpracovanou transakci odvolal už při ztrátě spojení
+    def rollback(self):
+        try:
+            self._conn.rollback()
+        except mysql.connector.Error as err:
+            if not self._je_ztrata(err):
+                raise
+            self._ztraceno = True
+        finally:
+            self._zapis = False
+
+    def close(self):
+        self._zavreno = True
+        self._conn.close()
+
+    disconnect = close
+
+    # a) kontrola před použitím – připojení nečinné déle než kontrola_po se ověří pingem, ztracené se nahradí novým;
+    # během rozpracovaného zápisu se připojení nenahrazuje (zápis by se ztratil bez chyby)
+    def _zajistit(self):
+        ted = time.monotonic()
+        if not self._zapis and (self._ztraceno or ted - self._pouzito >= self.kontrola_po) and not self._odpovida():
+            self._obnovit()
+        self._pouzito = ted
+
+    # ověření pingem (bez znovupřipojení ovladačem – nové připojení navazuje _obnovit())
+    def _odpovida(self):
+        if self._ztraceno:
+            return False
+        try:
+            self._conn.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    # b) nahrazení ztraceného připojení novým; chyba posledního pokusu se propustí
+    def _obnovit(self):
+        _zavrit_tise(self._conn)
+        self._conn = self._pripojit()
+        self._ztraceno = False
+        self._zapis = False
+        self.znovupripojeni += 1
+
+    def _pripojit(self):
+        pokus = 0
+        while True:
+            zacatek = time.perf_counter()
+            try:
+                conn = pripojit(self.parametry)
+            except mysql.connector.Error as err:
+                zaznamenat_pripojeni(time.perf_counter() - zacatek, err)
+                pokus += 1
+                if err.errno not in CHYBY_SPOJENI or not self._cekat(pokus):     # např. chybné heslo se neopakuje
+                    raise
+                continue
+            zaznamenat_pripojeni(time.perf_counter() - zacatek)
+            return conn
+
+    # c) rozhodnutí o opakování: vrací False, pokud jsou pokusy nebo rozpočet vyčerpané,
+    # jinak počká dobu backoffu a vrací True
+    def _cekat(self, pokus):
+        if pokus >= self.pokusy or not self.rozpocet.cerpat():
+            return False
+        import random                   # jen při opakování – import random by zpomaloval každé spuštění programu
+        time.sleep(random.uniform(0, min(self.max_ms, self.zaklad_ms * 2 ** (pokus - 1))) / 1000)
+        return True
+
+    def _je_ztrata(self, err):
+        if err.errno in CHYBY_SPOJENI:
+            return True
+        try:
+            return not self._conn.is_connected()
+        except (mysql.connector.Error, AttributeError):
+            return True
+
+
+# 3) Kurzor odolného připojení – čtecí dotaz po ztrátě připojení nebo vypršení zámku zopakuje;
+# kurzor se může používat opakovaně (sdílený kurzor připraveného příkazu, viz pripravene.py), proto se před každým
+# příkazem připojení zkontroluje a po jeho nahrazení se kurzor vytvoří znovu na novém připojení
+class _OdolnyKurzor:
+    def __init__(self, pripojeni, cursor, parametry):
+        self._pripojeni = pripojeni
+        self._kurzor = cursor
+        self._parametry = parametry
+        self._conn = pripojeni._conn
+
+    def execute(self, sql, *args, **kwargs):
+        return self._provest("execute", sql, args, kwargs)
+
+    def executemany(self, sql, *args, **kwargs):
+        return self._provest("executemany", sql, args, kwargs)
+
+    def _provest(self, metoda, sql, args, kwargs):
+        pripojeni = self._pripojeni
+        pripojeni._zajistit()
+        if self._conn is not pripojeni._conn:
+            self._novy_kurzor()
+        opakovat = not pripojeni._zapis and _typ_prikazu(sql) in PRIKAZY_CTENI
+        if not opakovat:
+            pripojeni._zapis = True
+        pokus = 0
+        while True:
+            try:
+                return getattr(self._kurzor, metoda)(sql, *args, **kwargs)
+            except mysql.connector.Error as err:
+                ztraceno = pripojeni._je_ztrata(err)
+                pokus += 1
+                if not opakovat or not (ztraceno or err.errno in CHYBY_PRECHODNE) or not pripojeni._cekat(pokus):
+                    pripojeni._ztraceno = pripojeni._ztraceno or ztraceno
+                    raise
+                if ztraceno:
+                    pripojeni._obnovit()
+                    self._novy_kurzor()
+
+    def _novy_kurzor(self):
+        self._conn = self._pripojeni._conn
+        self._kurzor = self._conn.cursor(**self._parametry)
+
+    def __iter__(self):
+        return iter(self._kurzor)
+
+    def __getattr__(self, nazev):
+        return getattr(self._kurzor, nazev)
+
+
+# 4) Odolné připojení s nastavením z .env
+# parametry = slovník z parametry_pripojeni(); společný rozpočet opakování se nastaví podle DB_RETRY_BUDGET
+# jen při prvním volání – nové připojení (např. po výpadku serveru) nesmí vyčerpaný rozpočet znovu naplnit
+def odolne_pripojeni(parametry):
+    global _rozpocet_nastaven
+    if not _rozpocet_nastaven:
+        rozpocet_opakovani.nastavit(kapacita=int(os.getenv("DB_RETRY_BUDGET", "10")))
+        _rozpocet_nastaven = True
+    return OdolnePripojeni(
+        parametry,
+        kontrola_po=float(os.getenv("DB_PING_AFTER", "30")),
+        pokusy=int(os.getenv("DB_RETRY_ATTEMPTS", "3")),
+        zaklad_ms=float(os.getenv("DB_RETRY_BACKOFF_MS", "100")),
+        max_ms=float(os.getenv("DB_RETRY_BACKOFF_MAX_MS", "2000")),
+    )
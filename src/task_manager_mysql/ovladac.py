@@ -0,0 +1,116 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: odložené načtení ovladače MySQL a proměnných prostředí
+-------------------------------------------------------------------------------------------
+Popis:
+Import balíčku task_manager_mysql nenačítá ovladač mysql.connector ani soubor .env – obojí
+se načte až při prvním připojení k databázi. Spuštění programu nebo testů, které DB
+nepoužijí, tak neplatí čas importu ovladače.
+
+    • mysql          – balíček mysql, jehož modul mysql.connector se načte (lazy) až při
+                       prvním přístupu k jeho atributu (mysql.connector.connect, .Error, ...);
+                       moduly balíčku ho importují místo "import mysql.connector"
+    • nacist_prostredi() – jednorázové načtení .env (python-dotenv) a nastavení z něj
+                       (cache výpisů, měření SQL dotazů, připravené příkazy, čítače souhrnu,
+                       výpis úkolů); volá ho
+                       parametry_pripojeni() před sestavením parametrů připojení
+    • cisty_python() – volba implementace ovladače podle DB_DRIVER v .env:
+                       auto (výchozí – C rozšíření, pokud je nainstalováno, jinak čistý Python),
+                       cext (vždy C rozšíření), pure (vždy čistý Python)
+    • zvoleny_backend() – volba databáze podle DB_BACKEND v .env: mysql (výchozí – MySQL
+                       server), sqlite (vestavěná databáze bez serveru, viz embedded_db.py)
+==============================================================================================
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+
+import mysql    # samotný balíček mysql je prázdný jmenný prostor, import je okamžitý
+
+
+# 1) Odložený import mysql.connector – modul se zaregistruje v sys.modules
+# a spustí se až při prvním přístupu k atributu;
+# pokud už byl importován (např. jiným kódem programu), použije se beze změny
+def _odlozeny_import(nazev):
+    if nazev in sys.modules:
+        return sys.modules[nazev]
+    spec = importlib.util.find_spec(nazev)
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    modul = importlib.util.module_from_spec(spec)
+    sys.modules[nazev] = modul
+    spec.loader.exec_module(modul)
+    return modul
+
+mysql.connector = _odlozeny_import("mysql.connector")
+
+
+# 2) Proměnné prostředí z .env a nastavení, která z nich vycházejí – provede se jen jednou za běh procesu
+_nacteno = False
+_zamek = threading.Lock()
+
+def nacist_prostredi():
+    global _nacteno
+    if _nacteno:
+        return
+    with _zamek:
+        if _nacteno:
+            return
+        # funkce load_dotenv() z knihovny python-dotenv načítá proměnné prostředí ze souboru .env;
+        # slouží k bezpečnému uložení přihlašovacích údajů (k MySQL) a umožňuje sdílení kódu bez citlivých dat
+        from dotenv import load_dotenv      # import vyžaduje instalaci knihovny python-dotenv (pro nastavení prostředí)
+        load_dotenv()
+
+        from .cache import cache_vypisu
+        from .metriky import zapnout_metriky
+        from .pripravene import nastavit_pripravene
+        from .souhrn import nastavit_citace
+        from .vypis import nastavit_vypis
+
+        # nastavení cache výpisů úkolů (velikost, TTL v sekundách; CACHE_TTL=0 cache vypíná)
+        cache_vypisu.nastavit(max_polozek=int(os.getenv("CACHE_MAX_SIZE", "128")),
+                              ttl=float(os.getenv("CACHE_TTL", "5")))
+
+        # měření SQL dotazů (DB_METRICS=1 zapíná, práh pomalých dotazů DB_SLOW_QUERY_MS v ms), viz metriky.py
+        if os.getenv("DB_METRICS", "0") == "1":
+            zapnout_metriky(prah_pomalych_ms=float(os.getenv("DB_SLOW_QUERY_MS", "100")))
+
+        # připravené SQL příkazy (binární protokol) – DB_PREPARED_STATEMENTS=0 vrací textový protokol
+        nastavit_pripravene(os.getenv("DB_PREPARED_STATEMENTS", "1") == "1")
+
+        # čítače úkolů podle stavu pro souhrn (souhrn.py) – nepovinné, DB_STATUS_COUNTERS=1 je zapíná;
+        # bez nich se souhrn počítá GROUP BY nad tabulkou 'ukoly' a zápisy úkolů čítače neupravují
+        nastavit_citace(os.getenv("DB_STATUS_COUNTERS", "0") == "1")
+
+        # výpis úkolů (vypis.py) – velikost stránky a tichý režim pro skripty; nastavují se jen proměnné uvedené v .env
+        if os.getenv("UI_PAGE_SIZE"):
+            nastavit_vypis(velikost_stranky=int(os.getenv("UI_PAGE_SIZE")))
+        if os.getenv("UI_QUIET"):
+            nastavit_vypis(tichy=os.getenv("UI_QUIET") == "1")
+        _nacteno = True
+
+
+# 3) Volba implementace ovladače – vrací hodnotu parametru use_pure pro mysql.connector.connect();
+# neplatná hodnota DB_DRIVER nebo DB_DRIVER=cext bez nainstalovaného C rozšíření vyvolá ValueError
+def cisty_python():
+    volba = os.getenv("DB_DRIVER", "auto").strip().lower()
+    if volba == "pure":
+        return True
+    if volba == "cext":
+        if not mysql.connector.HAVE_CEXT:
+            raise ValueError("DB_DRIVER=cext: C rozšíření mysql-connector-python není k dispozici.")
+        return False
+    if volba == "auto":
+        return not mysql.connector.HAVE_CEXT
+    raise ValueError(f"Neplatná hodnota DB_DRIVER='{volba}' (povolené hodnoty: auto, cext, pure).")
+
+
+# 4) Volba backendu – vrací "mysql" nebo "sqlite" dle DB_BACKEND; neplatná hodnota vyvolá ValueError
+BACKENDY = ("mysql", "sqlite")
+
+def zvoleny_backend():
+    volba = os.getenv("DB_BACKEND", "mysql").strip().lower()
+    if volba not in BACKENDY:
+        raise ValueError(f"Neplatná hodnota DB_BACKEND='{volba}' (povolené hodnoty: {', '.join(BACKENDY)}).")
+    return volba
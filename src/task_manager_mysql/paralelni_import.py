@@ -0,0 +1,263 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: paralelní import velkých souborů (více procesů)
+-------------------------------------------------------------------------------------------
+Popis:
+Import úkolů ze souboru CSV / JSONL ve více procesech – pro soubory s miliony řádků,
+u kterých jeden proces s jedním připojením (importovat_ukoly() v prenos.py) nestačí.
+
+    • soubor se rozdělí na části po velikost_casti bajtů zarovnané na začátky řádků
+      (CSV nesmí mít konce řádků uvnitř hodnot v uvozovkách)
+    • části zpracovává pool procesů (concurrent.futures.ProcessPoolExecutor) –
+      každý proces má vlastní připojení, čte a validuje řádky své části a vkládá je
+      po dávkách stejně jako pridat_ukoly_db() (víceřádkový INSERT, při odmítnutí dávky
+      po jednom řádku)
+    • každá dávka se potvrzuje jednou transakcí spolu s pozicí v části (tabulka
+      ukoly_import, migrace 8), proto import po pádu (procesu, serveru, přerušení)
+      pokračuje od poslední potvrzené dávky – žádný řádek se nevloží dvakrát
+      ani nevynechá; pozice se po úspěšném dokončení importu smažou
+
+Klíč importu tvoří cesta, velikost a čas změny souboru, formát a velikost části;
+změněný soubor se importuje znovu od začátku. Chyby řádků z dávek potvrzených
+před pádem se při navázání znovu nehlásí (počet odmítnutých řádků ano).
+==============================================================================================
+"""
+
+import csv
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from .cache import cache_vypisu
+from .metriky import kurzor
+from .ovladac import mysql, nacist_prostredi
+from .pool import pripojit, spojeni
+from .prenos import Prubeh, _cist_csv, _cist_jsonl, urcit_format
+from .task_manager_mysql_p2 import _validace_ukolu, _vlozit_davku
+from .transakce import _potvrdit, vnejsi_transakce
+
+VELIKOST_CASTI = 16 * 1024 * 1024       # výchozí velikost jedné části souboru (bajty)
+
+SQL_POSUNOUT_POZICI = (
+    "UPDATE ukoly_import SET pozice = %s, radku = radku + %s, vlozeno = vlozeno + %s, odmitnuto = odmitnuto + %s "
+    "WHERE klic = %s AND zacatek = %s"
+)
+
+_conn_procesu = None                    # připojení pracovního procesu (otevírá _inicializovat_proces)
+
+
+# 1) Rozdělení souboru na části
+# funkce vrací dvojici (hlavička CSV nebo None, seznam dvojic (začátek, konec) v bajtech); části pokrývají celý soubor
+# za hlavičkou, každá začíná na začátku řádku
+def rozdelit_soubor(cesta, format, velikost_casti=VELIKOST_CASTI):
+    if velikost_casti < 1:
+        raise ValueError("Parametr velikost_casti musí být alespoň 1.")
+    with open(cesta, "rb") as soubor:
+        hlavicka = None
+        if format == "csv":
+            hlavicka = next(csv.reader([soubor.readline().decode("utf-8-sig")]), None)
+        velikost = os.fstat(soubor.fileno()).st_size
+        hranice = [soubor.tell()]
+        while hranice[-1] < velikost:
+            soubor.seek(hranice[-1] + velikost_casti - 1)
+            soubor.readline()                       # dočtení rozpracovaného řádku – další část začíná na novém řádku
+            hranice.append(min(soubor.tell(), velikost))
+    return hlavicka, list(zip(hranice, hranice[1:]))
+
+# klíč importu v tabulce ukoly_import – stejný soubor (cesta, velikost, čas změny) rozdělený stejně
+def _klic_importu(cesta, format, velikost_casti):
+    info = os.stat(cesta)
+    text = f"{os.path.abspath(cesta)}|{info.st_size}|{info.st_mtime_ns}|{format}|{velikost_casti}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# 2) Paralelní import
+# cesta = soubor CSV (hlavička nazev,popis) nebo JSONL; conn = připojení nebo PoolDB pro pozice importu (a pro import
+# při procesu=1); parametry = parametry_pripojeni() pro připojení pracovních procesů (výchozí conn.parametry u PoolDB
+# a OdolnePripojeni); procesu = počet procesů (výchozí počet CPU, 1 = bez procesů v tomto procesu);
+# navazat=False zahodí pozice nedokončeného importu stejného souboru a importuje ho znovu od začátku;
+# funkce vrací dvojici (počet vložených úkolů celého souboru, seznam chyb (pořadí řádku dat od 0, popis)) stejně jako
+# importovat_ukoly(), nebo False při technické chybě (potvrzené dávky zůstávají uložené, nové spuštění naváže)
+def importovat_paralelne(cesta, conn, parametry=None, format=None, procesu=None, batch_size=1000,
+                         velikost_casti=VELIKOST_CASTI, navazat=True, prubeh=None):
+    format = urcit_format(cesta, format)
+    procesu = procesu or os.cpu_count() or 1
+    if batch_size < 1 or procesu < 1:
+        raise ValueError("Parametry batch_size a procesu musí být alespoň 1.")
+    parametry = parametry if parametry is not None else getattr(conn, "parametry", None)
+    if procesu > 1 and parametry is None:
+        raise ValueError("Pro import ve více procesech je nutné zadat parametry připojení (parametry_pripojeni()).")
+    prubeh = prubeh if prubeh is not None else Prubeh("Paralelní import")
+
+    try:
+        hlavicka, casti = rozdelit_soubor(cesta, format, velikost_casti)
+        klic = _klic_importu(cesta, format, velikost_casti)
+        stav = _pripravit_pozice(conn, klic, casti, navazat)
+    except (OSError, mysql.connector.Error) as err:
+        print(f"Chyba při přípravě paralelního importu: {err}")
+        return False
+
+    # a) zpracování nedokončených částí – v procesech, nebo v tomto procesu
+    ulohy = [(format, hlavicka, str(cesta), klic, zacatek, stav[zacatek][0], konec, batch_size)
+             for zacatek, konec in casti if stav[zacatek][0] < konec]
+    vysledky = {}
+    chyba = None
+    try:
+        if procesu == 1 or len(ulohy) <= 1:
+            with spojeni(conn) as spojeni_db:
+                for uloha in ulohy:
+                    vysledek = _nacist_cast(spojeni_db, *uloha)
+                    vysledky[uloha[4]] = vysledek
+                    prubeh.pridat(vysledek[0])
+                    if vysledek[3]:
+                        break
+        else:
+            with ProcessPoolExecutor(max_workers=min(procesu, len(ulohy)), initializer=_inicializovat_proces,
+                                     initargs=(parametry,)) as pool:
+                budouci = {pool.submit(_nacist_cast_v_procesu, *uloha): uloha[4] for uloha in ulohy}
+                for hotovo in as_completed(budouci):
+                    vysledek = hotovo.result()
+                    vysledky[budouci[hotovo]] = vysledek
+                    prubeh.pridat(vysledek[0])
+    except BrokenProcessPool as err:
+        chyba = f"pracovní proces skončil neočekávaně ({err})"
+    finally:
+        prubeh.dokoncit()
+        cache_vypisu.zneplatnit(conn, stavy=("nezahájeno",))
+    chyba = chyba or next((vysledek[3] for vysledek in vysledky.values() if vysledek[3]), None)
+    if chyba or len(vysledky) < len(ulohy):
+        print(f"Chyba při paralelním importu: {chyba}. Potvrzené dávky zůstávají uložené, "
+              "nové spuštění importu stejného souboru naváže.")
+        return False
+
+    # b) souhrn – pořadí chybných řádků v rámci celého souboru (části před nimi podle počtu jejich řádků)
+    vlozeno = odmitnuto = radku_pred = 0
+    chyby = []
+    for zacatek, _ in casti:
+        _, radku, vlozeno_pred, odmitnuto_pred = stav[zacatek]
+        radku_casti, vlozeno_casti, chyby_casti, _ = vysledky.get(zacatek, (0, 0, [], None))
+        chyby.extend((radku_pred + radku + poradi, text) for poradi, text in chyby_casti)
+        vlozeno += vlozeno_pred + vlozeno_casti
+        odmitnuto += odmitnuto_pred + len(chyby_casti)
+        radku_pred += radku + radku_casti
+
+    try:
+        _smazat_pozice(conn, klic)
+    except mysql.connector.Error as err:
+        print(f"Pozice dokončeného importu se nepodařilo smazat: {err}")
+    print(f"Paralelně přidáno úkolů: {vlozeno}, odmítnuto řádků: {odmitnuto}.")
+    return vlozeno, chyby
+
+
+# 3) Pozice importu (tabulka ukoly_import)
+# funkce vrací slovník {začátek části: [pozice, řádků, vloženo, odmítnuto]};
+# chybějící části se založí s pozicí na začátku
+def _pripravit_pozice(conn, klic, casti, navazat):
+    with spojeni(conn) as spojeni_db:
+        cursor = kurzor(spojeni_db)
+        try:
+            if not navazat:
+                cursor.execute("DELETE FROM ukoly_import WHERE klic = %s", (klic,))
+            cursor.execute(
+                "SELECT zacatek, pozice, radku, vlozeno, odmitnuto FROM ukoly_import WHERE klic = %s", (klic,))
+            stav = {radek[0]: list(radek[1:]) for radek in cursor.fetchall()}
+            nove = [(klic, zacatek, konec, zacatek) for zacatek, konec in casti if zacatek not in stav]
+            if nove:
+                cursor.executemany(
+                    "INSERT INTO ukoly_import (klic, zacatek, konec, pozice) VALUES (%s, %s, %s, %s)", nove)
+            _potvrdit(spojeni_db)
+        finally:
+            cursor.close()
+    if stav and len(nove) < len(casti):
+        zpracovano = sum(radek[1] for radek in stav.values())
+        print(f"Import navazuje na předchozí nedokončený import ({zpracovano} řádků zpracováno).")
+    for _, zacatek, _, pozice in nove:
+        stav[zacatek] = [pozice, 0, 0, 0]
+    return stav
+
+def _smazat_pozice(conn, klic):
+    with spojeni(conn) as spojeni_db:
+        cursor = kurzor(spojeni_db)
+        try:
+            cursor.execute("DELETE FROM ukoly_import WHERE klic = %s", (klic,))
+            _potvrdit(spojeni_db)
+        finally:
+            cursor.close()
+
+
+# 4) Zpracování jedné části souboru
+# funkce vrací čtveřici (počet zpracovaných řádků, počet vložených úkolů, seznam chyb (pořadí řádku od pozice, popis),
+# popis technické chyby nebo None); každá dávka se potvrdí jednou transakcí spolu s novou pozicí v části
+def _nacist_cast(conn, format, hlavicka, cesta, klic, zacatek, pozice, konec, batch_size):
+    radku = vlozeno = 0
+    chyby = []
+    try:
+        with open(cesta, "rb") as soubor:
+            cteni = _Cteni(soubor, pozice, konec)
+            zaznamy = _cist_csv(cteni, hlavicka) if format == "csv" else _cist_jsonl(cteni)
+            cursor = kurzor(conn)
+            try:
+                davka, radku_davky, chyb_davky = [], 0, 0
+                for zaznam, chyba in zaznamy:
+                    poradi = radku + radku_davky
+                    radku_davky += 1
+                    chyba = chyba or _validace_ukolu(zaznam)
+                    if chyba:
+                        chyby.append((poradi, chyba))
+                        chyb_davky += 1
+                    else:
+                        davka.append((poradi, zaznam))
+                    if len(davka) >= batch_size:
+                        vlozeno += _potvrdit_davku(conn, cursor, davka, chyby, cteni.pozice,
+                                                   radku_davky, chyb_davky, klic, zacatek)
+                        radku += radku_davky
+                        davka, radku_davky, chyb_davky = [], 0, 0
+                vlozeno += _potvrdit_davku(conn, cursor, davka, chyby, konec, radku_davky, chyb_davky, klic, zacatek)
+                radku += radku_davky
+            finally:
+                cursor.close()
+        return radku, vlozeno, chyby, None
+
+    except (OSError, ValueError, mysql.connector.Error) as err:     # ValueError = i chybné kódování souboru
+        return radku, vlozeno, chyby, str(err)
+
+# vložení dávky a posun pozice v jedné transakci
+# (vnější transakce – _vlozit_davku místo commitu jen posune bod uložení);
+# vrací počet vložených úkolů; chyby řádků odmítnutých databází připíše do seznamu chyby
+def _potvrdit_davku(conn, cursor, davka, chyby, pozice, radku, chyb_cteni, klic, zacatek):
+    chyb_pred = len(chyby)
+    with vnejsi_transakce(conn, potvrdit=True):
+        vlozeno = _vlozit_davku(davka, conn, cursor, chyby) if davka else 0
+        odmitnuto = chyb_cteni + len(chyby) - chyb_pred
+        cursor.execute(SQL_POSUNOUT_POZICI, (pozice, radku, vlozeno, odmitnuto, klic, zacatek))
+    return vlozeno
+
+# řádky části souboru od pozice do konce (text UTF-8); atribut pozice = bajt za posledním přečteným řádkem,
+# tj. za posledním záznamem, který čtení záznamů (_cist_csv / _cist_jsonl) vrátilo
+class _Cteni:
+    def __init__(self, soubor, pozice, konec):
+        self._soubor = soubor
+        self.pozice = pozice
+        self._konec = konec
+        soubor.seek(pozice)
+
+    def __iter__(self):
+        while self.pozice < self._konec:
+            radek = self._soubor.readline()
+            if not radek:
+                return
+            kodovani = "utf-8-sig" if self.pozice == 0 else "utf-8"
+            self.pozice += len(radek)
+            yield radek.decode(kodovani)
+
+
+# 5) Pracovní procesy – každý proces otevře jedno připojení a používá ho pro všechny své části
+def _inicializovat_proces(parametry):
+    global _conn_procesu
+    # nastavení z .env (čítače, připravené příkazy) i při spuštění procesu metodou spawn
+    nacist_prostredi()
+    _conn_procesu = pripojit(parametry)
+
+def _nacist_cast_v_procesu(*uloha):
+    return _nacist_cast(_conn_procesu, *uloha)
@@ -0,0 +1,226 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: pool připojení
+-------------------------------------------------------------------------------------------
+Popis:
+Sdílený pool připojení k MySQL databázi (prod nebo test). Pool se sestaví jednou
+ze stejných proměnných prostředí (.env) jako pripojeni_db() a připojení se z něj
+půjčují (vypujcit) a po použití vracejí (vratit).
+
+    • velikost        – počet připojení, která pool drží otevřená i v klidu
+    • max_preteceni   – kolik připojení navíc smí pool při špičce otevřít (po vrácení se zavřou)
+    • timeout         – jak dlouho (s) se čeká na volné připojení, pak PoolError
+    • kontrola_po     – po kolika sekundách nečinnosti se připojení před vypůjčením ověří pingem
+                        (0 = ověřit při každém vypůjčení)
+
+Nastavení z .env (nepovinné): DB_POOL_SIZE, DB_POOL_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_PING_AFTER.
+Při DB_BACKEND=sqlite pool drží připojení k vestavěné databázi (embedded_db.py).
+
+Všechny *_db funkce přijímají v parametru conn buď samotné připojení, nebo objekt PoolDB;
+v druhém případě si připojení půjčí jen na dobu svého běhu.
+==============================================================================================
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .dialekt import dialekt_backendu
+from .metriky import zaznamenat_pripojeni
+from .ovladac import cisty_python, mysql, nacist_prostredi, zvoleny_backend
+
+
+# 1) Parametry připojení
+# funkce vrací slovník parametrů pro mysql.connector.connect() dle proměnných prostředí z .env;
+# parametr test_db rozhoduje o připojení k prod nebo test db (stejně jako u pripojeni_db());
+# při prvním volání se načte .env (viz ovladac.py), use_pure volí implementaci ovladače dle DB_DRIVER;
+# při DB_BACKEND=sqlite vrací parametry vestavěné databáze (backend, cesta k souboru nebo :memory: v klíči database)
+def parametry_pripojeni(test_db=False):
+    nacist_prostredi()
+    if zvoleny_backend() == "sqlite":
+        return {
+            "backend": "sqlite",
+            "host": "embedded",
+            "port": None,
+            "database": os.getenv("DB_TEST_SQLITE_PATH", "task_manager_test.db") if test_db
+                        else os.getenv("DB_SQLITE_PATH", "task_manager.db"),
+        }
+    if test_db:
+        return {
+            "host": os.getenv("DB_HOST", "localhost"),
+            "user": os.getenv("DB_TEST_USER"),
+            "password": os.getenv("DB_TEST_PASSWORD"),
+            "database": os.getenv("DB_TEST_NAME"),
+            "use_pure": cisty_python(),
+        }
+    return {
+        "host": os.getenv("DB_HOST", "localhost"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+        "database": os.getenv("DB_NAME"),
+        "use_pure": cisty_python(),
+    }
+
+
+# otevření připojení podle parametrů z parametry_pripojeni() – MySQL (mysql.connector.connect) nebo vestavěná databáze,
+# podle dialektu backendu (dialekt.py)
+def pripojit(parametry):
+    return dialekt_backendu(parametry).pripojit(parametry)
+
+
+# 2) Pool připojení
+# připojení se půjčují metodou vypujcit() a vracejí metodou vratit(), případně přes context manager spojeni();
+# volná připojení se drží v zásobníku (LIFO), takže se přednostně používají ta naposledy vrácená ("teplá");
+# síťové operace (connect, ping, close) probíhají mimo zámek, aby jedno pomalé připojení neblokovalo ostatní vlákna
+class PoolDB:
+    def __init__(self, parametry, velikost=5, max_preteceni=5, timeout=30.0, kontrola_po=0.0):
+        if velikost < 1 or max_preteceni < 0:
+            raise ValueError("Velikost poolu musí být alespoň 1 a max_preteceni nesmí být záporné.")
+        self.parametry = dict(parametry)
+        self.velikost = velikost
+        self.max_preteceni = max_preteceni
+        self.timeout = timeout
+        self.kontrola_po = kontrola_po
+        self._volna = deque()               # dvojice (conn, čas vrácení)
+        self._otevreno = 0                  # počet otevřených připojení (volná i vypůjčená)
+        self._zamek = threading.Condition()
+        self._zavreno = False
+
+    @property
+    def otevreno(self):
+        return self._otevreno
+
+    @property
+    def volna(self):
+        return len(self._volna)
+
+    # vypůjčení připojení z poolu;
+    # vrací zdravé připojení, nebo vyvolá PoolError (pool uzavřen / vypršel timeout)
+    # či mysql.connector.Error (nelze se připojit)
+    def vypujcit(self):
+        konec = time.monotonic() + self.timeout
+        with self._zamek:
+            while True:
+                if self._zavreno:
+                    raise mysql.connector.errors.PoolError("Pool připojení je uzavřen.")
+                if self._volna:
+                    conn, vraceno = self._volna.pop()
+                    break
+                if self._otevreno < self.velikost + self.max_preteceni:
+                    self._otevreno += 1             # místo pro nové připojení se rezervuje ještě pod zámkem
+                    conn = vraceno = None
+                    break
+                zbyva = konec - time.monotonic()
+                if zbyva <= 0:
+                    raise mysql.connector.errors.PoolError(
+                        f"Vypršel čas ({self.timeout} s) při čekání na volné připojení z poolu.")
+                self._zamek.wait(zbyva)
+
+        if conn is not None:
+            if self._je_zdrave(conn, vraceno):
+                return conn
+            _zavrit_tise(conn)                      # nefunkční připojení se zahodí, jeho místo se použije pro nové
+
+        zacatek = time.perf_counter()
+        try:
+            conn = pripojit(self.parametry)
+        except Exception as err:
+            zaznamenat_pripojeni(time.perf_counter() - zacatek, err)
+            self._uvolnit_misto()
+            raise
+        zaznamenat_pripojeni(time.perf_counter() - zacatek)
+        return conn
+
+    # vrácení připojení do poolu;
+    # nepotvrzená transakce se odvolá (rollback), aby se rozpracovaná data nepřenesla k dalšímu vypůjčiteli;
+    # připojení nad rámec velikosti poolu (přetečení) a nefunkční připojení se zavřou
+    def vratit(self, conn):
+        zdrave = True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except mysql.connector.Error:
+            zdrave = False
+
+        with self._zamek:
+            if zdrave and not self._zavreno and len(self._volna) < self.velikost:
+                self._volna.append((conn, time.monotonic()))
+                self._zamek.notify()
+                return
+        _zavrit_tise(conn)
+        self._uvolnit_misto()
+
+    @contextmanager
+    def spojeni(self):
+        conn = self.vypujcit()
+        try:
+            yield conn
+        finally:
+            self.vratit(conn)
+
+    # uzavření poolu – zavře všechna volná připojení; vypůjčená připojení se zavřou při svém vrácení
+    def zavrit(self):
+        with self._zamek:
+            self._zavreno = True
+            volna = [conn for conn, _ in self._volna]
+            self._volna.clear()
+            self._otevreno -= len(volna)
+            self._zamek.notify_all()
+        for conn in volna:
+            _zavrit_tise(conn)
+
+    # kontrola zdraví při vypůjčení: připojení nečinné déle než kontrola_po se ověří pingem
+    def _je_zdrave(self, conn, vraceno):
+        if time.monotonic() - vraceno < self.kontrola_po:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    def _uvolnit_misto(self):
+        with self._zamek:
+            self._otevreno -= 1
+            self._zamek.notify()
+
+
+def _zavrit_tise(conn):
+    try:
+        conn.close()
+    except mysql.connector.Error:
+        pass
+
+
+# 3) Sdílené pooly pro prod a test db
+# funkce vrací pool sestavený jednou pro celý proces (zvlášť pro prod a test db), nastavení čte z .env
+_pooly = {}
+_pooly_zamek = threading.Lock()
+
+def ziskat_pool(test_db=False):
+    with _pooly_zamek:
+        pool = _pooly.get(test_db)
+        if pool is None or pool._zavreno:
+            pool = PoolDB(
+                parametry_pripojeni(test_db),
+                velikost=int(os.getenv("DB_POOL_SIZE", "5")),
+                max_preteceni=int(os.getenv("DB_POOL_MAX_OVERFLOW", "5")),
+                timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                kontrola_po=float(os.getenv("DB_POOL_PING_AFTER", "0")),
+            )
+            _pooly[test_db] = pool
+        return pool
+
+
+# 4) Vypůjčení připojení pro *_db funkce
+# parametr conn může být samotné připojení (použije se beze změny)
+# nebo PoolDB (připojení se půjčí jen na dobu bloku with)
+@contextmanager
+def spojeni(conn):
+    if isinstance(conn, PoolDB):
+        with conn.spojeni() as vypujcene:
+            yield vypujcene
+    else:
+        yield conn
@@ -0,0 +1,163 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: import a export úkolů (CSV / JSONL)
+-------------------------------------------------------------------------------------------
+Popis:
+Neinteraktivní přenos dat tabulky 'ukoly' – používají ho podpříkazy import a export
+funkce main() (viz task_manager_mysql_p2.py).
+
+    • importovat_ukoly() – čte CSV (hlavička se sloupci nazev, popis) nebo JSONL (objekty
+      {"nazev": ..., "popis": ...}) postupně ze souboru nebo stdin a vkládá je hromadným
+      vkládáním po dávkách (pridat_ukoly_db); paměť nezávisí na velikosti souboru
+    • exportovat_ukoly() – zapisuje úkoly seřazené podle id přes nebufferovaný kurzor
+      (řádky se ze serveru čtou postupně po fetchmany), volitelně jen v zadaných stavech
+      a od zadaného id (navázání přerušeného exportu)
+
+Průběh (počet řádků a řádky/s) se vypisuje na stderr, aby export na stdout zůstal čistý.
+==============================================================================================
+"""
+
+import csv
+import json
+import sys
+import time
+
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .task_manager_mysql_p2 import pridat_ukoly_db
+from .ukol import SLOUPCE_UKOLU, SQL_SLOUPCE, Ukol
+
+FORMATY = ("csv", "jsonl")
+VELIKOST_CTENI = 1000       # počet řádků načtených ze serveru jedním fetchmany() při exportu
+
+
+# průběh přenosu na stderr – nejvýše jednou za interval sekund a na konci souhrn
+class Prubeh:
+    def __init__(self, nazev, interval=1.0, vystup=None):
+        self.nazev = nazev
+        self.interval = interval
+        self.vystup = vystup if vystup is not None else sys.stderr
+        self.radku = 0
+        self._zacatek = time.perf_counter()
+        self._posledni = self._zacatek
+
+    def pridat(self, pocet=1):
+        self.radku += pocet
+        ted = time.perf_counter()
+        if ted - self._posledni >= self.interval:
+            self._posledni = ted
+            print(f"\r{self._text(ted)}", end="", file=self.vystup, flush=True)
+
+    def dokoncit(self):
+        print(f"\r{self._text(time.perf_counter())}", file=self.vystup, flush=True)
+
+    def _text(self, ted):
+        doba = max(ted - self._zacatek, 1e-9)
+        return f"{self.nazev}: {self.radku} řádků, {self.radku / doba:,.0f} řádků/s, {doba:.1f} s"
+
+
+# formát podle přípony souboru (.csv / .jsonl, .json), jinak výchozí JSONL
+def urcit_format(cesta, format=None):
+    if format is None:
+        format = "csv" if str(cesta).lower().endswith(".csv") else "jsonl"
+    if format not in FORMATY:
+        raise ValueError(f"Nepodporovaný formát '{format}' (povolené: {', '.join(FORMATY)}).")
+    return format
+
+
+# 1) Import
+# soubor = otevřený textový soubor (nebo sys.stdin); funkce vrací dvojici (počet vložených úkolů, seznam chyb)
+# stejně jako pridat_ukoly_db() – chyby čtení (neplatný JSON, chybějící sloupec) jsou v seznamu chyb
+# pod pořadím řádku dat od 0 – nebo False při technické chybě DB (dávky potvrzené před chybou zůstávají uložené)
+def importovat_ukoly(soubor, conn, format="jsonl", batch_size=1000, prubeh=None):
+    format = urcit_format(None, format)
+    prubeh = prubeh if prubeh is not None else Prubeh("Import")
+    chyby_cteni = {}
+
+    def radky():
+        zaznamy = _cist_csv(soubor) if format == "csv" else _cist_jsonl(soubor)
+        for poradi, (zaznam, chyba) in enumerate(zaznamy):
+            prubeh.pridat()
+            if chyba:
+                chyby_cteni[poradi] = chyba
+            yield zaznam
+
+    vysledek = pridat_ukoly_db(radky(), conn, batch_size)
+    prubeh.dokoncit()
+    if vysledek is False:
+        return False
+    vlozeno, chyby = vysledek
+    return vlozeno, [(poradi, chyby_cteni.get(poradi, text)) for poradi, text in chyby]
+
+# čtení záznamů – generátory dvojic (zaznam, chyba); chybný řádek má zaznam None (pridat_ukoly_db ho odmítne);
+# hlavicka = názvy sloupců CSV, pokud soubor hlavičku neobsahuje (části souboru v paralelni_import.py)
+def _cist_csv(soubor, hlavicka=None):
+    for radek in csv.DictReader(soubor, fieldnames=hlavicka):
+        if radek.get("nazev") is None or radek.get("popis") is None:
+            yield None, "Řádek CSV nemá sloupce 'nazev' a 'popis'."
+        else:
+            yield (radek["nazev"], radek["popis"]), None
+
+def _cist_jsonl(soubor):
+    for radek in soubor:
+        if not radek.strip():
+            continue
+        try:
+            objekt = json.loads(radek)
+            yield (objekt["nazev"], objekt["popis"]), None
+        except (ValueError, TypeError, KeyError) as err:
+            yield None, f"Neplatný řádek JSONL: {err}"
+
+
+# 2) Export
+# soubor = otevřený textový soubor (nebo sys.stdout); stavy = n-tice stavů (None = všechny úkoly),
+# od_id = exportují se úkoly s id > od_id;
+# funkce vrací dvojici (počet exportovaných úkolů, id posledního exportovaného úkolu) nebo False při SQL chybě
+# (hláška uvádí id, od kterého lze export navázat parametrem od_id)
+def exportovat_ukoly(soubor, conn, format="jsonl", stavy=None, od_id=0, prubeh=None):
+    format = urcit_format(None, format)
+    prubeh = prubeh if prubeh is not None else Prubeh("Export")
+    sql = f"SELECT {SQL_SLOUPCE} FROM ukoly WHERE id > %s"
+    if stavy:
+        sql += f" AND stav IN ({', '.join(['%s'] * len(stavy))})"
+    sql += " ORDER BY id"
+
+    zapsat = _zapisovac_csv(soubor) if format == "csv" else _zapisovac_jsonl(soubor)
+    posledni_id = od_id
+    try:
+        with spojeni(conn) as spojeni_db:
+            # výchozí kurzor mysql.connector je nebufferovaný – řádky se čtou ze serveru postupně
+            cursor = kurzor(spojeni_db)
+            try:
+                cursor.execute(sql, (od_id, *(stavy or ())))
+                while True:
+                    radky = cursor.fetchmany(VELIKOST_CTENI)
+                    if not radky:
+                        break
+                    for radek in radky:
+                        ukol = Ukol._make(radek)
+                        zapsat(ukol)
+                        posledni_id = ukol.id
+                    prubeh.pridat(len(radky))
+            finally:
+                cursor.close()
+        prubeh.dokoncit()
+        return prubeh.radku, posledni_id
+
+    except mysql.connector.Error as err:
+        prubeh.dokoncit()
+        print(f"Chyba při exportu úkolů: {err}. Export lze navázat od id {posledni_id} (--od-id {posledni_id}).",
+              file=sys.stderr)
+        return False
+
+def _zapisovac_csv(soubor):
+    zapisovac = csv.writer(soubor)
+    zapisovac.writerow(SLOUPCE_UKOLU)
+    return lambda ukol: zapisovac.writerow(_hodnoty(ukol))
+
+def _zapisovac_jsonl(soubor):
+    return lambda ukol: soubor.write(json.dumps(dict(zip(SLOUPCE_UKOLU, _hodnoty(ukol))), ensure_ascii=False) + "\n")
+
+def _hodnoty(ukol):
+    return [hodnota.isoformat() if hasattr(hodnota, "isoformat") else hodnota for hodnota in ukol]
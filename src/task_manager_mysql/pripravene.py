@@ -0,0 +1,86 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: cache připravených SQL příkazů (prepared statements)
+-------------------------------------------------------------------------------------------
+Popis:
+Pevné SQL příkazy nejčastějších DB funkcí (přidání, změna stavu, výmaz a načtení jednoho
+úkolu) se na každém připojení připraví na serveru jen jednou (cursor(prepared=True))
+a při dalších voláních se jen znovu spustí s novými parametry přes binární protokol –
+server už text příkazu nepřijímá ani neparsuje.
+
+    • pro každé připojení a příkaz se drží jeden kurzor s připraveným příkazem; cache je
+      vázaná na život objektu připojení (WeakKeyDictionary), zavřením připojení zaniká
+    • po znovupřipojení (změna connection_id) se příkaz připraví znovu
+    • DB funkce kurzor "zavírají" jako obvykle – sdílený kurzor se nezavře, jen se dočtou
+      nenačtené řádky výsledku, aby bylo připojení připravené na další příkaz
+
+Příkaz se v cache hledá podle objektu řetězce SQL (konstanty SQL_* v task_manager_mysql_p2),
+mysql.connector podle něj rozhoduje, zda příkaz připravit znovu.
+Vypnutí (návrat k textovému protokolu): nastavit_pripravene(False) nebo v .env DB_PREPARED_STATEMENTS=0.
+==============================================================================================
+"""
+
+import threading
+import weakref
+
+from .metriky import kurzor, obalit
+
+_zapnuto = True
+_kurzory = weakref.WeakKeyDictionary()    # připojení -> {(sql, dictionary): (connection_id, kurzor)}
+_zamek = threading.Lock()
+
+
+def nastavit_pripravene(zapnuto):
+    global _zapnuto
+    _zapnuto = bool(zapnuto)
+
+def pripravene_zapnuty():
+    return _zapnuto
+
+
+# kurzor pro pevný SQL příkaz – při zapnuté cache sdílený kurzor s připraveným příkazem,
+# jinak běžný kurzor (textový protokol);
+# vrácený kurzor se používá stejně jako běžný: cursor.execute(sql, parametry) se stejným objektem sql, fetch*, close()
+def pripraveny_kurzor(conn, sql, dictionary=False):
+    if not _zapnuto:
+        return kurzor(conn, dictionary=dictionary)
+
+    connection_id = getattr(conn, "connection_id", None)
+    with _zamek:
+        kurzory = _kurzory.get(conn)
+        if kurzory is None:
+            kurzory = _kurzory[conn] = {}
+    klic = (sql, dictionary)
+    polozka = kurzory.get(klic)
+    # po znovupřipojení patří připravené příkazy ukončené session – původní kurzor se jen zahodí
+    # (zavření by poslalo neplatné id příkazu)
+    if polozka is None or polozka[0] != connection_id:
+        polozka = kurzory[klic] = (connection_id, conn.cursor(prepared=True, dictionary=dictionary))
+    return obalit(_SdilenyKurzor(polozka[1], conn))
+
+# zahození připravených příkazů připojení (např. před jeho předáním jinému kódu); na serveru se uvolní zavřením kurzorů
+def zahodit_pripravene(conn):
+    with _zamek:
+        kurzory = _kurzory.pop(conn, {})
+    for _, cursor in kurzory.values():
+        cursor.close()
+
+def pocet_pripravenych(conn):
+    return len(_kurzory.get(conn, ()))
+
+
+# sdílený kurzor – close() kurzor nezavírá, jen dočte nenačtený výsledek (jinak by další příkaz na připojení selhal)
+class _SdilenyKurzor:
+    def __init__(self, cursor, conn):
+        self._kurzor = cursor
+        self._conn = conn
+
+    def close(self):
+        if getattr(self._conn, "unread_result", False):
+            self._kurzor.fetchall()
+
+    def __iter__(self):
+        return iter(self._kurzor.fetchone, None)
+
+    def __getattr__(self, nazev):
+        return getattr(self._kurzor, nazev)
@@ -0,0 +1,225 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: souhrn úkolů podle stavu a dne (dashboard)
+-------------------------------------------------------------------------------------------
+Popis:
+Počty úkolů podle stavu a podle dne vytvoření se počítají v databázi (GROUP BY),
+do Pythonu se nepřenášejí jednotlivé řádky tabulky 'ukoly'.
+
+    • pocty_podle_stavu() – počty úkolů ve stavech nezahájeno / probíhá / hotovo;
+      GROUP BY stav nad tabulkou 'ukoly', při zapnutých čítačích se čtou z tabulky
+      'ukoly_citace' (několik řádků bez ohledu na velikost tabulky 'ukoly')
+    • pocty_podle_dnu()   – počty úkolů vytvořených v posledních dnech po stavech
+      (GROUP BY stav, datum_vytvoreni přes index ix_ukoly_stav_datum)
+    • zobrazit_souhrn()   – výpis souhrnu, volba 5 z hlavního menu
+
+Čítače (tabulka 'ukoly_citace', migrace 4) jsou nepovinné a ve výchozím nastavení vypnuté –
+každý zápis úkolu by s nimi navíc upravoval čítač a změna stavu a výmaz úkolu by musely
+nejdřív načíst původní stav úkolu (SELECT ... FOR UPDATE). Zapínají se v .env
+DB_STATUS_COUNTERS=1 nebo nastavit_citace(True); vyplatí se u velké tabulky s častým souhrnem.
+Zapnuté čítače udržují DB funkce zápisu ve stejné transakci jako samotnou změnu úkolu
+(zmenit_citace()). Každý stav má několik řádků (slotů) a každé připojení přičítá do svého
+slotu podle connection_id, aby se souběžné zápisy nečekaly na zámek jednoho řádku; počet
+stavu je součet jeho slotů.
+
+Změny mimo DB funkce aplikace (ruční SQL, období s vypnutými čítači) čítače nezachytí;
+zkontrolovat_citace() je porovná s tabulkou 'ukoly' a rozdíly opraví. Po zapnutí čítačů
+se tato kontrola provede automaticky před prvním souhrnem. Procesy nad stejnou databází
+musí mít čítače nastavené stejně.
+==============================================================================================
+"""
+
+from datetime import date, timedelta
+
+from .dialekt import dialekt
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .pripravene import pripraveny_kurzor
+from .transakce import _odvolat, _potvrdit
+from .ukol import STAVY_UKOLU
+
+SLOTY_CITACU = 8        # počet řádků (slotů) tabulky 'ukoly_citace' pro každý stav
+
+# změna čítačů nejvýše dvou stavů jedním příkazem (změna stavu úkolu = -1 původní stav, +1 nový stav)
+SQL_ZMENIT_CITACE = (
+    "UPDATE ukoly_citace SET pocet = pocet + CASE stav WHEN %s THEN %s WHEN %s THEN %s ELSE 0 END "
+    "WHERE slot = %s AND stav IN (%s, %s)"
+)
+# původní stav úkolu před jeho změnou nebo výmazem (řádek zůstane zamčený do konce transakce, viz dialekt.pro_zapis())
+SQL_STAV_UKOLU = "SELECT stav FROM ukoly WHERE id = %s"
+
+_zapnuto = False
+_overit = False         # po zapnutí čítačů se před prvním souhrnem porovnají s tabulkou 'ukoly'
+
+
+# zapnutí / vypnutí čítačů; overit=False vynechá kontrolu před prvním souhrnem (čítače jistě odpovídají tabulce)
+def nastavit_citace(zapnuto, overit=True):
+    global _zapnuto, _overit
+    _overit = bool(zapnuto) and overit and (_overit or not _zapnuto)
+    _zapnuto = bool(zapnuto)
+
+def citace_zapnuty():
+    return _zapnuto
+
+
+# 1) Údržba čítačů z DB funkcí zápisu
+# zmeny = slovník {stav: změna počtu}; volá se před commitem na připojení, které provedlo změnu úkolů,
+# takže čítače se potvrdí nebo odvolají spolu s ní; při vypnutých čítačích nedělá nic
+def zmenit_citace(conn, zmeny):
+    if not _zapnuto:
+        return
+    zmeny = [(stav, zmena) for stav, zmena in zmeny.items() if zmena]
+    if not zmeny:
+        return
+    slot = (getattr(conn, "connection_id", None) or 0) % SLOTY_CITACU
+    cursor = pripraveny_kurzor(conn, SQL_ZMENIT_CITACE)
+    for zacatek in range(0, len(zmeny), 2):
+        dvojice = zmeny[zacatek:zacatek + 2]
+        # jediný stav se v CASE uvede dvakrát
+        (stav1, zmena1), (stav2, zmena2) = dvojice if len(dvojice) == 2 else dvojice * 2
+        cursor.execute(SQL_ZMENIT_CITACE, (stav1, zmena1, stav2, zmena2, slot, stav1, stav2))
+    cursor.close()
+
+# původní stav úkolu pro změnu čítačů při změně stavu nebo výmazu úkolu;
+# vrací stav, nebo None, pokud úkol neexistuje nebo jsou čítače vypnuté (pak se původní stav nenačítá)
+def puvodni_stav(conn, id_ukolu):
+    if not _zapnuto:
+        return None
+    sql = dialekt(conn).pro_zapis(conn, SQL_STAV_UKOLU)
+    cursor = pripraveny_kurzor(conn, sql)
+    cursor.execute(sql, (id_ukolu,))
+    radek = cursor.fetchone()
+    cursor.close()
+    return radek[0] if radek else None
+
+
+# 2) Souhrn úkolů
+# a) pocty_podle_stavu(): vrací slovník {stav: počet úkolů} se všemi třemi stavy nebo False při SQL chybě;
+# první souhrn po zapnutí čítačů je nejdřív zkontroluje a přepočítá (během vypnutí se neudržovaly)
+def pocty_podle_stavu(conn):
+    if _zapnuto and _overit and zkontrolovat_citace(conn) is False:
+        return False
+    if _zapnuto:
+        sql = "SELECT stav, SUM(pocet) FROM ukoly_citace GROUP BY stav"
+    else:
+        sql = "SELECT stav, COUNT(*) FROM ukoly GROUP BY stav"
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            cursor.execute(sql)
+            pocty = {stav: int(pocet) for stav, pocet in cursor.fetchall()}
+            cursor.close()
+        return {stav: pocty.get(stav, 0) for stav in STAVY_UKOLU}
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání souhrnu úkolů: {err}")
+        return False
+
+# b) pocty_podle_dnu(): počty úkolů vytvořených za posledních dnu dní (včetně dneška);
+# vrací seznam n-tic (datum, počet nezahájeno, počet probíhá, počet hotovo) seřazený podle data
+# – jen dny s alespoň jedním úkolem, [] (žádné úkoly v období) nebo False při SQL chybě
+def pocty_podle_dnu(conn, dnu=7):
+    if dnu < 1:
+        raise ValueError("Parametr dnu musí být alespoň 1.")
+    od = date.today() - timedelta(days=dnu - 1)
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            cursor.execute(
+                "SELECT stav, datum_vytvoreni, COUNT(*) FROM ukoly "
+                "WHERE datum_vytvoreni >= %s GROUP BY stav, datum_vytvoreni", (od,))
+            radky = cursor.fetchall()
+            cursor.close()
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání souhrnu úkolů: {err}")
+        return False
+
+    dny = {}
+    for stav, datum, pocet in radky:
+        dny.setdefault(datum, dict.fromkeys(STAVY_UKOLU, 0))[stav] = pocet
+    return [(datum, *pocty.values()) for datum, pocty in sorted(dny.items())]
+
+# c) zobrazit_souhrn(): UI funkce – výpis souhrnu, volba 5 z hlavního menu;
+# funkce vrací True, [] (prázdná tabulka) nebo False (SQL chyba)
+def zobrazit_souhrn(conn, dnu=7):
+    pocty = pocty_podle_stavu(conn)
+    if pocty is False:
+        return False
+    celkem = sum(pocty.values())
+    if celkem == 0:
+        print("Tabulka 'ukoly' je prázdná.")
+        return []
+
+    print("\nSOUHRN ÚKOLŮ:")
+    for stav, pocet in pocty.items():
+        print(f"{stav}: {pocet}")
+    print(f"celkem: {celkem}")
+
+    po_dnech = pocty_podle_dnu(conn, dnu)
+    if po_dnech is False:
+        return False
+    print(f"\nVytvořeno za posledních {dnu} dní:")
+    if not po_dnech:
+        print("žádné úkoly")
+    for datum, *pocty_dne in po_dnech:
+        rozpis = ", ".join(f"{stav} {pocet}" for stav, pocet in zip(STAVY_UKOLU, pocty_dne))
+        print(f"{datum}: {sum(pocty_dne)} ({rozpis})")
+    return True
+
+
+# 3) Kontrola a přepočet čítačů
+# funkce porovná čítače se skutečnými počty v tabulce 'ukoly' a při opravit=True je přepíše;
+# řádky čítačů se nejdřív zamknou (FOR UPDATE), takže souběžné zápisy čekají a svou změnu přičtou
+# až k přepočteným hodnotám;
+# vrací seznam rozdílů (stav, hodnota čítače, skutečný počet), [] (čítače souhlasí) nebo False při SQL chybě
+def zkontrolovat_citace(conn, opravit=True):
+    global _overit
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                cursor.execute(dialekt(conn).pro_zapis(conn, "SELECT stav, pocet FROM ukoly_citace"))
+                radky = cursor.fetchall()
+                citace = dict.fromkeys(STAVY_UKOLU, 0)
+                for stav, pocet in radky:
+                    citace[stav] += pocet
+                cursor.execute("SELECT stav, COUNT(*) FROM ukoly GROUP BY stav")
+                skutecne = dict.fromkeys(STAVY_UKOLU, 0)
+                skutecne.update(cursor.fetchall())
+
+                rozdily = [(stav, citace[stav], skutecne[stav])
+                           for stav in STAVY_UKOLU if citace[stav] != skutecne[stav]]
+                # přepisuje se i při chybějících řádcích slotů (např. po zvýšení SLOTY_CITACU)
+                if opravit and (rozdily or len(radky) < len(STAVY_UKOLU) * SLOTY_CITACU):
+                    prepsat_citace(cursor, skutecne)
+                    _potvrdit(conn)
+                else:
+                    _odvolat(conn)         # jen uvolnění zámků (ve vnější transakci je uvolní až její konec)
+            finally:
+                cursor.close()
+
+        if opravit or not rozdily:
+            _overit = False                 # čítače odpovídají tabulce – souhrn je už nemusí kontrolovat
+        if rozdily:
+            print(f"Čítače úkolů nesouhlasily{' a byly přepočteny' if opravit else ''}: "
+                  + ", ".join(f"{stav} {citac} → {pocet}" for stav, citac, pocet in rozdily) + ".")
+        return rozdily
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při kontrole čítačů úkolů: {err}")
+        return False
+
+# přepsání čítačů skutečnými počty (slovník {stav: počet}) – počet stavu do slotu 0, ostatní sloty na 0;
+# používá ho i migrace 4;
+# chybějící řádky slotů se nejdřív doplní, existující řádky se jen přepisují (čekající zápisy na ně po commitu navážou)
+def prepsat_citace(cursor, pocty):
+    cursor.execute("SELECT stav, slot FROM ukoly_citace")
+    existujici = set(cursor.fetchall())
+    chybejici = [(stav, slot) for stav in STAVY_UKOLU for slot in range(SLOTY_CITACU) if (stav, slot) not in existujici]
+    if chybejici:
+        cursor.executemany("INSERT INTO ukoly_citace (stav, slot, pocet) VALUES (%s, %s, 0)", chybejici)
+    for stav in STAVY_UKOLU:
+        cursor.execute("UPDATE ukoly_citace SET pocet = CASE WHEN slot = 0 THEN %s ELSE 0 END WHERE stav = %s",
+                       (pocty.get(stav, 0), stav))
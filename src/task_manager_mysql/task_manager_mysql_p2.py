@@ -15,6 +15,9 @@ Ukládá úkoly do databáze MySQL a umožňuje jejich přidávání, zobrazení
 
 Připojení k databázi používá proměnné prostředí, které se načítají ze souboru .env 
 (pomocí python-dotenv). Ukázkový .env.example je součástí repozitáře.
+Místo jednoho připojení lze používat sdílený pool připojení (pool.py), všechny DB funkce 
+přijímají v parametru conn připojení i pool. Více DB funkcí lze spojit do jedné transakce
+řízené volajícím (vnejsi_transakce(), transakce.py).
 
 Architektura programu je rozdělena na:
     • UI funkce – zpracovávají uživatelský vstup (input, print)
@@ -28,14 +31,47 @@ Souhrnný přehled návratových hodnot dle typu funkcí je uveden na konci prog
 ==============================================================================================
 """
 
-import os
-import mysql.connector
-from dotenv import load_dotenv   # import vyžaduje instalaci knihovny python-dotenv (pro nastavení prostředí)
+import contextlib
+import sys
+import time
+
+from .archiv import archivovat_ukoly, najit_v_archivu
+from .cache import cache_vypisu
+from .dialekt import dialekt
+from .hledani import hledat_ukol
+from .metriky import kurzor, zaznamenat_pripojeni
+from .migrace import aplikovat_migrace
+from .odolne import odolne_pripojeni
+from .ovladac import mysql
+from .pool import parametry_pripojeni, pripojit, spojeni, ziskat_pool
+from .pripravene import pripraveny_kurzor
+from .souhrn import puvodni_stav, zmenit_citace, zobrazit_souhrn
+from .transakce import _odvolat, _potvrdit
+from .ukol import SQL_SLOUPCE, STAVY_UKOLU, Ukol
+from .vypis import nastavit_vypis, strankovat, velikost_stranky_vypisu, vypsat_ukoly
+from .zmeny import vycistit_smazane, zaznamenat_smazani
+
+# maximální délky textových sloupců tabulky 'ukoly' (VARCHAR), používají se při validaci hromadného vkládání
+MAX_DELKA_NAZVU = 30
+MAX_DELKA_POPISU = 100
+
+# stavy nedokončených úkolů (výpis volby 2 z hlavního menu) a výchozí počet úkolů na jedné stránce výpisu
+NEDOKONCENE_STAVY = ("nezahájeno", "probíhá")
+VELIKOST_STRANKY = 20
+
+# pevné SQL příkazy nejčastějších DB funkcí – na každém připojení se připravují jen jednou (viz pripravene.py)
+SQL_PRIDAT_UKOL = "INSERT INTO ukoly (nazev, popis, stav, datum_vytvoreni) VALUES (%s, %s, 'nezahájeno', CURDATE())"
+SQL_NAJIT_UKOL = f"SELECT {SQL_SLOUPCE} FROM ukoly WHERE id = %s"
+# změna stavu vrací v rowcount jen skutečně změněný řádek (stejný stav = 0 řádků) na MySQL i SQLite;
+# parametry (stav, id, stav)
+SQL_AKTUALIZOVAT_UKOL = "UPDATE ukoly SET stav = %s WHERE id = %s AND stav <> %s"
+SQL_ODSTRANIT_UKOL = "DELETE FROM ukoly WHERE id = %s"
 
 # 1) Environment variables
-# funkce load_dotenv() z knihovny python-dotenv načítá proměnné prostředí ze souboru .env;
-# slouží k bezpečnému uložení přihlašovacích údajů (k MySQL) a umožňuje sdílení kódu bez citlivých dat
-load_dotenv()       # načte proměnné z .env souboru (název databáze, uživatele, heslo)
+# proměnné prostředí ze souboru .env (název databáze, uživatele, heslo, nastavení cache, měření a ovladače)
+# se načítají až při prvním připojení k databázi – funkcí nacist_prostredi() z ovladac.py,
+# kterou volá parametry_pripojeni();
+# stejně tak se až při prvním připojení importuje ovladač mysql.connector, import programu je tak rychlý i bez DB
 
 
 # 2) Připojení k databázi
@@ -45,23 +81,31 @@ load_dotenv()       # načte proměnné z .env souboru (název databáze, uživa
 # naopak parametr u fixture pro PyTest (fix_test_conn) je definována s default hodnotou pro připojení na test db (test_db=True);
 # volání funkce: pripojeni_db() / pripojeni_db(test_db=False) --- připojení na prod db (task_manager_prod);
 # volání funkce: pripojeni_db(test_db=True) --- připojení na test db (task_manager_test)
-def pripojeni_db(test_db=False):
+# volání funkce: pripojeni_db(pool=True) --- místo jednoho připojení vrací sdílený pool připojení (PoolDB, viz pool.py),
+# který lze předávat do všech dalších funkcí místo conn; každá funkce si z něj připojení půjčí jen na dobu svého běhu
+# volání funkce: pripojeni_db(odolne=True) --- odolné připojení (OdolnePripojeni, viz odolne.py)
+# pro dlouhý běh hlavního menu:
+# po nečinnosti ho ověří pingem, ztracené připojení nahradí novým a čtecí dotazy po výpadku zopakuje
+def pripojeni_db(test_db=False, pool=False, odolne=False):
+    parametry = parametry_pripojeni(test_db)
+    db_name = parametry["database"]
     try:
-        if test_db:                                      # připojení do testovací databáze: test_db
-            db_name = os.getenv("DB_TEST_NAME")
-            db_user = os.getenv("DB_TEST_USER")
-            db_password = os.getenv("DB_TEST_PASSWORD")
-        else:                                            # připojení do prod databáze: prod_db
-            db_name = os.getenv("DB_NAME")
-            db_user = os.getenv("DB_USER")
-            db_password = os.getenv("DB_PASSWORD")
-
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST", "localhost"),
-            user=db_user,
-            password=db_password,
-            database=db_name
-        )
+        # pool připojení: sestaví se jednou, ověří se vypůjčením jednoho připojení
+        if pool:
+            pool_db = ziskat_pool(test_db)
+            with pool_db.spojeni():
+                pass
+            print(f"Pool připojení k databázi '{db_name}' byl úspěšně vytvořen.")
+            return pool_db                      # vrací objekt PoolDB, který se předává místo conn
+
+        if odolne:
+            conn = odolne_pripojeni(parametry)           # připojení měří a při výpadku opakuje samo
+        else:
+            zacatek = time.perf_counter()
+            try:
+                conn = pripojit(parametry)
+            finally:
+                zaznamenat_pripojeni(time.perf_counter() - zacatek)
         # Ověření, že připojení funguje
         if conn.is_connected():
             print(f"Připojení k databázi '{db_name}' bylo úspěšné.")
@@ -76,37 +120,22 @@ def pripojeni_db(test_db=False):
 # 2) Vytvoření tabulky (pokud neexistuje)
 # funkce pro vytvoření tabulky v lokální databázi (test nebo prod);
 # funkce bez návratu, provádí pouze efekt;
-# s parametrem conn si vytvoří vlastní kurzor jen na dobu svého běhu;
 # objekt conn obsahuje připojení k prod nebo test db, dle parametru funkce pripojeni_db();
+# tabulka 'ukoly' i její indexy se vytvářejí verzovanými migracemi (viz migrace.py),
+# funkce aplikuje všechny dosud neaplikované migrace;
 # datový typ ENUM pro sloupec 'stav' zajišťuje pouze 3 povolené hodnoty s default hodnotou 'nezahájeno' 
 # CHECK constraint u sloupců 'nazev', 'popis' zajišťuje, že hodnota nesmí být null (prázdná) a ani to nesmí být prázdný řetězec
 def vytvoreni_tabulky(conn):   
-    try:
-        cursor = conn.cursor()     
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS ukoly (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                nazev VARCHAR(30) NOT NULL CHECK (nazev <> ''),
-                popis VARCHAR(100) NOT NULL CHECK (popis <> ''),
-                stav ENUM('nezahájeno', 'probíhá', 'hotovo') NOT NULL DEFAULT 'nezahájeno', 
-                datum_vytvoreni DATE
-            )
-        ''')
-        conn.commit()                               
+    if aplikovat_migrace(conn) is not False:
         print("Tabulka 'ukoly' již existuje nebo byla právě vytvořena.")
 
-    except mysql.connector.Error as err:
-        print(f"Chyba při vytváření tabulky: {err}")
-    finally:
-        cursor.close()
-
 
 
 # 3) Přidání úkolu 
 # funkce pro přidání úkolu do databázové tabulky 'ukoly' - volba 1 z hlavního menu;
 # a) pridat_ukoly(): pouze načítá data z uživatelského vstupu, které pak předává svojí databázové variantě do jejích parametrů;
 # b) pridat_ukol_db(): provádí insert nového úkolu do databázové tabulky 'ukoly'
+# c) pridat_ukoly_db(): hromadný insert úkolů po dávkách (bez uživatelského vstupu, není přístupná z hlavního menu)
 
 # a) pridat_ukoly(): 
 # funkce vrací True (volá db funkci) nebo False dle úspěšnosti 
@@ -125,46 +154,150 @@ def pridat_ukol(conn):  # získání hodnot z uživatelského vstupu ještě př
 # b) pridat_ukol_db():
 # funkce vrací True nebo False dle úspěšnosti provedení insertu
 def pridat_ukol_db(nazev, popis, conn):
+    return _pridat_ukol(nazev, popis, conn) is not False
+
+# _pridat_ukol(): insert jednoho úkolu; vrací id nového úkolu (lastrowid) nebo False (SQL chyba) – id potřebuje HTTP API
+def _pridat_ukol(nazev, popis, conn):
     try:
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO ukoly (nazev, popis, stav, datum_vytvoreni) VALUES (%s, %s, 'nezahájeno', CURDATE())", (nazev, popis))
-        conn.commit()
-        cursor.close()
-        print(f"Úkol '{nazev}' byl úspěšně přidán.")
-        return True
+        with spojeni(conn) as conn:
+            cursor = pripraveny_kurzor(conn, SQL_PRIDAT_UKOL)
+            cursor.execute(SQL_PRIDAT_UKOL, (nazev, popis))
+            id_ukolu = cursor.lastrowid
+            zmenit_citace(conn, {"nezahájeno": 1})      # čítač souhrnu ve stejné transakci (souhrn.py)
+            _potvrdit(conn)
+            cursor.close()
+            cache_vypisu.zneplatnit(conn, stavy=("nezahájeno",))
+            print(f"Úkol '{nazev}' byl úspěšně přidán.")
+            return id_ukolu
 
     except mysql.connector.Error as err:
         print(f"Chyba při přidávání úkolu: {err}")
         return False
 
+# c) pridat_ukoly_db():
+# hromadné přidání úkolů – parametr ukoly je libovolný iterovatelný objekt dvojic (nazev, popis),
+# i generátor (čte se postupně);
+# řádky se validují stejně jako CHECK constraints a délky sloupců tabulky 'ukoly'
+# (neplatný řádek se do INSERTu vůbec nepošle);
+# platné řádky se vkládají víceřádkovým INSERTem po dávkách o velikosti batch_size, commit proběhne jednou za dávku;
+# pokud DB odmítne celou dávku, vloží se její řádky po jednom, takže jeden chybný řádek nezruší celou dávku;
+# funkce vrací dvojici (počet vložených úkolů, seznam chyb) – chyba je dvojice (pořadí řádku od 0, popis chyby),
+# nebo False při technické chybě (např. ztráta připojení); dávky potvrzené před chybou zůstávají uložené
+def pridat_ukoly_db(ukoly, conn, batch_size=1000):
+    if batch_size < 1:
+        raise ValueError("Parametr batch_size musí být alespoň 1.")
+
+    vlozeno = 0
+    chyby = []
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                davka = []
+                for poradi, zaznam in enumerate(ukoly):
+                    chyba = _validace_ukolu(zaznam)
+                    if chyba:
+                        chyby.append((poradi, chyba))
+                        continue
+                    davka.append((poradi, zaznam))
+                    if len(davka) >= batch_size:
+                        vlozeno += _vlozit_davku(davka, conn, cursor, chyby)
+                        davka = []
+                if davka:
+                    vlozeno += _vlozit_davku(davka, conn, cursor, chyby)
+            finally:
+                cursor.close()
+                if vlozeno:
+                    cache_vypisu.zneplatnit(conn, stavy=("nezahájeno",))
+
+        print(f"Hromadně přidáno úkolů: {vlozeno}, odmítnuto řádků: {len(chyby)}.")
+        return vlozeno, chyby
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při hromadném přidávání úkolů (uloženo {vlozeno} úkolů): {err}")
+        return False
+
+# pomocná funkce – validace jednoho řádku (nazev, popis) dle definice tabulky 'ukoly';
+# vrací popis chyby nebo None, pokud je řádek platný
+def _validace_ukolu(zaznam):
+    try:
+        nazev, popis = zaznam
+    except (TypeError, ValueError):
+        return "Řádek musí být dvojice (nazev, popis)."
+    for sloupec, hodnota, max_delka in (("nazev", nazev, MAX_DELKA_NAZVU), ("popis", popis, MAX_DELKA_POPISU)):
+        if not isinstance(hodnota, str) or hodnota == "":
+            return f"Sloupec '{sloupec}' nesmí být prázdný."
+        if len(hodnota) > max_delka:
+            return f"Sloupec '{sloupec}' může mít nejvýše {max_delka} znaků."
+    return None
+
+# pomocná funkce – vložení jedné dávky víceřádkovým INSERTem v jedné transakci;
+# vrací počet vložených řádků, chyby jednotlivých řádků připisuje do seznamu chyby
+def _vlozit_davku(davka, conn, cursor, chyby):
+    hodnoty = ", ".join(["(%s, %s, 'nezahájeno', CURDATE())"] * len(davka))
+    parametry = [hodnota for _, zaznam in davka for hodnota in zaznam]
+    try:
+        cursor.execute(f"INSERT INTO ukoly (nazev, popis, stav, datum_vytvoreni) VALUES {hodnoty}", parametry)
+        zmenit_citace(conn, {"nezahájeno": len(davka)})
+        _potvrdit(conn)
+        return len(davka)
+    except mysql.connector.Error:
+        _odvolat(conn)
+
+    # DB odmítla dávku jako celek – vložení po jednom řádku, chybné řádky se jen zaznamenají;
+    # stejný příkaz SQL_PRIDAT_UKOL jako pridat_ukol_db() – se zapnutými připravenými příkazy se použije již připravený
+    vlozeno = 0
+    jednotlivy = pripraveny_kurzor(conn, SQL_PRIDAT_UKOL)
+    try:
+        for poradi, (nazev, popis) in davka:
+            try:
+                jednotlivy.execute(SQL_PRIDAT_UKOL, (nazev, popis))
+                vlozeno += 1
+            except mysql.connector.Error as err:
+                chyby.append((poradi, str(err)))
+    finally:
+        jednotlivy.close()
+    zmenit_citace(conn, {"nezahájeno": vlozeno})
+    _potvrdit(conn)
+    return vlozeno
+
 
 
 # 4) Zobrazení úkolů
 # funkce pro zobrazení uložených úkolů
 # a) zobrazit_ukoly(): funkce zobrazující výpis všech nedokončených úkolů z tabulky 'ukoly' (stav 'nezahájeno' nebo 'probíhá'), volba 2 z hlavního menu;
-# b) zobrazit_vsechny_ukoly(): pomocná funkce pro aktualizovat_ukol(), odstranit_ukol() – zobrazuje všechny úkoly bez ohledu na jejich stav, není přístupná z hlavního menu
+# b) zobrazit_vsechny_ukoly(): zobrazuje všechny úkoly bez ohledu na jejich stav, není přístupná z hlavního menu
+# c) stranky_ukolu(), prochazet_ukoly(): generátory pro postupné načítání úkolů po stránkách (keyset podle id),
+#    bez načtení celé tabulky
+# d) zobrazit_ukoly_strankovane(): výpis úkolů po stránkách, volba 2 z hlavního menu
+# e) existuji_ukoly(): levná kontrola neprázdné tabulky pro aktualizovat_ukol(), odstranit_ukol()
+# f) najit_ukol_db(): načtení jednoho úkolu podle id
+# g) _nabidnout_vypis(), _zobrazit_zvoleny_ukol(): pomocné UI funkce pro aktualizovat_ukol(), odstranit_ukol()
 
 # a) zobrazit_ukoly():
-# funkce vrací objekt nedokoncene_ukoly v podobě seznamu/slovníků s nedokončenými úkoly nebo prázdný seznam (prázdný seznam není chyba);
-# conn.cursor(dictionary=True):
-# i) row=ukol=dictionary, což umožní přistupovat v tisku k jednotlivým klíčům/sloupcům tabulky podle jejich názvu;
-# ii) každý řádek/ukol/slovník má názvy sloupců jako klíče; 
-# iii) bez parametru dictionary: row=ukol=n-tice a data by se musela tisknout na základě pozic, tzn. horší čitelnost kódu: print(f"{ukol[0]}. {ukol[1]} - {ukol[2]} ({ukol[3]})")
+# funkce vrací objekt nedokoncene_ukoly v podobě seznamu záznamů Ukol s nedokončenými úkoly nebo prázdný seznam
+# (prázdný seznam není chyba);
+# záznam Ukol (ukol.py):
+# i) row=ukol=Ukol, v tisku se k jednotlivým sloupcům tabulky přistupuje podle jejich názvu jako u slovníku
+#    (ukol['nazev']);
+# ii) řádky se načítají běžným kurzorem jako n-tice a převádějí se na Ukol bez slovníku pro každý řádek
+#    (méně paměti, rychlejší načtení);
+# iii) pořadí sloupců určuje SELECT {SQL_SLOUPCE}, proto se nepoužívá SELECT *
 def zobrazit_ukoly(conn):
     try:
-        cursor = conn.cursor(dictionary=True)   # každá řádka z tabulky bude načtena jako samostatný slovník, nikoliv n-tice
-        cursor.execute("SELECT * FROM ukoly WHERE stav IN ('nezahájeno', 'probíhá')")
-        nedokoncene_ukoly = cursor.fetchall()   # proměnná nedokoncene_ukoly - objekt potřebný pro automatizovaný test (PyTest)
-        cursor.close()
+        # výpis se načítá přes cache výpisů (cache.py), SELECT proběhne jen při prvním výpisu nebo po změně dat;
+        # proměnná nedokoncene_ukoly - objekt potřebný pro automatizovaný test (PyTest)
+        nedokoncene_ukoly = cache_vypisu.ziskat(conn, NEDOKONCENE_STAVY, lambda: _nacist_ukoly(
+            conn, f"SELECT {SQL_SLOUPCE} FROM ukoly WHERE stav IN ('nezahájeno', 'probíhá')"))
 
         if not nedokoncene_ukoly:
             print("Neexistují žádné nedokončené úkoly.")
             return []       # funkce vrací prázdný seznam
 
         else:
-            print("\nSEZNAM ÚKOLŮ:")
-            for ukol in nedokoncene_ukoly:                                                 # row = ukol = slovník
-                print(f"{ukol['id']}. {ukol['nazev']} - {ukol['popis']} ({ukol['stav']})") # tisk hodnot klíčů ze slovníků ukol
+            # výpis všech řádků najednou (vypis.py) – řádky se naformátují a zapíšou po blocích,
+            # ne print() pro každý úkol
+            vypsat_ukoly(nedokoncene_ukoly, nadpis="\nSEZNAM ÚKOLŮ:")
             return nedokoncene_ukoly  # funkce vrací pouze nedokončené úkoly
     
     except mysql.connector.Error as err:
@@ -172,46 +305,184 @@ def zobrazit_ukoly(conn):
         return False           # konec funkce, návrat do hlavního menu
 
 # b) zobrazit_vsechny_ukoly():
-# pomocná funkce – zobrazení všech úkolů (bez filtru) pro aktualizovat_ukol(), odstranit_ukol()
-# funkce vrací objekt ukoly v podobě seznamu/slovníků všech úkolů nebo prázdný seznam (prázdný seznam není chyba);
+# pomocná funkce – zobrazení všech úkolů (bez filtru);
+# aktualizovat_ukol(), odstranit_ukol() místo ní používají existuji_ukoly() a stránkovaný výpis
+# funkce vrací objekt ukoly v podobě seznamu záznamů Ukol všech úkolů nebo prázdný seznam (prázdný seznam není chyba);
 def zobrazit_vsechny_ukoly(conn):
     try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT * FROM ukoly")
-        ukoly = cursor.fetchall()
-        cursor.close()
+        ukoly = cache_vypisu.ziskat(conn, None, lambda: _nacist_ukoly(conn, f"SELECT {SQL_SLOUPCE} FROM ukoly"))
 
         if not ukoly:
             print("Tabulka 'ukoly' je prázdná.")
             return []       # funkce vrací prázdný seznam
 
-        print("\nSEZNAM VŠECH ÚKOLŮ:")
-        for ukol in ukoly:
-            print(f"{ukol['id']}. {ukol['nazev']} - {ukol['popis']} ({ukol['stav']})")
+        vypsat_ukoly(ukoly, nadpis="\nSEZNAM VŠECH ÚKOLŮ:")
         return ukoly                # funkce vrací všechny úkoly
 
     except mysql.connector.Error as err:
         print(f"Chyba při načítání úkolů: {err}")
         return False    # konec funkce, návrat do hlavního menu
 
+# pomocná funkce pro a), b) – načtení výpisu z DB;
+# každá řádka z tabulky se načte jako n-tice a převede na záznam Ukol (viz ukol.py)
+def _nacist_ukoly(conn, sql):
+    with spojeni(conn) as spojeni_db:
+        cursor = kurzor(spojeni_db)
+        cursor.execute(sql)
+        ukoly = list(map(Ukol._make, cursor.fetchall()))
+        cursor.close()
+    return ukoly
+
+# c) stranky_ukolu(), prochazet_ukoly():
+# generátory pro postupné (streamované) načítání úkolů po stránkách, paměť nezávisí na počtu úkolů v tabulce;
+# stránkuje se podle id (keyset: WHERE id > poslední id ORDER BY id LIMIT n), nikoliv přes OFFSET,
+# takže načtení každé stránky je stejně rychlé na začátku i na konci tabulky;
+# parametr stavy je n-tice povolených stavů (např. NEDOKONCENE_STAVY) nebo None pro všechny úkoly,
+# parametr od_id umožňuje pokračovat za posledním již zpracovaným úkolem;
+# další stránka se z DB načte až ve chvíli, kdy si ji volající vyžádá
+# (u poolu se připojení půjčuje pro každou stránku zvlášť);
+# generátor nemůže vrátit False – při SQL chybě vyvolá výjimku mysql.connector.Error
+
+# stranky_ukolu(): vrací postupně stránky úkolů (list[Ukol]), nejvýše velikost_stranky úkolů v každé
+def stranky_ukolu(conn, stavy=None, velikost_stranky=VELIKOST_STRANKY, od_id=0):
+    if velikost_stranky < 1:
+        raise ValueError("Parametr velikost_stranky musí být alespoň 1.")
+
+    sql = f"SELECT {SQL_SLOUPCE} FROM ukoly WHERE id > %s"
+    if stavy:
+        sql += f" AND stav IN ({', '.join(['%s'] * len(stavy))})"
+    sql += " ORDER BY id LIMIT %s"
+
+    posledni_id = od_id
+    while True:
+        with spojeni(conn) as spojeni_db:
+            cursor = kurzor(spojeni_db)
+            cursor.execute(sql, (posledni_id, *(stavy or ()), velikost_stranky))
+            stranka = list(map(Ukol._make, cursor.fetchall()))
+            cursor.close()
+
+        if stranka:
+            yield stranka
+        if len(stranka) < velikost_stranky:     # neúplná stránka = konec tabulky, další dotaz už není potřeba
+            return
+        posledni_id = stranka[-1].id
+
+# prochazet_ukoly(): vrací postupně jednotlivé úkoly (Ukol), interně je načítá po stránkách
+def prochazet_ukoly(conn, stavy=None, velikost_stranky=VELIKOST_STRANKY, od_id=0):
+    for stranka in stranky_ukolu(conn, stavy, velikost_stranky, od_id):
+        yield from stranka
+
+# d) zobrazit_ukoly_strankovane():
+# UI funkce – výpis úkolů po stránkách, volba 2 z hlavního menu (nedokončené úkoly);
+# uživatel přechází na další stránku (Enter), předchozí stránku (p) nebo výpis ukončí (k), viz strankovat() ve vypis.py;
+# stránka se z DB načte až při přechodu na ni – keyset podle id,
+# začátky již zobrazených stránek se pamatují pro návrat zpět;
+# načtené stránky se ukládají do cache výpisů (klíč stavy, od_id a velikost stránky, zneplatnění jako u celých výpisů);
+# velikost_stranky=None = nastavená velikost stránky výpisu (UI_PAGE_SIZE, výchozí 20);
+# funkce vrací True (něco bylo zobrazeno), [] (žádné úkoly) nebo False (SQL chyba)
+def zobrazit_ukoly_strankovane(conn, stavy=NEDOKONCENE_STAVY, velikost_stranky=None):
+    velikost_stranky = velikost_stranky or velikost_stranky_vypisu()
+    zacatky = [0]               # id, za kterým začíná stránka s daným pořadovým číslem
+
+    def nacist_stranku(cislo):
+        od_id = zacatky[cislo]
+        stranka = cache_vypisu.ziskat(
+            conn, stavy, lambda: next(stranky_ukolu(conn, stavy, velikost_stranky, od_id=od_id), []),
+            stranka=(od_id, velikost_stranky))
+        if stranka and len(zacatky) == cislo + 1:
+            zacatky.append(stranka[-1].id)
+        return stranka
+
+    try:
+        vysledek = strankovat(nacist_stranku, "SEZNAM ÚKOLŮ:" if stavy else "SEZNAM VŠECH ÚKOLŮ:", velikost_stranky)
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolů: {err}")
+        return False
+
+    if vysledek == []:
+        print("Neexistují žádné nedokončené úkoly." if stavy else "Tabulka 'ukoly' je prázdná.")
+    return vysledek
+
+# e) existuji_ukoly():
+# levná kontrola, zda tabulka 'ukoly' obsahuje alespoň jeden úkol (SELECT 1 ... LIMIT 1, bez načtení a výpisu tabulky);
+# funkce vrací True, [] (prázdná tabulka) nebo False (SQL chyba)
+# – stejně jako dřívější kontrola přes zobrazit_vsechny_ukoly()
+def existuji_ukoly(conn):
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            cursor.execute("SELECT 1 FROM ukoly LIMIT 1")
+            radek = cursor.fetchone()
+            cursor.close()
+        return True if radek else []
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolů: {err}")
+        return False
+
+# f) najit_ukol_db():
+# načtení jednoho úkolu podle id (dotaz přes primární klíč);
+# s parametrem archiv=True se úkol, který v tabulce 'ukoly' není, hledá i v archivu dokončených úkolů (archiv.py);
+# funkce vrací záznam Ukol s úkolem, None (úkol s daným id neexistuje) nebo False (SQL chyba)
+def najit_ukol_db(id_ukolu, conn, archiv=False):
+    try:
+        with spojeni(conn) as spojeni_db:
+            cursor = pripraveny_kurzor(spojeni_db, SQL_NAJIT_UKOL)
+            cursor.execute(SQL_NAJIT_UKOL, (id_ukolu,))
+            radek = cursor.fetchone()
+            cursor.close()
+        if radek:
+            return Ukol._make(radek)
+        return najit_v_archivu(id_ukolu, conn) if archiv else None
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání úkolu: {err}")
+        return False
+
+
+
+# g) pomocné UI funkce pro aktualizovat_ukol(), odstranit_ukol()
+# _nabidnout_vypis(): volitelný stránkovaný výpis všech úkolů před zadáním ID; vrací False jen při SQL chybě výpisu
+def _nabidnout_vypis(conn):
+    if input("Zobrazit seznam úkolů? (a/n): ").strip().lower() == "a":
+        return zobrazit_ukoly_strankovane(conn, stavy=None)
+    return None
+
+# _zobrazit_zvoleny_ukol(): ověření a zobrazení úkolu zvoleného podle ID; vrací True (úkol existuje) nebo False
+def _zobrazit_zvoleny_ukol(id_ukolu, conn):
+    ukol = najit_ukol_db(id_ukolu, conn)
+    if ukol is False:
+        return False
+    if ukol is None:
+        print("Úkol s tímto ID neexistuje.")
+        return False
+    print(f"Zvolený úkol: {ukol['id']}. {ukol['nazev']} - {ukol['popis']} ({ukol['stav']})")
+    return True
+
 
 
 # 5) Změna stavu úkolu
 # funkce pro změnu stavu úkolu dle zadaného ID úkolu, volba 3 z hlavního menu;
 # a) aktualizovat_ukol(): ověřuje prázdný seznam úkolů, načítá pouze data z uživatelského vstupu, částečně je validuje (int) a předává svojí databázové variantě do jejích parametrů;
 # b) aktualizovat_ukol_db(): db varianta funkce, která provádí změnu stavu úkolu v databázové tabulce 'ukoly'
+# c) aktualizovat_ukoly_db(): hromadná změna stavu podle seznamu ID nebo podmínky (není přístupná z hlavního menu)
 
 # a) aktualizovat_ukol():
 # funkce pouze pro zjištění a validaci uživatelského vstupu a zjištění, zda seznam úkolů obsahuje data;
 # vrací True/False dle úspěchu nebo prázdný seznam v případě prázdné tabulky 'ukoly' 
 def aktualizovat_ukol(conn):
     # kontrola, zda v tabulce 'ukoly' vůbec existují nějaké úkoly (bez filtru, všechny úkoly)
-    vsechny_ukoly = zobrazit_vsechny_ukoly(conn)
-    if not vsechny_ukoly:
+    # – dotaz LIMIT 1, bez načtení tabulky
+    existuji = existuji_ukoly(conn)
+    if existuji is False:      # technická chyba při SELECTu
+        return False
+    if not existuji:
         print("Tabulka 'ukoly' je prázdná. Nejsou k dispozici žádné úkoly k aktualizaci.")    
         return []       # funkce vrací prázdný seznam      
-    if vsechny_ukoly is False: # technická chyba při SELECTu
-        return False                                                                                                                         
+
+    # výpis úkolů je volitelný a stránkovaný (na velké tabulce se nevypisuje celá tabulka)
+    if _nabidnout_vypis(conn) is False:
+        return False
 
     # uživatelský vstup: ID úkolu
     vstup_id_ukolu = input("Zadejte ID úkolu, u kterého chcete měnit jeho stav: ").strip()   # string, bez převodu na int, odstranění mezer před a po stringu
@@ -224,6 +495,10 @@ def aktualizovat_ukol(conn):
     else:
         id_ukolu = int(vstup_id_ukolu)
 
+    # ověření existence zvoleného úkolu dotazem na jeden řádek podle id
+    if _zobrazit_zvoleny_ukol(id_ukolu, conn) is not True:
+        return False
+
     # uživatelský vstup: výběr stavu úkolu
     print("Zvolte nový stav daného úkolu:")
     print("1. probíhá\n2. hotovo")
@@ -244,38 +519,142 @@ def aktualizovat_ukol(conn):
 # funkce vrací True nebo False dle úspěšnosti provedení aktualizace stavu
 def aktualizovat_ukol_db(id_ukolu, novy_stav, conn):
     try:
-        cursor = conn.cursor()
-        cursor.execute("UPDATE ukoly SET stav = %s WHERE id = %s", (novy_stav, id_ukolu))
-        if cursor.rowcount == 0:
-            cursor.close()
-            print("Úkol s tímto ID neexistuje.")
-            return False
-        else:
-            conn.commit()
-            cursor.close()
-            print(f"Stav úkolu s ID {id_ukolu} byl změněn na '{novy_stav}'.")        
-            return True
+        with spojeni(conn) as conn:
+            stary_stav = puvodni_stav(conn, id_ukolu)       # jen při zapnutých čítačích souhrnu (souhrn.py)
+            cursor = pripraveny_kurzor(conn, SQL_AKTUALIZOVAT_UKOL)
+            cursor.execute(SQL_AKTUALIZOVAT_UKOL, (novy_stav, id_ukolu, novy_stav))
+            if cursor.rowcount == 0:
+                cursor.close()
+                # uvolnění zámku z puvodni_stav() – připojení může zůstat otevřené dlouho
+                _odvolat(conn)
+                print("Úkol s tímto ID neexistuje.")
+                return False
+            else:
+                if stary_stav is not None and stary_stav != novy_stav:
+                    zmenit_citace(conn, {stary_stav: -1, novy_stav: 1})
+                _potvrdit(conn)
+                cursor.close()
+                cache_vypisu.zneplatnit(conn, ids=(id_ukolu,), stavy=(novy_stav,))
+                print(f"Stav úkolu s ID {id_ukolu} byl změněn na '{novy_stav}'.")        
+                return True
   
     except mysql.connector.Error as err:
         print(f"Chyba při změně stavu úkolu: {err}")
         return False
 
+# c) aktualizovat_ukoly_db():
+# hromadná změna stavu – úkoly se vybírají podle kolekce ID (parametr ids)
+# nebo podle podmínky (parametry stav, starsi_nez), např. všechny úkoly 'probíhá' vytvořené před daným datem:
+# aktualizovat_ukoly_db(None, "hotovo", conn, stav="probíhá", starsi_nez=datum);
+# při zadání ids i podmínky se změní jen ty úkoly ze seznamu, které podmínce odpovídají;
+# úkoly se zpracovávají po dávkách (SELECT ... FOR UPDATE + UPDATE ... WHERE id IN (...)) v jedné transakci,
+# commit proběhne jednou na konci;
+# funkce vrací dvojici (seznam změněných ID, seznam chybějících ID – neexistují / neodpovídají podmínce)
+# nebo False při SQL chybě (nic se nezmění)
+def aktualizovat_ukoly_db(ids, novy_stav, conn, stav=None, starsi_nez=None, batch_size=1000):
+    zmenene, chybejici = [], []
+    citace = dict.fromkeys(STAVY_UKOLU, 0)      # změny čítačů souhrnu za všechny dávky, zapíšou se jednou před commitem
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                for nalezene, nenalezene in _davky_ids(cursor, ids, stav, starsi_nez, batch_size):
+                    chybejici.extend(nenalezene)
+                    if nalezene:
+                        cursor.execute(f"UPDATE ukoly SET stav = %s WHERE id IN ({_zastupne_znaky(nalezene)})",
+                                       (novy_stav, *nalezene))
+                        zmenene.extend(nalezene)
+                        for stary_stav in nalezene.values():
+                            citace[stary_stav] -= 1
+                        citace[novy_stav] += len(nalezene)
+                zmenit_citace(conn, citace)
+                _potvrdit(conn)
+            except mysql.connector.Error:
+                _odvolat(conn)
+                raise
+            finally:
+                cursor.close()
+
+        if zmenene:
+            cache_vypisu.zneplatnit(conn, ids=zmenene, stavy=(novy_stav,))
+        if chybejici:
+            print(f"Úkoly s těmito ID neexistují: {', '.join(map(str, chybejici))}.")
+        print(f"Stav {len(zmenene)} úkolů byl změněn na '{novy_stav}'.")
+        return zmenene, chybejici
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při hromadné změně stavu úkolů: {err}")
+        return False
+
+# pomocná funkce pro hromadné funkce (aktualizovat_ukoly_db(), odstranit_ukoly_db()) – výběr ID úkolů po dávkách;
+# generátor vrací dvojice (nalezené úkoly jako slovník {id: původní stav}, chybějící ID) pro každou dávku,
+# nalezené řádky zamyká (FOR UPDATE) do konce transakce; původní stavy slouží ke změně čítačů souhrnu;
+# a) ids zadána: dávky po batch_size ID (seřazených, bez duplicit), vybírá se WHERE id IN (...) [+ podmínka]
+# b) ids = None: dávky podle podmínky stránkované přes id
+#    (WHERE podmínka AND id > poslední id ORDER BY id LIMIT batch_size)
+def _davky_ids(cursor, ids, stav, starsi_nez, batch_size):
+    if batch_size < 1:
+        raise ValueError("Parametr batch_size musí být alespoň 1.")
+
+    podminky, parametry = [], []
+    if stav is not None:
+        podminky.append("stav = %s")
+        parametry.append(stav)
+    if starsi_nez is not None:
+        podminky.append("datum_vytvoreni < %s")
+        parametry.append(starsi_nez)
+    if ids is None and not podminky:
+        raise ValueError("Zadejte seznam ID nebo podmínku (stav, starsi_nez).")
+    podminka = "".join(f" AND {p}" for p in podminky)
+
+    if ids is not None:
+        ids = sorted({int(id_ukolu) for id_ukolu in ids})
+        for zacatek in range(0, len(ids), batch_size):
+            davka = ids[zacatek:zacatek + batch_size]
+            sql = f"SELECT id, stav FROM ukoly WHERE id IN ({_zastupne_znaky(davka)}){podminka}"
+            cursor.execute(dialekt(cursor).pro_zapis(cursor, sql), (*davka, *parametry))
+            nalezene = dict(cursor.fetchall())
+            yield {i: nalezene[i] for i in davka if i in nalezene}, [i for i in davka if i not in nalezene]
+        return
+
+    posledni_id = 0
+    while True:
+        sql = f"SELECT id, stav FROM ukoly WHERE id > %s{podminka} ORDER BY id LIMIT %s"
+        cursor.execute(dialekt(cursor).pro_zapis(cursor, sql), (posledni_id, *parametry, batch_size))
+        nalezene = dict(cursor.fetchall())
+        if not nalezene:
+            return
+        yield nalezene, []
+        if len(nalezene) < batch_size:
+            return
+        posledni_id = max(nalezene)
+
+# pomocná funkce – zástupné znaky %s pro IN (...) s daným počtem hodnot
+def _zastupne_znaky(hodnoty):
+    return ", ".join(["%s"] * len(hodnoty))
+
 
 
 # 6) Odstranění úkolu
 # funkce pro odstranění úkolu dle zadaného ID úkolu, volba 4 z hlavního menu;
 # a) odstranit_ukol(): ověřuje prázdný seznam úkolů, načítá pouze data z uživatelského vstupu, částečně je validuje (int) a předává svojí db variantě do jejích parametrů;
 # b) odstranit_ukol_db(): db varianta funkce, která provádí výmaz zadaného úkolu z databázové tabulky 'ukoly'
+# c) odstranit_ukoly_db(): hromadný výmaz podle seznamu ID nebo podmínky (není přístupná z hlavního menu)
 
 # a) odstranit_ukol():
 # vrací True/False dle úspěchu nebo prázdný seznam v případě prázdné tabulky 'ukoly' 
 def odstranit_ukol(conn):    
     # kontrola, zda v tabulce 'ukoly' vůbec existují nějaké úkoly (bez filtru, všechny úkoly)
-    vsechny_ukoly = zobrazit_vsechny_ukoly(conn)
-    if not vsechny_ukoly:
+    # – dotaz LIMIT 1, bez načtení tabulky
+    existuji = existuji_ukoly(conn)
+    if existuji is False:              # technická chyba při SELECTu
+        return False
+    if not existuji:
         print("Nejsou k dispozici žádné úkoly k odstranění.")    
         return []       # funkce vrací prázdný seznam                                                                                                                                     
-    if vsechny_ukoly is False:         # technická chyba při SELECTu
+
+    # výpis úkolů je volitelný a stránkovaný (na velké tabulce se nevypisuje celá tabulka)
+    if _nabidnout_vypis(conn) is False:
         return False
 
     # uživatelský vstup: ID úkolu
@@ -289,6 +668,10 @@ def odstranit_ukol(conn):
         return False                                                                                                                                         
     else:
         id_ukolu = int(vstup_id_ukolu)
+
+    # ověření existence zvoleného úkolu dotazem na jeden řádek podle id
+    if _zobrazit_zvoleny_ukol(id_ukolu, conn) is not True:
+        return False
   
     # volání db funkce, předání hodnoty z uživatelského vstupu (id_ukolu) a objektu conn z pripojeni_db() do jejích parametrů   
     return odstranit_ukol_db(id_ukolu, conn)       
@@ -297,79 +680,258 @@ def odstranit_ukol(conn):
 # funkce vrací True nebo False dle úspěšnosti provedení výmazu
 def odstranit_ukol_db(id_ukolu, conn):
     try:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM ukoly WHERE id = %s", (id_ukolu,))
-        if cursor.rowcount == 0:
-            print("Úkol s tímto ID neexistuje.")
-            cursor.close()
-            return False
-        else:
-            conn.commit()
-            cursor.close()
-            print(f"Úkol s ID {id_ukolu} byl odstraněn.")    
-            return True
+        with spojeni(conn) as conn:
+            stary_stav = puvodni_stav(conn, id_ukolu)       # jen při zapnutých čítačích souhrnu (souhrn.py)
+            cursor = pripraveny_kurzor(conn, SQL_ODSTRANIT_UKOL)
+            cursor.execute(SQL_ODSTRANIT_UKOL, (id_ukolu,))
+            if cursor.rowcount == 0:
+                print("Úkol s tímto ID neexistuje.")
+                cursor.close()
+                _odvolat(conn)
+                return False
+            else:
+                if stary_stav is not None:
+                    zmenit_citace(conn, {stary_stav: -1})
+                zaznamenat_smazani(conn, (id_ukolu,))          # záznam pro přehled změn (zmeny.py)
+                _potvrdit(conn)
+                cursor.close()
+                cache_vypisu.zneplatnit(conn, ids=(id_ukolu,))
+                print(f"Úkol s ID {id_ukolu} byl odstraněn.")    
+                return True
     
     except mysql.connector.Error as err:
         print(f"Chyba při výmazu úkolu: {err}")
         return False
 
+# c) odstranit_ukoly_db():
+# hromadný výmaz – úkoly se vybírají podle kolekce ID (parametr ids) nebo podle podmínky (parametry stav, starsi_nez),
+# stejně jako u aktualizovat_ukoly_db(); výmaz probíhá po dávkách (DELETE ... WHERE id IN (...)) v jedné transakci;
+# funkce vrací dvojici (seznam odstraněných ID, seznam chybějících ID) nebo False při SQL chybě (nic se neodstraní)
+def odstranit_ukoly_db(ids, conn, stav=None, starsi_nez=None, batch_size=1000):
+    odstranene, chybejici = [], []
+    citace = dict.fromkeys(STAVY_UKOLU, 0)
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                for nalezene, nenalezene in _davky_ids(cursor, ids, stav, starsi_nez, batch_size):
+                    chybejici.extend(nenalezene)
+                    if nalezene:
+                        cursor.execute(f"DELETE FROM ukoly WHERE id IN ({_zastupne_znaky(nalezene)})", tuple(nalezene))
+                        zaznamenat_smazani(conn, nalezene)
+                        odstranene.extend(nalezene)
+                        for stary_stav in nalezene.values():
+                            citace[stary_stav] -= 1
+                zmenit_citace(conn, citace)
+                _potvrdit(conn)
+            except mysql.connector.Error:
+                _odvolat(conn)
+                raise
+            finally:
+                cursor.close()
+
+        if odstranene:
+            cache_vypisu.zneplatnit(conn, ids=odstranene)
+        if chybejici:
+            print(f"Úkoly s těmito ID neexistují: {', '.join(map(str, chybejici))}.")
+        print(f"Odstraněno úkolů: {len(odstranene)}.")
+        return odstranene, chybejici
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při hromadném výmazu úkolů: {err}")
+        return False
+
 
 
 # 7) Hlavní menu
 def hlavni_menu(conn):
 # pouze textové namapování volby s příslušnou funkcí;
-# nekonečný cyklus, po dokončení běhu každé funkce se zobrazuje hlavní menu, dokud ho nepřeruší volba 5 s break
+# nekonečný cyklus, po dokončení běhu každé funkce se zobrazuje hlavní menu, dokud ho nepřeruší volba 7 s break
     while True:   
         print("\nSprávce úkolů - Hlavní nabídka")
         print("1. Přidat úkol")
         print("2. Zobrazit úkoly")
         print("3. Aktualizovat úkol")
         print("4. Odstranit úkol")
-        print("5. Ukončit program")
+        print("5. Souhrn úkolů")
+        print("6. Hledat úkol")
+        print("7. Ukončit program")
 
-        vstup_volba = input("Vyberte možnost (1-5): ").strip()        # string, bez převodu na int, odstranění mezer před a po stringu
+        # string, bez převodu na int, odstranění mezer před a po stringu
+        vstup_volba = input("Vyberte možnost (1-7): ").strip()
 
         # kontrola dat z uživatelského vstupu ještě před voláním funkce;
         # 1) kontrola správnosti datového typu (celé číslo/integer) - místo vyvolávání výjimky ValueError
         if not vstup_volba.isdecimal():                                     # Pokud uživatel nezadal celé číslo,
-            print("Chybně zadaný datový typ. Zadejte číslo v rozsahu 1-5.") # vytiskni mu hlášku
+            print("Chybně zadaný datový typ. Zadejte číslo v rozsahu 1-7.") # vytiskni mu hlášku
             continue  # a vráť ho do hl. menu a pokračuj další iterací.
 
         volba = int(vstup_volba) # převod už prověřené uživatelské hodnoty (čísla) na datový typ integer
 
-        # 2) kontrola správnosti rozsahu zadaného čísla (1-5) - místo vyvolávání výjimky IndexError
-        if volba < 1 or volba > 5:                        # Pokud uživatel nezadal číslo v rozsahu 1-5,
-            print("Volba akce se zadaným číslem neexistuje. Zadejte číslo v rozsahu 1-5.")
+        # 2) kontrola správnosti rozsahu zadaného čísla (1-7) - místo vyvolávání výjimky IndexError
+        if volba < 1 or volba > 7:                        # Pokud uživatel nezadal číslo v rozsahu 1-7,
+            print("Volba akce se zadaným číslem neexistuje. Zadejte číslo v rozsahu 1-7.")
             continue                                      # tak ho vrať do hl. menu a pokračuj další iterací.
         
-        # namapování uživatelské volby s příslušnými funkcemi, pouze volba 5 není spojena s funkcí, ale s příkazem break;
-        # funkce se volá s už jen ověřenými platnými vstupy (integer v rozsahu 1-5)
+        # namapování uživatelské volby s příslušnými funkcemi,
+        # pouze volba 7 není spojena s funkcí, ale s příkazem break;
+        # funkce se volá s už jen ověřenými platnými vstupy (integer v rozsahu 1-7)
         if volba == 1:
             pridat_ukol(conn)
         elif volba == 2:
-            zobrazit_ukoly(conn)
+            zobrazit_ukoly_strankovane(conn)
         elif volba == 3:
             aktualizovat_ukol(conn)
         elif volba == 4:
             odstranit_ukol(conn)
         elif volba == 5:
+            zobrazit_souhrn(conn)           # počty úkolů podle stavu a dne (souhrn.py)
+        elif volba == 6:
+            hledat_ukol(conn)               # vyhledávání v názvu a popisu (hledani.py)
+        elif volba == 7:
             print("Konec programu.")
             break                # ukončení věčného cyklu while true / zobrazování hl. menu, konec programu
 
 
 
 # 8. Hlavní funkce pro spuštění programu
-# v úvodu spustí příslušné funkce pro připojení do dané databáze, vytvoří či potvrdí existenci tabulky 'ukoly' a spustí hl. menu
-def main():
-    conn = pripojeni_db()
-    if conn:
-        vytvoreni_tabulky(conn)
-        hlavni_menu(conn)
+# v úvodu spustí příslušné funkce pro připojení do dané databáze, aplikuje migrace schématu
+# (vytvoří či potvrdí existenci tabulky 'ukoly' a jejích indexů) a spustí hl. menu;
+# s podpříkazem (parametry příkazové řádky, argv) běží program neinteraktivně bez hlavního menu (viz prenos.py):
+#   import [SOUBOR|-] [--format csv|jsonl] [--davka N]              – hromadné vložení úkolů ze souboru nebo stdin
+#   export [SOUBOR|-] [--format csv|jsonl] [--stav STAV ...] [--od-id N] – výpis úkolů do souboru nebo stdout
+#   archivovat [--dnu N] [--davka N] [--pauza S] [--max-davek N]     – archivace starých dokončených úkolů (archiv.py)
+#   zmeny-udrzba [--dnu N] [--davka N] [--pauza S]                   – čištění starých záznamů o smazání (zmeny.py)
+#   server [--host ADRESA] [--port N] [--vlaken N]                   – HTTP/JSON API nad úkoly (viz http_api.py)
+# přepínač --test-db připojí podpříkaz k testovací db; funkce vrací návratový kód programu (0 = úspěch, 1 = chyba)
+def main(argv=None):
+    args = _parametry_prikazove_radky(argv)
+
+    # u podpříkazů jdou hlášky připojení a migrací na stderr, aby export na stdout obsahoval jen data
+    with contextlib.redirect_stdout(sys.stderr) if args.prikaz else contextlib.nullcontext():
+        conn = pripojeni_db(test_db=args.test_db, odolne=True)     # menu drží připojení po celou dobu běhu
+        if conn:
+            vytvoreni_tabulky(conn)      # aplikace migrací schématu (migrace.py)
+    if not conn:
+        return 1
+    if args.velikost_stranky:
+        nastavit_vypis(velikost_stranky=args.velikost_stranky)     # až po připojení – přednost před UI_PAGE_SIZE z .env
+
+    try:
+        if args.prikaz is None:
+            hlavni_menu(conn)
+            return 0
+        return _spustit_prikaz(args, conn)
+    finally:
         conn.close()
 
+# parametry příkazové řádky – bez podpříkazu se spustí hlavní menu;
+# argparse se importuje až zde (při spuštění programu), ne při importu balíčku
+def _parametry_prikazove_radky(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="task_manager_mysql",
+                                     description="Správce úkolů (Task Manager – Python + MySQL).")
+    parser.add_argument("--velikost-stranky", type=int,
+                        help="počet úkolů na jedné stránce výpisu (výchozí UI_PAGE_SIZE, 20)")
+    podprikazy = parser.add_subparsers(dest="prikaz")
+
+    importovat = podprikazy.add_parser("import", help="hromadné vložení úkolů z CSV/JSONL (soubor nebo stdin)")
+    importovat.add_argument("soubor", nargs="?", default="-", help="vstupní soubor, '-' = stdin (výchozí)")
+    importovat.add_argument("--format", choices=("csv", "jsonl"),
+                            help="formát vstupu (výchozí podle přípony, jinak jsonl)")
+    importovat.add_argument("--davka", type=int, default=1000, help="počet řádků jedné dávky INSERTu")
+    importovat.add_argument("--procesu", type=int,
+                            help="import souboru ve více procesech (paralelni_import.py); 0 = počet CPU")
+    importovat.add_argument("--od-zacatku", action="store_true",
+                            help="nenavazovat na nedokončený paralelní import, importovat znovu")
+
+    exportovat = podprikazy.add_parser("export", help="výpis úkolů do CSV/JSONL (soubor nebo stdout)")
+    exportovat.add_argument("soubor", nargs="?", default="-", help="výstupní soubor, '-' = stdout (výchozí)")
+    exportovat.add_argument("--format", choices=("csv", "jsonl"),
+                            help="formát výstupu (výchozí podle přípony, jinak jsonl)")
+    exportovat.add_argument("--stav", nargs="+", choices=STAVY_UKOLU, help="exportovat jen úkoly v zadaných stavech")
+    exportovat.add_argument("--od-id", type=int, default=0,
+                            help="exportovat jen úkoly s id větším než zadané (navázání exportu)")
+
+    archivovat = podprikazy.add_parser("archivovat", help="přesun starých dokončených úkolů do archivu (ukoly_archiv)")
+    archivovat.add_argument("--dnu", type=int, help="archivovat úkoly 'hotovo' bez změny déle než DNU dní "
+                                                    "(výchozí ARCHIVE_AFTER_DAYS, 30)")
+    archivovat.add_argument("--davka", type=int, default=500, help="počet úkolů přesunutých jednou transakcí")
+    archivovat.add_argument("--pauza", type=float, default=0.1, help="pauza mezi dávkami v sekundách")
+    archivovat.add_argument("--max-davek", type=int, help="nejvyšší počet dávek jednoho spuštění (výchozí bez omezení)")
+
+    udrzba = podprikazy.add_parser("zmeny-udrzba", help="odstranění starých záznamů o smazání úkolů (ukoly_smazane)")
+    udrzba.add_argument("--dnu", type=int,
+                        help="odstranit záznamy o smazání starší než DNU dní (výchozí CHANGES_RETENTION_DAYS, 30)")
+    udrzba.add_argument("--davka", type=int, default=1000, help="počet záznamů odstraněných jednou transakcí")
+    udrzba.add_argument("--pauza", type=float, default=0.1, help="pauza mezi dávkami v sekundách")
+
+    server = podprikazy.add_parser("server", help="HTTP/JSON API nad úkoly (asyncio, keep-alive, výpis po stránkách)")
+    server.add_argument("--host", help="adresa serveru (výchozí API_HOST, 127.0.0.1 = jen localhost)")
+    server.add_argument("--port", type=int, help="port serveru (výchozí API_PORT, 8080)")
+    server.add_argument("--vlaken", type=int,
+                        help="počet pracovních vláken = připojení k DB (výchozí API_DB_THREADS, 4)")
+
+    for podprikaz in (importovat, exportovat, archivovat, udrzba, server):
+        podprikaz.add_argument("--test-db", action="store_true", help="použít testovací databázi")
+    args = parser.parse_args(argv)
+    if args.prikaz is None:
+        args.test_db = False
+    return args
+
+# provedení podpříkazu import / export / archivovat / zmeny-udrzba / server; soubor '-' = stdin / stdout
+def _spustit_prikaz(args, conn):
+    if args.prikaz == "server":
+        from .http_api import spustit
+        spustit(test_db=args.test_db, host=args.host, port=args.port, vlaken=args.vlaken)
+        return 0
+    if args.prikaz == "archivovat":
+        vysledek = archivovat_ukoly(conn, args.dnu, batch_size=args.davka, pauza=args.pauza, max_davek=args.max_davek)
+        return 0 if vysledek is not False else 1
+    if args.prikaz == "zmeny-udrzba":
+        vysledek = vycistit_smazane(conn, args.dnu, batch_size=args.davka, pauza=args.pauza)
+        return 0 if vysledek is not False else 1
+
+    from .prenos import exportovat_ukoly, importovat_ukoly, urcit_format
+
+    format = urcit_format(args.soubor, args.format)
+    if args.prikaz == "import" and args.procesu is not None:
+        if args.soubor == "-":
+            print("Paralelní import (--procesu) vyžaduje vstupní soubor, ne stdin.", file=sys.stderr)
+            return 1
+        from .paralelni_import import importovat_paralelne
+        vysledek = importovat_paralelne(args.soubor, conn, format=format, procesu=args.procesu or None,
+                                        batch_size=args.davka, navazat=not args.od_zacatku)
+        if vysledek is False:
+            return 1
+        for poradi, chyba in vysledek[1][:10]:
+            print(f"Řádek {poradi + 1}: {chyba}", file=sys.stderr)
+        return 0
+    if args.prikaz == "import":
+        soubor = sys.stdin if args.soubor == "-" else open(args.soubor, encoding="utf-8", newline="")
+        try:
+            vysledek = importovat_ukoly(soubor, conn, format, batch_size=args.davka)
+        finally:
+            if soubor is not sys.stdin:
+                soubor.close()
+        if vysledek is False:
+            return 1
+        for poradi, chyba in vysledek[1][:10]:
+            print(f"Řádek {poradi + 1}: {chyba}", file=sys.stderr)
+        return 0
+
+    soubor = sys.stdout if args.soubor == "-" else open(args.soubor, "w", encoding="utf-8", newline="")
+    try:
+        vysledek = exportovat_ukoly(soubor, conn, format, stavy=args.stav, od_id=args.od_id)
+    finally:
+        if soubor is not sys.stdout:
+            soubor.close()
+    return 0 if vysledek is not False else 1
+
 
 if __name__ == "__main__":   # ochrana, při importu do test souborů pro PyTest se nespustí celý zdroják
-    main()
+    raise SystemExit(main())
 
 
 """
@@ -378,12 +940,20 @@ NÁVRATOVÉ HODNOTY FUNKCÍ
 --------------------------------------------------------------
 
 Systémové funkce (DB připojení, tabulka)
-    • pripojeni_db()            → conn / None
+    • pripojeni_db()            → conn / PoolDB (pool=True) / OdolnePripojeni (odolne=True) / None;
+                                  s DB_BACKEND=sqlite EmbeddedPripojeni (embedded_db.py)
     • vytvoreni_tabulky()       → None
+    • aplikovat_migrace()       → list[int] (nově aplikované verze), [] (schéma aktuální), False (SQL chyba)
+    • dialekt()                 → DialektMySQL (dialekt.py) / DialektSQLite (vestavěná databáze, embedded_db.py)
 
 Zobrazovací funkce (SELECT)
-    • zobrazit_ukoly()          → list[dict], [] (prázdná tabulka), False (SQL chyba)
-    • zobrazit_vsechny_ukoly()  → list[dict], [] (prázdná tabulka), False (SQL chyba)
+    • zobrazit_ukoly()          → list[Ukol], [] (prázdná tabulka), False (SQL chyba)
+    • zobrazit_vsechny_ukoly()  → list[Ukol], [] (prázdná tabulka), False (SQL chyba)
+    • stranky_ukolu()           → generátor list[Ukol] (stránky), při SQL chybě výjimka mysql.connector.Error
+    • prochazet_ukoly()         → generátor Ukol (úkoly), při SQL chybě výjimka mysql.connector.Error
+    • zobrazit_ukoly_strankovane() → True, [] (žádné úkoly), False (SQL chyba)
+    • existuji_ukoly()          → True, [] (prázdná tabulka), False (SQL chyba)
+    • najit_ukol_db()           → Ukol, None (úkol neexistuje), False (SQL chyba); s archiv=True hledá i v archivu
 
 UI funkce (uživatelský vstup)
     • pridat_ukol()             → True / False
@@ -394,14 +964,62 @@ Databázové funkce (INSERT / UPDATE / DELETE)
     • pridat_ukol_db()          → True / False
     • aktualizovat_ukol_db()    → True / False
     • odstranit_ukol_db()       → True / False
+    • pridat_ukoly_db()         → (počet vložených, list chyb) / False
+    • aktualizovat_ukoly_db()   → (list změněných ID, list chybějících ID) / False
+    • odstranit_ukoly_db()      → (list odstraněných ID, list chybějících ID) / False
+    • ZapisNaPozadi.pridat_ukol() / aktualizovat_ukol() / odstranit_ukol() → Future s výsledkem True / False
+    • *_async() (async_db.py)   → stejné hodnoty jako synchronní varianty;
+                                  stranky_ukolu_async() – async generátor stránek list[Ukol]
+
+Archivace (archiv.py)
+    • archivovat_ukoly()        → (počet archivovaných, id posledního úkolu) / False
+    • najit_v_archivu()         → Ukol (při opakovaném id naposledy archivovaný), None (úkol v archivu není),
+                                  False (SQL chyba)
+
+Vyhledávání (hledani.py)
+    • hledat_ukoly()            → list[Ukol] (stránka výsledků), [] (nic nenalezeno), False (SQL chyba)
+    • hledat_ukol()             → True, [] (nic nenalezeno), False (prázdný výraz nebo SQL chyba)
+
+Souhrn úkolů (souhrn.py)
+    • pocty_podle_stavu()       → dict {stav: počet} / False (SQL chyba)
+    • pocty_podle_dnu()         → list[(datum, nezahájeno, probíhá, hotovo)], [] (žádné úkoly v období),
+                                  False (SQL chyba)
+    • zobrazit_souhrn()         → True, [] (prázdná tabulka), False (SQL chyba)
+    • zkontrolovat_citace()     → list rozdílů (stav, čítač, skutečnost), [] (čítače souhlasí), False (SQL chyba)
+
+Odolné připojení (odolne.py)
+    • OdolnePripojeni.cursor()  → kurzor; ztracené připojení nahradí novým, čtecí dotaz po výpadku zopakuje,
+                                  jinak (zápis, vyčerpané pokusy / rozpočet) výjimka mysql.connector.Error
+    • RozpocetOpakovani.cerpat() → True (opakování povoleno) / False (rozpočet vyčerpán)
+
+Přehled změn (zmeny.py)
+    • zmeny_od()                → (list[Ukol] změněných, list ID odstraněných, nová značka);
+                                  bez změn ([], [], stejná značka); False (SQL chyba); neplatná značka vyvolá ValueError
+    • vycistit_smazane()        → počet odstraněných záznamů o smazání / False (SQL chyba)
+
+HTTP API (http_api.py)
+    • spustit_server()          → asyncio.Server (endpointy /ukoly, /ukoly/{id}; chyby jako JSON se stavovým kódem)
+    • spustit()                 → None (běží do přerušení Ctrl+C)
+
+Transakce (transakce.py)
+    • vnejsi_transakce()        → context manager (vrací conn); potvrzení / odvolání na konci bloku, výjimky propouští
+
+Výpis úkolů (vypis.py)
+    • strankovat()              → True, [] (žádné úkoly), False (chyba načtení stránky)
+    • vypsat_ukoly()            → None
+
+Import / export (prenos.py, paralelni_import.py)
+    • importovat_ukoly()        → (počet vložených, list chyb) / False
+    • importovat_paralelne()    → (počet vložených celého souboru, list chyb) / False (nové spuštění naváže)
+    • exportovat_ukoly()        → (počet exportovaných, id posledního úkolu) / False
 
 Řídicí funkce
     • hlavni_menu()             → None
-    • main()                    → None
+    • main()                    → 0 (úspěch) / 1 (chyba připojení nebo podpříkazu)
 
 --------------------------------------------------------------
 Logika návratových hodnot
-    • True / list[dict] / conn  → operace úspěšná
+    • True / list[Ukol] / conn  → operace úspěšná
     • []                        → prázdná tabulka (není chyba)
     • False                     → neplatný vstup nebo SQL/technická chyba
     • None                      → pouze efekt, žádná návratová hodnota
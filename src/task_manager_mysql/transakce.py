@@ -0,0 +1,82 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: transakce řízené volajícím (vnější transakce)
+-------------------------------------------------------------------------------------------
+Popis:
+DB funkce zápisu potvrzují svou práci samy (commit po každé změně nebo dávce).
+Uvnitř bloku with vnejsi_transakce(conn) transakci řídí volající: DB funkce volané
+s tímto připojením místo commit() jen posunou bod uložení (SAVEPOINT) a místo
+rollback() se vrátí k poslednímu bodu uložení – odvolají tedy jen svou rozpracovanou
+práci, stejně jako při běžném commit / rollback. O výsledku celé transakce rozhodne
+až konec bloku: potvrdit=True změny potvrdí, jinak (a vždy při výjimce) se odvolají.
+
+    • testy – každý test běží ve vnější transakci, která se po testu odvolá
+      (místo mazání tabulek před a po testu, viz tests/conftest.py)
+    • více DB funkcí jako jedna atomická změna – with vnejsi_transakce(conn, potvrdit=True)
+
+Vnější transakce platí jen pro zadané připojení; DB funkce, které dostanou PoolDB,
+si půjčují jiná připojení a potvrzují samy. Migrace schématu (DDL) transakci v MySQL
+vždy potvrdí, proto se uvnitř vnější transakce nespouštějí. Změny ve vnější transakci
+nevidí jiná připojení a do commitu ani FULLTEXT hledání (InnoDB aktualizuje FULLTEXT
+index až při commitu).
+==============================================================================================
+"""
+
+import weakref
+from contextlib import contextmanager
+
+BOD_ULOZENI = "tm_potvrzeno"        # název bodu uložení, ke kterému se vrací _odvolat()
+
+_vnejsi = weakref.WeakSet()         # připojení s transakcí řízenou volajícím
+
+
+# 1) Vnější transakce
+# conn = samotné připojení bez rozpracované transakce (ne PoolDB); potvrdit=True potvrdí změny při řádném konci bloku,
+# jinak se transakce na konci bloku odvolá; blok vrací předané připojení
+@contextmanager
+def vnejsi_transakce(conn, potvrdit=False):
+    conn.start_transaction()
+    _vnejsi.add(conn)
+    try:
+        _bod_ulozeni(conn, "SAVEPOINT")
+        yield conn
+    except BaseException:
+        _vnejsi.discard(conn)
+        conn.rollback()
+        raise
+    _vnejsi.discard(conn)
+    if potvrdit:
+        conn.commit()
+        # výpisy načtené jinými připojeními před commitem už neplatí
+        # (DB funkce je zneplatnily už při posunu bodu uložení)
+        from .cache import cache_vypisu
+        from .ukol import STAVY_UKOLU
+        cache_vypisu.zneplatnit(conn, stavy=STAVY_UKOLU)
+    else:
+        conn.rollback()
+
+def ve_vnejsi_transakci(conn):
+    return conn in _vnejsi
+
+
+# 2) Potvrzení a odvolání práce DB funkce
+# DB funkce volají místo conn.commit() / conn.rollback(); mimo vnější transakci jde o běžný commit / rollback
+def _potvrdit(conn):
+    if conn in _vnejsi:
+        _bod_ulozeni(conn, "SAVEPOINT")
+    else:
+        conn.commit()
+
+def _odvolat(conn):
+    if conn in _vnejsi:
+        _bod_ulozeni(conn, "ROLLBACK TO SAVEPOINT")
+    else:
+        conn.rollback()
+
+# příkaz nad bodem uložení – běžným kurzorem mimo měření SQL dotazů (metriky.py), nejde o dotaz aplikace
+def _bod_ulozeni(conn, prikaz):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"{prikaz} {BOD_ULOZENI}")
+    finally:
+        cursor.close()
@@ -0,0 +1,57 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: záznam úkolu (Ukol)
+-------------------------------------------------------------------------------------------
+Popis:
+Úsporný neměnný záznam jednoho řádku tabulky 'ukoly', který vracejí výpisy úkolů
+(zobrazit_ukoly(), zobrazit_vsechny_ukoly(), stranky_ukolu(), najit_ukol_db()).
+
+Řádky se načítají běžným kurzorem jako n-tice ve stálém pořadí sloupců (SLOUPCE_UKOLU),
+takže převod na záznam je jen Ukol._make(radek) – bez slovníku a opakovaných klíčů
+pro každý řádek (namedtuple se __slots__ = (), paměť zhruba jako n-tice).
+
+Záznam podporuje přístup jako ke slovníku i atributům:
+    ukol["nazev"], ukol.nazev, ukol.get("stav"), ukol.keys(), ukol.items(), dict(ukol)
+Převod na slovník (např. pro JSON): ukol.jako_slovnik().
+==============================================================================================
+"""
+
+from collections import namedtuple
+
+# sloupce tabulky 'ukoly' v pořadí, ve kterém je vybírají dotazy výpisů (SELECT {SQL_SLOUPCE} FROM ukoly ...)
+SLOUPCE_UKOLU = ("id", "nazev", "popis", "stav", "datum_vytvoreni")
+SQL_SLOUPCE = ", ".join(SLOUPCE_UKOLU)
+
+# povolené stavy úkolu (ENUM sloupce 'stav') v pořadí, ve kterém je úkol prochází
+STAVY_UKOLU = ("nezahájeno", "probíhá", "hotovo")
+
+_INDEXY = {sloupec: index for index, sloupec in enumerate(SLOUPCE_UKOLU)}
+
+
+class Ukol(namedtuple("_UkolZaklad", SLOUPCE_UKOLU)):
+    __slots__ = ()
+
+    # ukol["nazev"] – přístup podle názvu sloupce jako u slovníku, ukol[0] – podle pozice jako u n-tice
+    def __getitem__(self, klic):
+        if isinstance(klic, str):
+            try:
+                return tuple.__getitem__(self, _INDEXY[klic])
+            except KeyError:
+                raise KeyError(klic) from None
+        return tuple.__getitem__(self, klic)
+
+    def get(self, klic, vychozi=None):
+        index = _INDEXY.get(klic)
+        return vychozi if index is None else tuple.__getitem__(self, index)
+
+    def keys(self):
+        return SLOUPCE_UKOLU
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return tuple(zip(SLOUPCE_UKOLU, self))
+
+    def jako_slovnik(self):
+        return dict(zip(SLOUPCE_UKOLU, self))
@@ -0,0 +1,170 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: výpis úkolů na terminál (formátování, stránkování)
+-------------------------------------------------------------------------------------------
+Popis:
+Výpisy úkolů se neposílají na výstup po jednotlivých řádcích (print() pro každý úkol),
+ale naformátují se najednou a zapíšou po blocích – terminál s řádkovým bufferem jinak
+provádí zápis (systémové volání) pro každý řádek.
+
+    • formatovat_ukoly() – řádky ve tvaru "id. název - popis (stav)", id zarovnaná
+      doprava; na terminálu se řádky zkracují na jeho šířku (…), aby se stránka
+      nezalomila – šířka se počítá ve sloupcích terminálu (znaky s diakritikou
+      v rozloženém tvaru mají kombinující znaky šířky 0, východoasijské znaky šířku 2)
+    • vypsat_ukoly()     – nadpis a řádky úkolů jedním zápisem po blocích VELIKOST_BLOKU řádků
+    • strankovat()       – stránkovaný výpis s navigací další / předchozí stránka / konec
+                           (výpisy z hlavního menu)
+
+Nastavení (nastavit_vypis() nebo .env): velikost stránky UI_PAGE_SIZE (výchozí 20)
+a tichý režim UI_QUIET=1 pro skripty – výpisy úkolů pak nic nevypisují a funkce jen
+vracejí svá data; ostatní hlášky (chyby, potvrzení změn) se vypisují dál.
+==============================================================================================
+"""
+
+import re
+import shutil
+import sys
+import unicodedata
+
+VELIKOST_BLOKU = 1000       # počet řádků jednoho zápisu na výstup
+
+# znaky, které mohou mít na terminálu jinou šířku než 1 (kombinující znaky, široké východoasijské znaky, emoji);
+# řádek bez nich má šířku rovnou počtu znaků a nemusí se procházet po znacích
+_MOZNA_NE_JEDNA = re.compile(
+    "[\u0300-\u036f\u0483-\u0489\u0591-\u05c7\u0610-\u061a\u064b-\u065f\u0e31-\u0e3a\u1100-\u115f\u1ab0-\u1aff"
+    "\u1dc0-\u1dff\u200b-\u200f\u20d0-\u20ff\u2e80-\ua4cf\uac00-\ud7a3\uf900-\ufaff\ufe00-\ufe0f\ufe20-\ufe2f"
+    "\ufe30-\ufe4f\uff00-\uff60\uffe0-\uffe6\U0001f000-\U0001faff\U00020000-\U0003fffd]"
+)
+
+_tichy = False
+_velikost_stranky = 20
+
+
+# 1) Nastavení výpisu – parametr None ponechá dosavadní hodnotu
+def nastavit_vypis(tichy=None, velikost_stranky=None):
+    global _tichy, _velikost_stranky
+    if velikost_stranky is not None:
+        if velikost_stranky < 1:
+            raise ValueError("Velikost stránky výpisu musí být alespoň 1.")
+        _velikost_stranky = velikost_stranky
+    if tichy is not None:
+        _tichy = bool(tichy)
+
+def tichy_rezim():
+    return _tichy
+
+def velikost_stranky_vypisu():
+    return _velikost_stranky
+
+
+# 2) Šířka textu na terminálu
+# počet sloupců terminálu, které text zabere (kombinující a neviditelné znaky 0, široké znaky 2, ostatní 1)
+def sirka_textu(text):
+    if not _MOZNA_NE_JEDNA.search(text):
+        return len(text)
+    return sum(_sirka_znaku(znak) for znak in text)
+
+def _sirka_znaku(znak):
+    if unicodedata.combining(znak) or unicodedata.category(znak) in ("Mn", "Me", "Cf"):
+        return 0
+    return 2 if unicodedata.east_asian_width(znak) in ("W", "F") else 1
+
+# zkrácení textu na nejvýše sirka sloupců terminálu; zkrácený text končí znakem …
+def oriznout(text, sirka):
+    if len(text) <= sirka and not _MOZNA_NE_JEDNA.search(text):
+        return text
+    if sirka_textu(text) <= sirka:
+        return text
+    zbyva = sirka - 1
+    for index, znak in enumerate(text):
+        zbyva -= _sirka_znaku(znak)
+        if zbyva < 0:
+            return text[:index] + "…"
+    return text
+
+
+# 3) Formátování a zápis výpisu
+# funkce vrací seznam řádků výpisu; sirka = šířka terminálu (0 = řádky se nezkracují)
+def formatovat_ukoly(ukoly, sirka=0):
+    if not ukoly:
+        return []
+    sirka_id = len(str(max(ukol[0] for ukol in ukoly)))
+    radky = [f"{ukol[0]:>{sirka_id}}. {ukol[1]} - {ukol[2]} ({ukol[3]})" for ukol in ukoly]
+    if sirka:
+        radky = [oriznout(radek, sirka) for radek in radky]
+    return radky
+
+# výpis nadpisu a úkolů po blocích VELIKOST_BLOKU řádků (jeden zápis na blok); v tichém režimu nic nevypisuje;
+# vystup = otevřený textový soubor (výchozí sys.stdout), řádky se zkracují jen na terminálu
+def vypsat_ukoly(ukoly, nadpis=None, vystup=None):
+    if _tichy:
+        return
+    vystup = vystup if vystup is not None else sys.stdout
+    radky = formatovat_ukoly(ukoly, _sirka_terminalu(vystup))
+    if nadpis:
+        radky.insert(0, nadpis)
+    for zacatek in range(0, len(radky), VELIKOST_BLOKU):
+        vystup.write("\n".join(radky[zacatek:zacatek + VELIKOST_BLOKU]) + "\n")
+    vystup.flush()
+
+def _sirka_terminalu(vystup):
+    try:
+        if not vystup.isatty():
+            return 0
+    except (AttributeError, ValueError):
+        return 0
+    return shutil.get_terminal_size((0, 0)).columns
+
+
+# 4) Stránkovaný výpis
+# nacist_stranku(cislo) vrací úkoly stránky s pořadovým číslem cislo (od 0) – nejvýše velikost_stranky úkolů –
+# nebo False (chyba);
+# stránky se načítají až při přechodu na ně (Enter = další stránka, p = předchozí stránka, k = konec výpisu);
+# funkce vrací True (něco bylo zobrazeno), [] (žádné úkoly) nebo False (chyba načtení stránky)
+def strankovat(nacist_stranku, nadpis, velikost_stranky=None, vstup=input):
+    velikost = velikost_stranky or _velikost_stranky
+    cislo = 0
+    stranka = nacist_stranku(cislo)
+    if stranka is False:
+        return False
+    if not stranka:
+        return []
+    posledni = cislo if len(stranka) < velikost else None      # číslo poslední stránky, jakmile je známé
+
+    vypsat = True
+    while True:
+        if vypsat:
+            vypsat_ukoly(stranka, nadpis=f"\n{nadpis} (strana {cislo + 1})")
+        if _tichy or (posledni == 0):                           # tichý režim nebo jediná stránka – bez navigace
+            return True
+
+        dalsi = posledni != cislo
+        volby = ["Enter = další stránka"] if dalsi else []
+        if cislo > 0:
+            volby.append("p = předchozí stránka")
+        volby.append("k = konec výpisu" if dalsi else "Enter / k = konec výpisu")
+        volba = vstup(", ".join(volby) + ": ").strip().lower()
+
+        vypsat = True
+        if volba == "k" or (volba == "" and not dalsi):
+            return True
+        if volba == "" and dalsi:
+            nova = nacist_stranku(cislo + 1)
+            if nova is False:
+                return False
+            if not nova:                                        # předchozí stránka byla plná, ale další úkoly už nejsou
+                posledni = cislo
+                vypsat = False
+                print("Další úkoly už nejsou.")
+                continue
+            cislo, stranka = cislo + 1, nova
+            if len(stranka) < velikost:
+                posledni = cislo
+        elif volba == "p" and cislo > 0:
+            nova = nacist_stranku(cislo - 1)
+            if nova is False:
+                return False
+            cislo, stranka = cislo - 1, nova
+        else:
+            vypsat = False
+            print("Neplatná volba.")
@@ -0,0 +1,252 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: zápis na pozadí se skupinovým commitem (write-behind)
+-------------------------------------------------------------------------------------------
+Popis:
+Volitelný režim pro vysoký počet zápisů (přidání úkolu, změna stavu, výmaz úkolu).
+Volající změny jen zařadí do fronty v paměti a hned pokračuje; vlákno na pozadí je
+zapisuje po skupinách v jedné transakci s jedním commitem, jakmile se nasbírá max_davka
+změn nebo uplyne max_zpozdeni sekund od první nezapsané změny.
+
+    • každá zařazená změna vrací Future (concurrent.futures), jejímž výsledkem je stejná
+      hodnota jako u synchronní DB funkce (True / False)
+    • pořadí změn se zachovává, po sobě jdoucí přidání se vkládají jedním příkazem (executemany)
+    • pokud DB odmítne některý příkaz skupiny, skupina se odvolá (rollback) a změny se provedou
+      po jedné synchronními DB funkcemi – chybná změna tak neovlivní ostatní
+    • změny zapsané ve skupině nevypisují hlášky jednotlivých DB funkcí, výsledek nese jen Future
+    • plná fronta (max_fronta) blokuje volajícího, dokud vlákno na pozadí frontu neuvolní (backpressure)
+    • vyprazdnit() počká na zápis všech dosud zařazených změn, zavrit() navíc ukončí vlákno;
+      změny, které nebyly zapsány, nejsou trvalé – před koncem programu je nutné volat zavrit()
+
+Parametr conn je pool (PoolDB) nebo připojení, které nepoužívá současně jiné vlákno.
+
+Použití:
+    with ZapisNaPozadi(conn) as zapis:
+        vysledek = zapis.pridat_ukol("název", "popis")
+        ...
+    vysledek.result()   # True / False
+==============================================================================================
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .cache import cache_vypisu
+from .dialekt import dialekt
+from .metriky import kurzor
+from .ukol import STAVY_UKOLU
+from .ovladac import mysql
+from .pool import spojeni
+from .souhrn import citace_zapnuty, zmenit_citace
+from .transakce import _odvolat, _potvrdit
+from .zmeny import zaznamenat_smazani
+from .task_manager_mysql_p2 import (
+    SQL_PRIDAT_UKOL,
+    SQL_AKTUALIZOVAT_UKOL,
+    SQL_ODSTRANIT_UKOL,
+    _validace_ukolu,
+    _zastupne_znaky,
+    pridat_ukol_db,
+    aktualizovat_ukol_db,
+    odstranit_ukol_db,
+)
+
+# značka ve frontě – požadavek na okamžitý zápis (vyprazdnit) nebo ukončení vlákna (zavrit)
+_VYPRAZDNIT = "vyprazdnit"
+_KONEC = "konec"
+
+
+class ZapisNaPozadi:
+    def __init__(self, conn, max_davka=100, max_zpozdeni=0.05, max_fronta=10000):
+        if max_davka < 1 or max_fronta < 1:
+            raise ValueError("Parametry max_davka a max_fronta musí být alespoň 1.")
+        self.conn = conn
+        self.max_davka = max_davka
+        self.max_zpozdeni = max_zpozdeni
+        self._fronta = queue.Queue(maxsize=max_fronta)
+        self._zamek = threading.Lock()
+        self._uzavreno = False
+        self.skupin = 0                 # počet zapsaných skupin (commitů)
+        self.zapsano = 0                # počet změn zapsaných ve skupině
+        self.po_jedne = 0               # počet změn zapsaných po jedné (po odmítnutí skupiny)
+        self._vlakno = threading.Thread(target=self._smycka, name="task_manager_zapis", daemon=True)
+        self._vlakno.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.zavrit()
+
+    # 1) Zařazení změn do fronty – vracejí Future s výsledkem True / False;
+    # timeout = jak dlouho (s) čekat na místo v plné frontě (None = bez omezení), po jeho vypršení výjimka queue.Full
+    def pridat_ukol(self, nazev, popis, timeout=None):
+        return self._zaradit(("pridat", nazev, popis), timeout)
+
+    def aktualizovat_ukol(self, id_ukolu, novy_stav, timeout=None):
+        return self._zaradit(("aktualizovat", id_ukolu, novy_stav), timeout)
+
+    def odstranit_ukol(self, id_ukolu, timeout=None):
+        return self._zaradit(("odstranit", id_ukolu), timeout)
+
+    def _zaradit(self, zmena, timeout):
+        budouci = Future()
+        with self._zamek:                 # zámek zajišťuje, že se po zavrit() do fronty už nic nezařadí
+            if self._uzavreno:
+                raise RuntimeError("Zápis na pozadí je ukončen (zavrit()).")
+            self._fronta.put((zmena, budouci), timeout=timeout)
+        return budouci
+
+    # 2) Vyprázdnění a ukončení
+    # vyprazdnit(): zapíše všechny dosud zařazené změny a počká na jejich commit;
+    # vrací True, nebo False po vypršení timeoutu
+    def vyprazdnit(self, timeout=None):
+        hotovo = threading.Event()
+        with self._zamek:
+            if self._uzavreno:            # po zavrit() je vše zapsáno
+                return True
+            self._fronta.put((_VYPRAZDNIT, hotovo), timeout=timeout)
+        return hotovo.wait(timeout)
+
+    # zavrit(): zapíše zbývající změny a ukončí vlákno na pozadí; další zařazení změn vyvolá RuntimeError
+    def zavrit(self):
+        with self._zamek:
+            if self._uzavreno:
+                return
+            self._uzavreno = True
+        self._fronta.put((_KONEC, None))
+        self._vlakno.join()
+
+    def statistiky(self):
+        return {"skupin": self.skupin, "zapsano": self.zapsano, "po_jedne": self.po_jedne,
+                "ve_fronte": self._fronta.qsize()}
+
+    # 3) Vlákno na pozadí – sbírá změny do skupiny do max_davka změn nebo max_zpozdeni s od první změny
+    def _smycka(self):
+        konec = False
+        while not konec:
+            skupina, cekajici = [], []
+            polozka = self._fronta.get()
+            termin = time.monotonic() + self.max_zpozdeni
+            while True:
+                zmena, budouci = polozka
+                if zmena == _KONEC:
+                    konec = True
+                    break
+                if zmena == _VYPRAZDNIT:
+                    cekajici.append(budouci)
+                    break
+                skupina.append(polozka)
+                if len(skupina) >= self.max_davka:
+                    break
+                try:
+                    polozka = self._fronta.get(timeout=max(termin - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+
+            if skupina:
+                try:
+                    self._zapsat(skupina)
+                except Exception as err:          # neočekávaná chyba nesmí ukončit vlákno, předá se volajícím
+                    for _, budouci in skupina:
+                        if not budouci.done():
+                            budouci.set_exception(err)
+            for hotovo in cekajici:
+                hotovo.set()
+
+    # zápis jedné skupiny v jedné transakci; při odmítnutí příkazu se skupina odvolá a změny se provedou po jedné
+    def _zapsat(self, skupina):
+        platne = []
+        for (zmena, budouci) in skupina:
+            if zmena[0] == "pridat":
+                chyba = _validace_ukolu(zmena[1:])
+                if chyba:
+                    print(f"Chyba při přidávání úkolu: {chyba}")
+                    budouci.set_result(False)
+                    continue
+            platne.append((zmena, budouci))
+        if not platne:
+            return
+
+        try:
+            with spojeni(self.conn) as conn:
+                try:
+                    vysledky, ids, stavy = self._provest_skupinu(conn, [zmena for zmena, _ in platne])
+                except mysql.connector.Error:
+                    _odvolat(conn)
+                    vysledky = None
+                if vysledky is not None:
+                    cache_vypisu.zneplatnit(conn, ids=ids, stavy=stavy)
+        except mysql.connector.Error:
+            vysledky = None
+
+        if vysledky is not None:
+            self.skupin += 1
+            self.zapsano += len(platne)
+            for (_, budouci), vysledek in zip(platne, vysledky):
+                budouci.set_result(vysledek)
+            return
+
+        # DB odmítla skupinu jako celek – změny po jedné, s hláškami a návratovými hodnotami synchronních DB funkcí
+        funkce = {"pridat": pridat_ukol_db, "aktualizovat": aktualizovat_ukol_db, "odstranit": odstranit_ukol_db}
+        for zmena, budouci in platne:
+            budouci.set_result(funkce[zmena[0]](*zmena[1:], self.conn))
+            self.po_jedne += 1
+
+    # provedení příkazů skupiny a commit; po sobě jdoucí přidání se vkládají jedním executemany();
+    # čítače souhrnu (souhrn.py) se změní jedním příkazem za celou skupinu – původní stavy měněných úkolů
+    # se načtou (a zamknou) jedním dotazem před provedením skupiny;
+    # vrací (výsledky změn, id změněných úkolů, stavy pro zneplatnění cache)
+    @staticmethod
+    def _provest_skupinu(conn, zmeny):
+        vysledky, ids, stavy, smazane = [], set(), set(), []
+        citace = dict.fromkeys(STAVY_UKOLU, 0)
+        cursor = kurzor(conn)
+        try:
+            puvodni = {}
+            menene = sorted({zmena[1] for zmena in zmeny if zmena[0] != "pridat"})
+            if menene and citace_zapnuty():
+                cursor.execute(dialekt(conn).pro_zapis(
+                    conn, f"SELECT id, stav FROM ukoly WHERE id IN ({_zastupne_znaky(menene)})"), tuple(menene))
+                puvodni = dict(cursor.fetchall())
+
+            index = 0
+            while index < len(zmeny):
+                druh = zmeny[index][0]
+                if druh == "pridat":
+                    konec = index
+                    while konec < len(zmeny) and zmeny[konec][0] == "pridat":
+                        konec += 1
+                    cursor.executemany(SQL_PRIDAT_UKOL, [zmena[1:] for zmena in zmeny[index:konec]])
+                    vysledky.extend([True] * (konec - index))
+                    stavy.add("nezahájeno")
+                    citace["nezahájeno"] += konec - index
+                    index = konec
+                    continue
+
+                if druh == "aktualizovat":
+                    _, id_ukolu, novy_stav = zmeny[index]
+                    cursor.execute(SQL_AKTUALIZOVAT_UKOL, (novy_stav, id_ukolu, novy_stav))
+                    stavy.add(novy_stav)
+                    if cursor.rowcount > 0 and id_ukolu in puvodni:
+                        citace[puvodni[id_ukolu]] -= 1
+                        citace[novy_stav] += 1
+                        puvodni[id_ukolu] = novy_stav
+                else:
+                    _, id_ukolu = zmeny[index]
+                    cursor.execute(SQL_ODSTRANIT_UKOL, (id_ukolu,))
+                    if cursor.rowcount > 0:
+                        smazane.append(id_ukolu)
+                        if id_ukolu in puvodni:
+                            citace[puvodni.pop(id_ukolu)] -= 1
+                vysledky.append(cursor.rowcount > 0)
+                ids.add(id_ukolu)
+                index += 1
+            zmenit_citace(conn, citace)
+            zaznamenat_smazani(conn, smazane)       # záznamy pro přehled změn (zmeny.py) ve stejné transakci
+            _potvrdit(conn)
+        finally:
+            cursor.close()
+        return vysledky, ids, stavy
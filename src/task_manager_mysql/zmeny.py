@@ -0,0 +1,176 @@
+"""
+===========================================================================================
+ Task Manager – Python + MySQL: přehled změn úkolů od poslední synchronizace
+-------------------------------------------------------------------------------------------
+Popis:
+Klient, který si drží vlastní kopii úkolů (synchronizace, export do jiného systému),
+nemusí při každé kontrole načítat celou tabulku 'ukoly'. zmeny_od(conn, znacka)
+vrací jen úkoly změněné a odstraněné od značky předchozího volání.
+
+    • upraveno      – sloupec tabulky 'ukoly' (migrace 9) s časem posledního vložení nebo
+                      změny řádku; nastavuje ho MySQL sám (DEFAULT / ON UPDATE CURRENT_TIMESTAMP),
+                      takže ho zachytí i změny mimo DB funkce aplikace
+    • ukoly_smazane – tabulka záznamů o smazání (migrace 10): id a čas smazání; záznam zapisují
+                      DB funkce výmazu a archivace (zaznamenat_smazani()) ve stejné transakci
+                      jako samotný výmaz, stejně jako čítače souhrnu (souhrn.py)
+    • značka        – text 'čas/id' posledního vráceného záznamu; další volání pokračuje
+                      za ním (index (upraveno, id) a (smazano, id)), takže čtení změn trvá
+                      stejně dlouho bez ohledu na velikost tabulky
+
+Čas změny se nastaví při provedení příkazu, ale změna je vidět až po commitu. Aby přehled
+nepřeskočil transakci potvrzenou později než transakce s novějším časem, vrací jen změny
+starší než zpozdeni sekund (ZPOZDENI_ZMEN) podle času serveru; transakce delší než
+zpozdeni může přehled přeskočit. Výmaz řádku ručním SQL (mimo DB funkce) se do přehledu
+nedostane.
+
+Záznamy o smazání starší než zadaný počet dní odstraňuje vycistit_smazane() (podpříkaz
+zmeny-udrzba, výchozí počet dní v .env CHANGES_RETENTION_DAYS, 30). Klient se značkou
+starší než tato doba by smazání z vyčištěného období už nedostal – musí zahodit svou kopii
+a načíst úkoly znovu od začátku (zmeny_od(conn) bez značky).
+==============================================================================================
+"""
+
+import os
+import time
+from datetime import datetime, timedelta
+
+from .metriky import kurzor
+from .ovladac import mysql
+from .pool import spojeni
+from .transakce import _odvolat, _potvrdit
+from .ukol import SQL_SLOUPCE, Ukol
+
+ZPOZDENI_ZMEN = 1.0         # sekundy – změny novější než čas serveru minus zpoždění se vrátí až v dalším volání
+
+# REPLACE – id smazaného úkolu může MySQL po restartu přidělit znovu (AUTO_INCREMENT 5.7 = max(id) + 1)
+SQL_ZAZNAMENAT_SMAZANI = "REPLACE INTO ukoly_smazane (id, smazano) VALUES (%s, NOW(6))"
+SQL_STARE_SMAZANI = "SELECT id FROM ukoly_smazane WHERE smazano < %s ORDER BY smazano, id LIMIT %s"
+
+
+# 1) Záznam o smazání úkolů
+# volá se před commitem na připojení, které úkoly smazalo; ids = kolekce ID smazaných úkolů
+def zaznamenat_smazani(conn, ids):
+    if not ids:
+        return
+    cursor = kurzor(conn)
+    try:
+        cursor.executemany(SQL_ZAZNAMENAT_SMAZANI, [(id_ukolu,) for id_ukolu in ids])
+    finally:
+        cursor.close()
+
+
+# 2) Změny od značky
+# znacka = None (od začátku) nebo značka z předchozího volání, limit = nejvýše tolik záznamů (změn a smazání dohromady);
+# funkce vrací trojici (seznam změněných úkolů Ukol, seznam ID smazaných úkolů, nová značka) nebo False při SQL chybě;
+# bez nových změn se vrací prázdné seznamy a stejná značka; neplatná značka vyvolá ValueError;
+# značka starší než doba uchování záznamů o smazání (vycistit_smazane) už nezaručuje úplný přehled smazání
+def zmeny_od(conn, znacka=None, limit=1000, zpozdeni=ZPOZDENI_ZMEN):
+    if limit < 1:
+        raise ValueError("Limit musí být alespoň 1.")
+    od = _cist_znacku(znacka) if znacka is not None else None
+    try:
+        with spojeni(conn) as conn:
+            cursor = kurzor(conn)
+            try:
+                cursor.execute("SELECT NOW(6)")
+                ted = cursor.fetchone()[0]
+                if isinstance(ted, str):                    # vestavěná databáze vrací výsledek funkce jako text
+                    ted = datetime.fromisoformat(ted)
+                hranice = ted - timedelta(seconds=zpozdeni)
+                radky_zmen = _nacist(cursor, "ukoly", f"{SQL_SLOUPCE}, upraveno", "upraveno", od, hranice, limit)
+                radky_vymazu = _nacist(cursor, "ukoly_smazane", "id, smazano", "smazano", od, hranice, limit)
+                udalosti = [(radek[-1], radek[0], Ukol._make(radek[:-1])) for radek in radky_zmen]
+                udalosti += [(radek[1], radek[0], None) for radek in radky_vymazu]
+            finally:
+                cursor.close()
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při načítání změn úkolů: {err}")
+        return False
+
+    udalosti.sort(key=lambda udalost: udalost[:2])
+    udalosti = udalosti[:limit]
+    if not udalosti:
+        return [], [], znacka
+
+    # úkol smazaný a znovu vložený se stejným id – platí pozdější záznam
+    posledni = {}
+    for cas, id_ukolu, ukol in udalosti:
+        posledni.pop(id_ukolu, None)
+        posledni[id_ukolu] = ukol
+    zmenene = [ukol for ukol in posledni.values() if ukol is not None]
+    smazane = [id_ukolu for id_ukolu, ukol in posledni.items() if ukol is None]
+    cas, id_ukolu, _ = udalosti[-1]
+    return zmenene, smazane, f"{cas.isoformat(' ', 'microseconds')}/{id_ukolu}"
+
+# a) záznamy jedné tabulky za značkou a před hranicí zpoždění, seřazené podle (čas, id) – rozsah indexu (čas, id)
+def _nacist(cursor, tabulka, sloupce, sloupec_casu, od, hranice, limit):
+    if od is None:
+        cursor.execute(
+            f"SELECT {sloupce} FROM {tabulka} WHERE {sloupec_casu} < %s ORDER BY {sloupec_casu}, id LIMIT %s",
+            (hranice, limit))
+    else:
+        cas, id_ukolu = od
+        cursor.execute(
+            f"SELECT {sloupce} FROM {tabulka} WHERE {sloupec_casu} >= %s AND ({sloupec_casu} > %s OR id > %s) "
+            f"AND {sloupec_casu} < %s ORDER BY {sloupec_casu}, id LIMIT %s",
+            (cas, cas, id_ukolu, hranice, limit))
+    return cursor.fetchall()
+
+# b) značka 'čas/id' -> (datetime, id)
+def _cist_znacku(znacka):
+    try:
+        cas, id_ukolu = znacka.split("/")
+        return datetime.fromisoformat(cas), int(id_ukolu)
+    except (AttributeError, ValueError):
+        raise ValueError(f"Neplatná značka změn: {znacka!r}") from None
+
+
+# 3) Čištění záznamů o smazání
+# funkce odstraní záznamy o smazání starší než starsi_nez_dnu dní po dávkách (batch_size záznamů,
+# každá dávka jedna krátká transakce, mezi dávkami pauza sekund);
+# vrací počet odstraněných záznamů nebo False při SQL chybě;
+# klient se značkou starší než starsi_nez_dnu dní musí po vyčištění načíst úkoly znovu od začátku (zmeny_od bez značky)
+def vycistit_smazane(conn, starsi_nez_dnu=None, batch_size=1000, pauza=0.0):
+    if starsi_nez_dnu is None:
+        starsi_nez_dnu = int(os.getenv("CHANGES_RETENTION_DAYS", "30"))
+    if batch_size < 1 or starsi_nez_dnu < 0:
+        raise ValueError("Parametr batch_size musí být alespoň 1 a starsi_nez_dnu nesmí být záporný.")
+    hranice = datetime.now().replace(microsecond=0) - timedelta(days=starsi_nez_dnu)
+
+    odstraneno, davek = 0, 0
+    try:
+        while True:
+            if davek and pauza:
+                time.sleep(pauza)
+            pocet = _vycistit_davku(conn, hranice, batch_size)
+            odstraneno += pocet
+            davek += 1
+            if pocet < batch_size:      # neúplná dávka = žádné další staré záznamy
+                break
+
+        print(f"Odstraněno záznamů o smazání: {odstraneno} (starších než {hranice.isoformat(' ')}).")
+        return odstraneno
+
+    except mysql.connector.Error as err:
+        print(f"Chyba při čištění záznamů o smazání (odstraněno {odstraneno} záznamů): {err}")
+        return False
+
+# a) jedna dávka v jedné transakci – nejstarší záznamy přes index (smazano, id); podmínka na čas i v DELETE,
+# aby se nesmazal záznam, který mezitím přepsalo nové smazání úkolu se stejným id (REPLACE)
+def _vycistit_davku(conn, hranice, batch_size):
+    with spojeni(conn) as conn:
+        cursor = kurzor(conn)
+        try:
+            cursor.execute(SQL_STARE_SMAZANI, (hranice, batch_size))
+            ids = [radek[0] for radek in cursor.fetchall()]
+            if ids:
+                zastupne = ", ".join(["%s"] * len(ids))
+                cursor.execute(f"DELETE FROM ukoly_smazane WHERE id IN ({zastupne}) AND smazano < %s", (*ids, hranice))
+            _potvrdit(conn)
+        except mysql.connector.Error:
+            _odvolat(conn)
+            raise
+        finally:
+            cursor.close()
+    return len(ids)
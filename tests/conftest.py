@@ -19,13 +19,34 @@ Testování UI funkcí by vyžadovalo mockování pomocí monkeypatch na input()
 
 Fixtures definované v tomto souboru:
 1) fix_create_db_table:
-vytvoří tabulku 'ukoly' v testovací databázi, spouští se jednou za celou testovací 
-relaci, scope="session"
+vytvoří pool připojení k testovací databázi a tabulku 'ukoly' a jednou vyčistí testovací data,
+spouští se jednou za celou testovací relaci, scope="session"; předává pool připojení (PoolDB)
 
 2) fix_test_conn:
-vytvoří nové připojení pro každý test, před i po testu vyčistí tabulku 'ukoly',
+pro každý test si vypůjčí připojení z poolu (bez nového připojování k DB) a spustí test ve vnější
+transakci (transakce.py) – DB funkce místo commitu jen posouvají bod uložení a po testu se celá
+transakce odvolá, takže se tabulky nemusí mazat; po testu připojení do poolu vrátí,
 spouští se pro každou testovací funkci, scope="function"
 
+3) fix_test_conn_potvrzene:
+pro testy, ve kterých musí změny skutečně potvrdit (commit) – data čtou jiná připojení (pool,
+AsyncDB), FULLTEXT hledání (InnoDB index vidí jen potvrzené řádky) nebo migrace (DDL potvrdí
+transakci); před i po testu vyčistí tabulky 'ukoly', 'ukoly_archiv', čítače souhrnu i cache výpisů
+
+4) fix_citace:
+zapne pro test nepovinné čítače souhrnu (souhrn.py, ve výchozím nastavení vypnuté) a po testu
+je opět vypne; testovací data začínají prázdná a čítače vynulované, kontrola před prvním
+souhrnem se proto vynechá
+
+Paralelní běh (pytest-xdist, pytest -n auto):
+každý pracovní proces (gw0, gw1, ...) používá vlastní testovací databázi DB_TEST_NAME_gw0,
+DB_TEST_NAME_gw1, ... (vytvoří se, pokud neexistuje – uživatel DB_TEST_USER potřebuje právo
+CREATE), procesy se tak navzájem neovlivňují; u vestavěné databáze (DB_BACKEND=sqlite)
+vlastní soubor DB_TEST_SQLITE_PATH s příponou _gw0, _gw1, ...
+
+Backend (DB_BACKEND v .env): testy běží stejně nad MySQL i nad vestavěnou databází SQLite,
+např. DB_BACKEND=sqlite DB_TEST_SQLITE_PATH=:memory: pytest (bez MySQL serveru).
+
 Cílem těchto fixtures je zajistit izolované, opakovatelné a nezávislé testování 
 databázových funkcí bez vzájemného ovlivnění dat.
 
@@ -40,55 +61,116 @@ chybějící databázi.
 
 import os
 import pytest
+from task_manager_mysql.cache import cache_vypisu
+from task_manager_mysql.ovladac import mysql
+from task_manager_mysql.pool import parametry_pripojeni
+from task_manager_mysql.souhrn import nastavit_citace
 from task_manager_mysql.task_manager_mysql_p2 import pripojeni_db, vytvoreni_tabulky
+from task_manager_mysql.transakce import vnejsi_transakce
+
+# Vlastní testovací databáze pracovního procesu pytest-xdist (bez xdist se nic nemění)
+def _databaze_pracovniho_procesu():
+    proces = os.getenv("PYTEST_XDIST_WORKER")
+    if not proces:
+        return
+    parametry = parametry_pripojeni(test_db=True)       # načte .env, dokud DB_TEST_NAME ještě není přepsaná
+    # vestavěná databáze – vlastní soubor (:memory: je v každém procesu vlastní)
+    if parametry.get("backend") == "sqlite":
+        cesta = parametry["database"]
+        if cesta != ":memory:":
+            zaklad, pripona = os.path.splitext(cesta)
+            os.environ["DB_TEST_SQLITE_PATH"] = f"{zaklad}_{proces}{pripona}"
+        return
+    nazev = f"{parametry.pop('database')}_{proces}"
+    try:
+        conn = mysql.connector.connect(**parametry)
+        cursor = conn.cursor()
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{nazev}`")
+        cursor.close()
+        conn.close()
+    except mysql.connector.Error:
+        pass                                            # nedostupná DB se projeví při sestavení poolu (skip v CI)
+    os.environ["DB_TEST_NAME"] = nazev                  # přednost před .env, platí pro pool i AsyncDB
+
+# Výmaz testovacích dat mimo DB funkce aplikace (proto se vyprázdní i cache výpisů)
+def _vycistit_data(conn):
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM ukoly;")
+    cursor.execute("UPDATE ukoly_citace SET pocet = 0;")     # čítače souhrnu odpovídají prázdné tabulce
+    cursor.execute("DELETE FROM ukoly_archiv;")
+    cursor.execute("DELETE FROM ukoly_import;")              # pozice nedokončených paralelních importů
+    cursor.execute("DELETE FROM ukoly_smazane;")             # záznamy o smazání pro přehled změn
+    conn.commit()
+    cursor.close()
+    cache_vypisu.vycistit()
+
 
-# Fixture pro vytvoření testovací tabulky 'ukoly' (vytvoří se jednou za testovací session)
+# Fixture pro vytvoření poolu připojení a testovací tabulky 'ukoly' (vytvoří se jednou za testovací session)
 @pytest.fixture(scope="session")
 def fix_create_db_table():
-    # a) připojení k test databázi
-    conn = pripojeni_db(test_db=True)
+    # a) pool připojení k test databázi (ověří se vypůjčením jednoho připojení)
+    _databaze_pracovniho_procesu()
+    pool = pripojeni_db(test_db=True, pool=True)
 
     # --- GitHub Actions prostředí ---
     # Pokud test běží v GitHub Actions (CI=true) a DB není dostupná,
     # testy se přeskočí, aby build nepadal na chybějící databázi.
-    if os.getenv("CI") == "true" and conn is None:
+    if os.getenv("CI") == "true" and pool is None:
         pytest.skip("Test přeskočen: nelze se připojit k testovací databázi v prostředí GitHub Actions.")
 
     # --- Lokální prostředí ---
     # Pokud se k DB nelze připojit lokálně, považujeme to za chybu.
-    assert conn is not None, "Nepodařilo se připojit k testovací databázi"
+    assert pool is not None, "Nepodařilo se připojit k testovací databázi"
+
+    # b) vytvoření tabulky, pokud ještě neexistuje, a jednorázový výmaz dat z předchozích běhů
+    vytvoreni_tabulky(pool)
+    with pool.spojeni() as conn:
+        _vycistit_data(conn)
 
-    # b) vytvoření tabulky, pokud ještě neexistuje
-    vytvoreni_tabulky(conn)
-    conn.close()
+    # c) předání poolu dalším fixtures; po skončení celé session se pool uzavře
+    yield pool
+    pool.zavrit()
 
 
-# Fixture pro připojení k databázi a zajištění čistoty dat v tabulce 'ukoly'
+# Fixture pro připojení k databázi – test běží ve vnější transakci, která se po testu odvolá
 @pytest.fixture(scope="function")
 def fix_test_conn(fix_create_db_table):
-    # a) připojení k test databázi
-    conn = pripojeni_db(test_db=True)
+    # a) vypůjčení připojení z poolu test databáze
+    pool = fix_create_db_table
+    conn = pool.vypujcit()
 
-    # --- GitHub Actions prostředí ---
-    # GitHub automaticky nastavuje proměnnou prostředí CI=true.
-    # Pokud běžíme v CI a databáze není dostupná, testy se přeskočí.
-    if os.getenv("CI") == "true" and conn is None:
-        pytest.skip("Test přeskočen: nelze se připojit k testovací databázi v prostředí GitHub Actions.")
+    # b) předání objektu conn do parametru test funkce ve vnější transakci; vystoupení z fixture, spustí se test funkce
+    try:
+        with vnejsi_transakce(conn):
+            yield conn
 
-    # --- Lokální prostředí ---
-    # Pokud databáze není dostupná lokálně, považujeme to za chybu.
-    assert conn is not None, "Nepodařilo se připojit k testovací databázi"
+    # c) po testu se transakce odvolá (konec bloku with), cache výpisů se vyprázdní a připojení se vrátí do poolu
+    finally:
+        cache_vypisu.vycistit()
+        pool.vratit(conn)
+
+
+# Fixture pro připojení k databázi, ve kterém DB funkce potvrzují změny – zajištění čistoty dat výmazem tabulek
+@pytest.fixture(scope="function")
+def fix_test_conn_potvrzene(fix_create_db_table):
+    # a) vypůjčení připojení z poolu test databáze
+    pool = fix_create_db_table
+    conn = pool.vypujcit()
 
     # b) před testem vymazat data
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM ukoly;")
-    conn.commit()
+    _vycistit_data(conn)
 
-    # c) předání objektu conn do parametru test funkce; vystoupení z fixture, spustí se test funkce 
+    # c) předání objektu conn do parametru test funkce; vystoupení z fixture, spustí se test funkce
     yield conn
 
-    # d) po testu znovu vymazat data
-    cursor.execute("DELETE FROM ukoly;")
-    conn.commit()
-    cursor.close()
-    conn.close()
+    # d) po testu znovu vymazat data a vrátit připojení do poolu
+    _vycistit_data(conn)
+    pool.vratit(conn)
+
+
+# Fixture pro testy čítačů souhrnu – čítače jsou zapnuté jen po dobu testu
+@pytest.fixture(scope="function")
+def fix_citace():
+    nastavit_citace(True, overit=False)
+    yield
+    nastavit_citace(False)
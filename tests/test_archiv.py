@@ -0,0 +1,85 @@
+"""
+=================================================================================
+PyTest – testy archivace dokončených úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že archivace po dávkách přesune jen dokončené úkoly bez změny déle než
+zadaný počet dní, že archivovaný úkol lze načíst přes najit_ukol_db(..., archiv=True),
+že čítače souhrnu po archivaci odpovídají tabulce 'ukoly' a že úkol s id, které už
+v archivu je (MySQL 5.7 po restartu přidělí id znovu), se archivuje také.
+================================================================================
+"""
+
+
+from datetime import datetime, timedelta
+
+import pytest
+from task_manager_mysql.archiv import archivovat_ukoly
+from task_manager_mysql.souhrn import zkontrolovat_citace
+from task_manager_mysql.transakce import _potvrdit
+from task_manager_mysql.task_manager_mysql_p2 import (
+    pridat_ukol_db,
+    aktualizovat_ukol_db,
+    najit_ukol_db,
+    zobrazit_vsechny_ukoly,
+)
+
+
+# pomocná funkce – posun času poslední změny úkolu do minulosti (DB funkce aplikace ho nastavují na aktuální čas)
+def _zmenit_cas(conn, id_ukolu, cas):
+    cursor = conn.cursor()
+    cursor.execute("UPDATE ukoly SET upraveno = %s WHERE id = %s", (cas, id_ukolu))
+    _potvrdit(conn)         # ve vnější transakci fixture jen posune bod uložení
+    cursor.close()
+
+
+# 1) pozitivní test: staré dokončené úkoly se přesunou po dávkách do archivu a lze je načíst podle id
+@pytest.mark.positive
+def test_archiv_pozitivni(fix_test_conn, fix_citace):
+    conn = fix_test_conn
+    for i in range(4):
+        pridat_ukol_db(f"úkol {i}", "popis úkolu", conn)
+    ids = [ukol["id"] for ukol in zobrazit_vsechny_ukoly(conn)]
+    for id_ukolu in ids[:3]:
+        aktualizovat_ukol_db(id_ukolu, "hotovo", conn)
+        _zmenit_cas(conn, id_ukolu, datetime.now() - timedelta(days=60))
+
+    assert archivovat_ukoly(conn, starsi_nez_dnu=30, batch_size=2, pauza=0) == (3, ids[2])
+    assert [ukol["id"] for ukol in zobrazit_vsechny_ukoly(conn)] == [ids[3]]
+
+    assert najit_ukol_db(ids[0], conn) is None
+    archivovany = najit_ukol_db(ids[0], conn, archiv=True)
+    assert (archivovany["id"], archivovany["stav"]) == (ids[0], "hotovo")
+    assert zkontrolovat_citace(conn) == []
+    assert archivovat_ukoly(conn, starsi_nez_dnu=30, pauza=0) == (0, 0)
+
+    # nový úkol se stejným id jako archivovaný (AUTO_INCREMENT po restartu MySQL 5.7)
+    cursor = conn.cursor()
+    cursor.execute("INSERT INTO ukoly (id, nazev, popis, stav, datum_vytvoreni) "
+                   "VALUES (%s, 'nový úkol', 'popis úkolu', 'hotovo', CURDATE())", (ids[0],))
+    cursor.close()
+    _zmenit_cas(conn, ids[0], datetime.now() - timedelta(days=60))
+    assert archivovat_ukoly(conn, starsi_nez_dnu=30, pauza=0) == (1, ids[0])
+    assert najit_ukol_db(ids[0], conn, archiv=True)["nazev"] == "nový úkol"
+
+# 2) negativní test: nedokončené a nové úkoly se nearchivují, max_davek omezí běh,
+# neplatná velikost dávky vyvolá ValueError
+@pytest.mark.negative
+def test_archiv_negativni(fix_test_conn):
+    conn = fix_test_conn
+    for i in range(3):
+        pridat_ukol_db(f"úkol {i}", "popis úkolu", conn)
+    ids = [ukol["id"] for ukol in zobrazit_vsechny_ukoly(conn)]
+    _zmenit_cas(conn, ids[0], datetime.now() - timedelta(days=60))      # starý, ale nedokončený
+    aktualizovat_ukol_db(ids[1], "hotovo", conn)                          # dokončený, ale nový
+    aktualizovat_ukol_db(ids[2], "hotovo", conn)
+    _zmenit_cas(conn, ids[2], datetime.now() - timedelta(days=60))
+
+    assert archivovat_ukoly(conn, starsi_nez_dnu=30, batch_size=1, pauza=0, max_davek=1) == (1, ids[2])
+    assert archivovat_ukoly(conn, starsi_nez_dnu=30, pauza=0) == (0, 0)
+    assert len(zobrazit_vsechny_ukoly(conn)) == 2
+    assert najit_ukol_db(999999, conn, archiv=True) is None
+    with pytest.raises(ValueError):
+        archivovat_ukoly(conn, batch_size=0)
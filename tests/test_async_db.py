@@ -0,0 +1,112 @@
+"""
+=================================================================================
+PyTest – testy asyncio API DB funkcí (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že async varianty DB funkcí vracejí stejné hodnoty jako synchronní
+varianty i při souběžném volání z jednoho event loopu, že async generátor stránek
+načte úkoly po stránkách, a že připojení pracovního vlákna vidí úkoly potvrzené
+jiným připojením po svém předchozím čtení.
+
+Testy pracují s testovací databází definovanou v .env souboru; AsyncDB používá vlastní
+připojení, proto fixture fix_test_conn_potvrzene (změny se potvrzují, tabulka 'ukoly'
+se před i po testu vyprázdní).
+================================================================================
+"""
+
+
+import asyncio
+import pytest
+from task_manager_mysql.async_db import (
+    AsyncDB,
+    pridat_ukol_db_async,
+    zobrazit_ukoly_async,
+    aktualizovat_ukol_db_async,
+    aktualizovat_ukoly_db_async,
+    existuji_ukoly_async,
+    najit_ukol_db_async,
+    odstranit_ukol_db_async,
+    odstranit_ukoly_db_async,
+    stranky_ukolu_async,
+)
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db
+
+
+# 1) pozitivní test: souběžné přidání úkolů a jejich výpis
+@pytest.mark.positive
+def test_async_db_pozitivni(fix_test_conn_potvrzene):
+    async def scenar():
+        db = AsyncDB(test_db=True, max_vlaken=2)
+        try:
+            vysledky = await asyncio.gather(
+                *(pridat_ukol_db_async(f"async úkol {i}", "popis async úkolu", db) for i in range(4)))
+            ukoly = await zobrazit_ukoly_async(db)
+            zmena = await aktualizovat_ukol_db_async(ukoly[0]["id"], "hotovo", db, timeout=10)
+            return vysledky, ukoly, zmena
+        finally:
+            db.zavrit()
+
+    vysledky, ukoly, zmena = asyncio.run(scenar())
+    assert vysledky == [True] * 4
+    assert sorted(ukol["nazev"] for ukol in ukoly) == [f"async úkol {i}" for i in range(4)]
+    assert zmena is True
+
+# 2) negativní test: neexistující úkol – async varianty vracejí False stejně jako synchronní
+@pytest.mark.negative
+def test_async_db_negativni(fix_test_conn_potvrzene):
+    async def scenar():
+        db = AsyncDB(test_db=True, max_vlaken=1)
+        try:
+            return await asyncio.gather(
+                aktualizovat_ukol_db_async(999999999, "probíhá", db),
+                odstranit_ukol_db_async(999999999, db),
+                zobrazit_ukoly_async(db),
+            )
+        finally:
+            db.zavrit()
+
+    assert asyncio.run(scenar()) == [False, False, []]
+
+# 3) pozitivní test: úkol potvrzený jiným připojením je vidět i po předchozím čtení stejného vlákna
+# (čtení nedrží otevřenou transakci se snímkem dat REPEATABLE READ)
+@pytest.mark.positive
+@pytest.mark.mysql
+def test_async_db_cteni_potvrzenych_zmen(fix_test_conn_potvrzene):
+    async def scenar():
+        db = AsyncDB(test_db=True, max_vlaken=1)
+        try:
+            pred = await zobrazit_ukoly_async(db)
+            assert pridat_ukol_db("Úkol jiného připojení", "popis úkolu", fix_test_conn_potvrzene) is True
+            return pred, await zobrazit_ukoly_async(db)
+        finally:
+            db.zavrit()
+
+    pred, po = asyncio.run(scenar())
+    assert pred == []
+    assert [ukol["nazev"] for ukol in po] == ["Úkol jiného připojení"]
+
+# 4) pozitivní test: async generátor stránek, hledání podle id a hromadná změna a výmaz úkolů
+@pytest.mark.positive
+def test_async_db_stranky_a_hromadne(fix_test_conn_potvrzene):
+    async def scenar():
+        db = AsyncDB(test_db=True, max_vlaken=2)
+        try:
+            for i in range(5):
+                assert await pridat_ukol_db_async(f"async úkol {i}", "popis async úkolu", db) is True
+            stranky = [[ukol.id for ukol in stranka] async for stranka in stranky_ukolu_async(db, velikost_stranky=2)]
+            ids = [id_ukolu for stranka in stranky for id_ukolu in stranka]
+            nalezeny = await najit_ukol_db_async(ids[0], db)
+            zmena = await aktualizovat_ukoly_db_async(ids[:2], "hotovo", db)
+            vymaz = await odstranit_ukoly_db_async(ids, db)
+            return stranky, nalezeny, zmena, vymaz, await existuji_ukoly_async(db), ids
+        finally:
+            db.zavrit()
+
+    stranky, nalezeny, zmena, vymaz, existuji, ids = asyncio.run(scenar())
+    assert [len(stranka) for stranka in stranky] == [2, 2, 1]
+    assert nalezeny["nazev"] == "async úkol 0"
+    assert zmena == (ids[:2], [])
+    assert vymaz == (ids, [])
+    assert existuji == []
@@ -0,0 +1,76 @@
+"""
+=================================================================================
+PyTest – testy cache výpisů úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že opakovaný výpis se vrací z cache (čítač zásahů), že zápis přes DB
+funkce výpis zneplatní a další výpis vrátí aktuální data a že cache drží nejvýše
+max_polozek výpisů (LRU). Stránky výpisu po stránkách (zobrazit_ukoly_strankovane) se
+ukládají a zneplatňují stejně jako celé výpisy.
+Výpisy ve vnější transakci se do cache neukládají, proto testy cache s DB používají
+fixture fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.cache import CacheVypisu, cache_vypisu
+from task_manager_mysql.task_manager_mysql_p2 import (
+    pridat_ukol_db, aktualizovat_ukol_db, zobrazit_ukoly, zobrazit_ukoly_strankovane)
+
+
+# 1) pozitivní test: druhý výpis bez změny dat je zásah cache, přidání úkolu výpis zneplatní
+@pytest.mark.positive
+def test_cache_vypisu_pozitivni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    pridat_ukol_db("úkol do cache", "popis úkolu do cache", conn)
+
+    zasahy = cache_vypisu.zasahy
+    prvni = zobrazit_ukoly(conn)
+    druhy = zobrazit_ukoly(conn)
+    assert druhy == prvni
+    assert cache_vypisu.zasahy == zasahy + 1
+
+    pridat_ukol_db("další úkol", "popis dalšího úkolu", conn)
+    assert [ukol["nazev"] for ukol in zobrazit_ukoly(conn)] == ["úkol do cache", "další úkol"]
+
+# 2) negativní test: úkol změněný na 'hotovo' se už z cache nevypíše
+@pytest.mark.negative
+def test_cache_vypisu_negativni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    pridat_ukol_db("úkol k dokončení", "popis úkolu", conn)
+    ukol_id = zobrazit_ukoly(conn)[0]["id"]
+
+    aktualizovat_ukol_db(ukol_id, "hotovo", conn)
+    assert zobrazit_ukoly(conn) == []
+
+# 3) pozitivní test (bez DB): při překročení max_polozek se vyřadí nejdéle nepoužitý výpis
+@pytest.mark.positive
+def test_cache_lru_pozitivni():
+    cache = CacheVypisu(max_polozek=2, ttl=60)
+    conn = object()
+    for stavy in (("a",), ("b",), ("a",), ("c",)):
+        cache.ziskat(conn, stavy, lambda: [])
+
+    assert cache.statistiky()["vyrazeno"] == 1
+    cache.ziskat(conn, ("a",), lambda: [])       # ("a",) byl použit naposledy před ("c",), zůstal v cache
+    assert cache.zasahy == 2
+
+# 4) pozitivní test: opakované zobrazení stránky je zásah cache, přidání úkolu stránku zneplatní
+@pytest.mark.positive
+def test_cache_stranky_pozitivni(fix_test_conn_potvrzene, capsys):
+    conn = fix_test_conn_potvrzene
+    pridat_ukol_db("úkol na stránce", "popis úkolu na stránce", conn)
+
+    zasahy = cache_vypisu.zasahy
+    assert zobrazit_ukoly_strankovane(conn, velikost_stranky=5) is True
+    assert zobrazit_ukoly_strankovane(conn, velikost_stranky=5) is True
+    assert cache_vypisu.zasahy == zasahy + 1
+
+    pridat_ukol_db("nový úkol na stránce", "popis nového úkolu", conn)
+    capsys.readouterr()
+    assert zobrazit_ukoly_strankovane(conn, velikost_stranky=5) is True
+    assert cache_vypisu.zasahy == zasahy + 1
+    assert "nový úkol na stránce" in capsys.readouterr().out
@@ -0,0 +1,87 @@
+"""
+=================================================================================
+PyTest – testy vestavěné databáze SQLite (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že DB funkce nad vestavěnou databází (EmbeddedPripojeni) vracejí
+stejné hodnoty jako nad MySQL – migrace schématu, vložení, změna stavu (změna na
+stejný stav není změna), hledání bez FULLTEXT indexu, odstranění – a že omezení
+tabulky (ENUM, délka názvu) platí i v SQLite a jejich porušení vyvolá chybu
+mysql.connector. Převod datumů nesmí měnit globální registr modulu sqlite3.
+Testy nepotřebují MySQL server – každý používá vlastní soubor databáze v tmp_path.
+================================================================================
+"""
+
+
+import datetime
+import sqlite3
+
+import pytest
+from task_manager_mysql.cache import cache_vypisu
+from task_manager_mysql.dialekt import dialekt
+from task_manager_mysql.embedded_db import EmbeddedPripojeni
+from task_manager_mysql.hledani import hledat_ukoly
+from task_manager_mysql.migrace import MIGRACE, aplikovat_migrace
+from task_manager_mysql.ovladac import mysql, zvoleny_backend
+from task_manager_mysql.task_manager_mysql_p2 import (
+    aktualizovat_ukol_db,
+    najit_ukol_db,
+    odstranit_ukol_db,
+    pridat_ukol_db,
+    zobrazit_vsechny_ukoly,
+)
+
+
+@pytest.fixture
+def fix_embedded_conn(tmp_path):
+    conn = EmbeddedPripojeni(str(tmp_path / "ukoly.db"))
+    yield conn
+    cache_vypisu.vycistit()
+    conn.close()
+
+
+# 1) pozitivní test: migrace vytvoří schéma, DB funkce vracejí stejné hodnoty jako nad MySQL;
+# datum se převádí jen na připojení vestavěné databáze, ne v globálním registru sqlite3
+@pytest.mark.positive
+def test_embedded_db_pozitivni(fix_embedded_conn):
+    conn = fix_embedded_conn
+    assert dialekt(conn).nazev == "sqlite"
+    assert aplikovat_migrace(conn) == [migrace[0] for migrace in MIGRACE]
+    assert aplikovat_migrace(conn) == []
+
+    assert pridat_ukol_db("vestavěný úkol", "popis úkolu", conn) is True
+    assert pridat_ukol_db("vestavěný_úkol 100%", "popis úkolu", conn) is True
+    ukol = zobrazit_vsechny_ukoly(conn)[0]
+    assert (ukol.nazev, ukol.stav) == ("vestavěný úkol", "nezahájeno")
+    assert ukol.datum_vytvoreni == datetime.date.today()
+    registr = (*sqlite3.converters.values(), *sqlite3.adapters.values())
+    assert all(funkce.__module__.startswith("sqlite3") for funkce in registr)
+    assert [nalezeny.nazev for nalezeny in hledat_ukoly(conn, "vestavěný_")] == ["vestavěný_úkol 100%"]
+
+    assert aktualizovat_ukol_db(ukol.id, "hotovo", conn) is True
+    assert aktualizovat_ukol_db(ukol.id, "hotovo", conn) is False         # stejný stav = žádný změněný řádek
+    assert najit_ukol_db(ukol.id, conn).stav == "hotovo"
+    assert odstranit_ukol_db(ukol.id, conn) is True
+    assert [zbyvajici.nazev for zbyvajici in zobrazit_vsechny_ukoly(conn)] == ["vestavěný_úkol 100%"]
+
+# 2) negativní test: neplatný stav a příliš dlouhý název odmítne i SQLite; neznámý backend vyvolá ValueError
+@pytest.mark.negative
+def test_embedded_db_negativni(fix_embedded_conn, monkeypatch):
+    conn = fix_embedded_conn
+    aplikovat_migrace(conn)
+    assert aktualizovat_ukol_db(1, "hotovo", conn) is False
+    assert odstranit_ukol_db(1, conn) is False
+
+    cursor = conn.cursor()
+    for parametry in (("úkol", "popis", "neznámý"), ("x" * 31, "popis", "nezahájeno")):
+        with pytest.raises(mysql.connector.IntegrityError):
+            cursor.execute("INSERT INTO ukoly (nazev, popis, stav) VALUES (%s, %s, %s)", parametry)
+    cursor.close()
+    conn.rollback()
+    assert zobrazit_vsechny_ukoly(conn) == []
+
+    monkeypatch.setenv("DB_BACKEND", "oracle")
+    with pytest.raises(ValueError):
+        zvoleny_backend()
@@ -0,0 +1,53 @@
+"""
+=================================================================================
+PyTest – testy vyhledávání úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují vyhledávání úkolů podle slov (FULLTEXT, případně náhradní hledání
+podle začátku názvu) s filtrem stavu a stránkováním a to, že krátký výraz se hledá
+jako předpona názvu, ve které znaky % a _ nejsou zástupné znaky LIKE.
+FULLTEXT index InnoDB vidí jen potvrzené řádky, proto testy používají fixture
+fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.hledani import hledat_ukoly
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, aktualizovat_ukol_db
+
+
+# 1) pozitivní test: nalezení úkolů podle slova, filtr stavu a stránkování výsledků
+@pytest.mark.positive
+def test_hledani_pozitivni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    pridat_ukol_db("Nákup potravin", "mléko a chleba", conn)
+    pridat_ukol_db("Nákup dárků", "vánoční dárky", conn)
+    pridat_ukol_db("Úklid", "vysát koberec", conn)
+
+    nalezene = hledat_ukoly(conn, "nákup")
+    assert sorted(ukol["nazev"] for ukol in nalezene) == ["Nákup dárků", "Nákup potravin"]
+
+    aktualizovat_ukol_db(nalezene[0]["id"], "hotovo", conn)
+    assert [ukol["id"] for ukol in hledat_ukoly(conn, "nákup", stavy=("hotovo",))] == [nalezene[0]["id"]]
+
+    prvni = hledat_ukoly(conn, "nákup", velikost_stranky=1)
+    druha = hledat_ukoly(conn, "nákup", stranka=1, velikost_stranky=1)
+    assert len(prvni) == len(druha) == 1 and prvni[0]["id"] != druha[0]["id"]
+    assert hledat_ukoly(conn, "nákup", stranka=2, velikost_stranky=1) == []
+
+# 2) negativní test: prázdný a nenalezený výraz vracejí [], % v krátkém výrazu není zástupný znak,
+# záporná stránka vyvolá ValueError
+@pytest.mark.negative
+def test_hledani_negativni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    pridat_ukol_db("Nákup potravin", "mléko a chleba", conn)
+
+    assert hledat_ukoly(conn, "   ") == []
+    assert hledat_ukoly(conn, "neexistující") == []
+    assert [ukol["nazev"] for ukol in hledat_ukoly(conn, "ná")] == ["Nákup potravin"]
+    assert hledat_ukoly(conn, "n%") == []
+    with pytest.raises(ValueError):
+        hledat_ukoly(conn, "nákup", stranka=-1)
@@ -0,0 +1,138 @@
+"""
+=================================================================================
+PyTest – testy HTTP/JSON služby (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují endpointy HTTP API (http_api.py) přes jedno keep-alive spojení:
+přidání (id a hlavička Location nového úkolu), výpis po stránkách jako chunked JSON
+(klient HTTP/1.0 dostane tělo bez chunků ukončené zavřením spojení), načtení, změnu
+stavu a odstranění úkolu, a chybové odpovědi (neplatný vstup, neexistující úkol, nepodporovaná metoda).
+Test značky mysql ověřuje, že GET vrací i úkol zapsaný jiným připojením po předchozím
+čtení stejného pracovního vlákna.
+Server běží na volném portu localhost; AsyncDB používá vlastní připojení, proto
+fixture fix_test_conn_potvrzene (změny se potvrzují, tabulky se před i po testu vyprázdní).
+================================================================================
+"""
+
+
+import asyncio
+import json
+
+import pytest
+from task_manager_mysql.async_db import AsyncDB
+from task_manager_mysql.http_api import HttpApi
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db
+
+
+# pomocná funkce – HTTP/1.1 požadavek na otevřeném spojení; vrací (stavový kód, hlavičky, JSON tělo nebo None)
+async def pozadavek(reader, writer, metoda, cesta, data=None):
+    telo = b"" if data is None else (data if isinstance(data, bytes) else json.dumps(data).encode())
+    writer.write(f"{metoda} {cesta} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(telo)}\r\n\r\n".encode() + telo)
+    await writer.drain()
+
+    radky = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    hlavicky = {nazev.lower(): hodnota for nazev, hodnota in (radek.split(": ", 1) for radek in radky[1:] if radek)}
+    if hlavicky.get("transfer-encoding") == "chunked":
+        odpoved, chunky = b"", 0
+        while (delka := int((await reader.readline()).strip(), 16)) > 0:
+            odpoved += (await reader.readexactly(delka + 2))[:-2]
+            chunky += 1
+        await reader.readline()
+        hlavicky["chunky"] = chunky
+    else:
+        odpoved = await reader.readexactly(int(hlavicky["content-length"]))
+    return int(radky[0].split(" ")[1]), hlavicky, json.loads(odpoved) if odpoved else None
+
+def spustit_scenar(scenar, velikost_stranky=2, max_vlaken=2):
+    async def beh():
+        db = AsyncDB(test_db=True, max_vlaken=max_vlaken)
+        server = await asyncio.start_server(HttpApi(db, velikost_stranky=velikost_stranky).obsluhovat, "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname())
+        try:
+            return await scenar(reader, writer)
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            db.zavrit()
+
+    return asyncio.run(beh())
+
+
+# 1) pozitivní test: CRUD přes jedno keep-alive spojení, výpis se posílá po stránkách (chunked JSON)
+@pytest.mark.positive
+def test_http_api_pozitivni(fix_test_conn_potvrzene):
+    async def scenar(reader, writer):
+        vysledky = [await pozadavek(reader, writer, "POST", "/ukoly", {"nazev": f"HTTP úkol {i}", "popis": "popis"})
+                    for i in range(3)]
+        vypis = await pozadavek(reader, writer, "GET", "/ukoly")
+        id_ukolu = vypis[2][0]["id"]
+        vysledky += [
+            await pozadavek(reader, writer, "PATCH", f"/ukoly/{id_ukolu}", {"stav": "hotovo"}),
+            # stejný stav není chyba
+            await pozadavek(reader, writer, "PATCH", f"/ukoly/{id_ukolu}", {"stav": "hotovo"}),
+            await pozadavek(reader, writer, "GET", "/ukoly?stav=hotovo"),
+            await pozadavek(reader, writer, "DELETE", f"/ukoly/{id_ukolu}"),
+            await pozadavek(reader, writer, "GET", f"/ukoly/{id_ukolu}"),
+        ]
+        return vypis, vysledky
+
+    vypis, vysledky = spustit_scenar(scenar)
+    assert [stav for stav, _, _ in vysledky[:3]] == [201] * 3
+    assert [(hlavicky["location"], telo["id"]) for _, hlavicky, telo in vysledky[:3]] == \
+        [(f"/ukoly/{ukol['id']}", ukol["id"]) for ukol in vypis[2]]
+    stav, hlavicky, ukoly = vypis
+    assert (stav, hlavicky["chunky"]) == (200, 3)                   # 3 úkoly po 2 na stránce + ukončení pole
+    assert [ukol["nazev"] for ukol in ukoly] == [f"HTTP úkol {i}" for i in range(3)]
+    assert [(stav, telo["stav"]) for stav, _, telo in vysledky[3:5]] == [(200, "hotovo")] * 2
+    assert [ukol["id"] for ukol in vysledky[5][2]] == [ukoly[0]["id"]]
+    assert [stav for stav, _, _ in vysledky[6:]] == [204, 404]
+
+    # HTTP/1.0 s Connection: keep-alive – výpis bez chunků, konec těla = zavření spojení serverem
+    async def scenar_http10(reader, writer):
+        writer.write(b"GET /ukoly HTTP/1.0\r\nConnection: keep-alive\r\n\r\n")
+        return await reader.read()
+
+    hlavicka, _, telo = spustit_scenar(scenar_http10).partition(b"\r\n\r\n")
+    assert b"Connection: close" in hlavicka and b"chunked" not in hlavicka
+    assert [ukol["nazev"] for ukol in json.loads(telo)] == ["HTTP úkol 1", "HTTP úkol 2"]
+
+# 2) negativní test: neplatný vstup = 400, neexistující úkol a endpoint = 404, nepodporovaná metoda = 405;
+# spojení po chybových odpovědích zůstává otevřené
+@pytest.mark.negative
+def test_http_api_negativni(fix_test_conn_potvrzene):
+    async def scenar(reader, writer):
+        return [
+            await pozadavek(reader, writer, "POST", "/ukoly", {"nazev": "", "popis": "popis"}),
+            await pozadavek(reader, writer, "POST", "/ukoly", b"{neplatny json"),
+            await pozadavek(reader, writer, "PATCH", "/ukoly/1", {"stav": "neznámý"}),
+            await pozadavek(reader, writer, "GET", "/ukoly?stav=neznámý"),
+            await pozadavek(reader, writer, "PATCH", "/ukoly/999999999", {"stav": "hotovo"}),
+            await pozadavek(reader, writer, "DELETE", "/ukoly/999999999"),
+            await pozadavek(reader, writer, "GET", "/neznamy"),
+            await pozadavek(reader, writer, "PUT", "/ukoly"),
+            await pozadavek(reader, writer, "GET", "/ukoly"),
+        ]
+
+    vysledky = spustit_scenar(scenar)
+    assert [stav for stav, _, _ in vysledky] == [400, 400, 400, 400, 404, 404, 404, 405, 200]
+    assert all("chyba" in telo for _, _, telo in vysledky[:-1])
+    assert vysledky[7][1]["allow"] == "GET, POST"
+    assert vysledky[-1][2] == []
+
+# 3) pozitivní test: úkol zapsaný jiným připojením vrátí GET i po předchozím čtení téhož připojení
+# (jedno pracovní vlákno AsyncDB – čtení nedrží otevřený snímek dat REPEATABLE READ)
+@pytest.mark.positive
+@pytest.mark.mysql
+def test_http_api_cteni_potvrzenych_zmen(fix_test_conn_potvrzene):
+    async def scenar(reader, writer):
+        pred = await pozadavek(reader, writer, "GET", "/ukoly")
+        assert pridat_ukol_db("Úkol jiného připojení", "popis úkolu", fix_test_conn_potvrzene) is True
+        id_ukolu = (await pozadavek(reader, writer, "GET", "/ukoly"))[2][0]["id"]
+        return pred, await pozadavek(reader, writer, "GET", f"/ukoly/{id_ukolu}")
+
+    pred, po = spustit_scenar(scenar, max_vlaken=1)
+    assert (pred[0], pred[2]) == (200, [])
+    assert (po[0], po[2]["nazev"]) == (200, "Úkol jiného připojení")
@@ -0,0 +1,70 @@
+"""
+=================================================================================
+PyTest – testy měření SQL dotazů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že při zapnutém měření se každý SQL příkaz DB funkcí zapíše do souhrnu
+podle typu (počet, změněné a načtené řádky, histogram), do logu pomalých dotazů
+a předá hookům, že chybný příkaz se započítá mezi chyby a že vypnuté měření
+kurzory neobaluje a nic nezaznamenává.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql import metriky
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, zobrazit_vsechny_ukoly, aktualizovat_ukol_db
+
+
+@pytest.fixture
+def fix_metriky():
+    metriky.vynulovat_metriky()
+    metriky.zapnout_metriky(prah_pomalych_ms=0)      # práh 0 ms = každý příkaz je "pomalý"
+    yield metriky
+    metriky.vypnout_metriky()
+    metriky.vynulovat_metriky()
+
+
+# 1) pozitivní test: INSERT a SELECT se zapíšou do souhrnu, logu pomalých dotazů, hooku i do exportu Prometheus
+@pytest.mark.positive
+def test_metriky_pozitivni(fix_test_conn, fix_metriky):
+    conn = fix_test_conn
+    zaznamy = []
+    metriky.pridat_hook(zaznamy.append)
+    try:
+        pridat_ukol_db("měřený úkol", "popis měřeného úkolu", conn)
+        assert len(zobrazit_vsechny_ukoly(conn)) == 1
+    finally:
+        metriky.odebrat_hook(zaznamy.append)
+
+    souhrn = metriky.statistiky()
+    assert souhrn["INSERT"]["pocet"] == 1
+    assert souhrn["INSERT"]["radky_zmenene"] == 1
+    assert souhrn["SELECT"]["radky_nactene"] == 1
+    assert sum(souhrn["SELECT"]["kose"]) == souhrn["SELECT"]["pocet"]
+
+    # bez UPDATE – čítače souhrnu (souhrn.py) jsou ve výchozím nastavení vypnuté
+    assert {zaznam.typ for zaznam in zaznamy} == {"INSERT", "SELECT"}
+    assert [dotaz["typ"] for dotaz in metriky.pomale_dotazy()] == [zaznam.typ for zaznam in zaznamy]
+
+    text = metriky.prometheus_text()
+    assert 'task_manager_db_statements_total{typ="INSERT"} 1' in text
+    assert 'task_manager_db_statement_duration_seconds_bucket{typ="SELECT",le="+Inf"}' in text
+
+# 2) negativní test: chybný příkaz (neplatný stav) se započítá mezi chyby, vypnuté měření nic nezaznamená
+@pytest.mark.negative
+def test_metriky_negativni(fix_test_conn, fix_metriky):
+    conn = fix_test_conn
+    pridat_ukol_db("úkol", "popis úkolu", conn)
+    ukol_id = zobrazit_vsechny_ukoly(conn)[0]["id"]
+
+    assert aktualizovat_ukol_db(ukol_id, "neplatný stav", conn) is False
+    assert metriky.statistiky()["UPDATE"]["chyby"] == 1
+
+    metriky.vypnout_metriky()
+    metriky.vynulovat_metriky()
+    assert not isinstance(metriky.kurzor(conn), metriky.MerenyKurzor)
+    pridat_ukol_db("další úkol", "popis dalšího úkolu", conn)
+    assert metriky.statistiky() == {}
@@ -0,0 +1,48 @@
+"""
+=================================================================================
+PyTest – testy migrací schématu (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že aplikace migrací je idempotentní (opakované spuštění nic nemění),
+že jsou všechny verze zapsané v tabulce 'schema_verze' a že chybná migrace vrátí False
+a její verze se nezapíše.
+
+Migrace jsou v test db aplikovány už fixture fix_create_db_table (přes vytvoreni_tabulky()).
+DDL příkazy migrací transakci potvrdí, proto testy používají fixture fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.migrace import MIGRACE, aplikovat_migrace
+
+
+# 1) pozitivní test: opakovaná aplikace migrací nic neprovede, všechny verze jsou zapsané
+@pytest.mark.positive
+def test_aplikovat_migrace_pozitivni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    assert aplikovat_migrace(conn) == []
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT verze FROM schema_verze ORDER BY verze")
+    verze = [radek[0] for radek in cursor.fetchall()]
+    cursor.close()
+    assert set(verze) >= {cislo for cislo, _, _ in MIGRACE}
+
+# 2) negativní test: chybný krok migrace – funkce vrací False a verze se do 'schema_verze' nezapíše
+@pytest.mark.negative
+def test_aplikovat_migrace_negativni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+
+    def chybny_krok(cursor):
+        cursor.execute("ALTER TABLE neexistujici_tabulka ADD COLUMN x INT")
+
+    assert aplikovat_migrace(conn, MIGRACE + [(999999, "chybná migrace", chybny_krok)]) is False
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM schema_verze WHERE verze = 999999")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    assert count == 0
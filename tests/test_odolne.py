@@ -0,0 +1,87 @@
+"""
+=================================================================================
+PyTest – testy odolného připojení (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že odolné připojení (OdolnePripojeni) po zavření připojení
+serverem naváže nové – pingem před použitím i opakováním čtecího dotazu –
+a že se zápis ani dotaz po vyčerpání rozpočtu opakování neopakují; nové odolné
+připojení vyčerpaný společný rozpočet znovu nenaplní.
+Zavření připojení serverem se simuluje zavřením vnitřního připojení; testy
+používají vestavěnou databázi v tmp_path a nepotřebují MySQL server.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.cache import cache_vypisu
+from task_manager_mysql.migrace import aplikovat_migrace
+from task_manager_mysql.odolne import OdolnePripojeni, RozpocetOpakovani, odolne_pripojeni, rozpocet_opakovani
+from task_manager_mysql.ovladac import mysql
+from task_manager_mysql.task_manager_mysql_p2 import najit_ukol_db, pridat_ukol_db, zobrazit_vsechny_ukoly
+
+
+@pytest.fixture
+def fix_parametry(tmp_path):
+    yield {"backend": "sqlite", "database": str(tmp_path / "ukoly.db")}
+    cache_vypisu.vycistit()
+
+
+# 1) pozitivní test: připojení zavřené serverem odhalí ping po nečinnosti, čtecí dotaz se na novém připojení zopakuje
+@pytest.mark.positive
+def test_odolne_pozitivni(fix_parametry):
+    conn = OdolnePripojeni(fix_parametry, kontrola_po=0, zaklad_ms=1, rozpocet=RozpocetOpakovani())
+    aplikovat_migrace(conn)
+    assert pridat_ukol_db("odolný úkol", "popis úkolu", conn) is True
+    id_ukolu = zobrazit_vsechny_ukoly(conn)[0].id
+
+    conn._conn.close()                                  # server zavřel nečinné připojení
+    assert najit_ukol_db(id_ukolu, conn).nazev == "odolný úkol"
+    assert conn.znovupripojeni == 1
+
+    conn.kontrola_po = 3600                             # bez pingu – ztrátu odhalí až provedení dotazu
+    cursor = conn.cursor()
+    conn._conn.close()
+    cursor.execute("SELECT COUNT(*) FROM ukoly")
+    assert cursor.fetchone() == (1,)
+    assert conn.znovupripojeni == 2
+    conn.close()
+
+# 2) negativní test: po vyčerpání rozpočtu se dotaz neopakuje; zápis se neopakuje nikdy,
+# další volání naváže nové připojení
+@pytest.mark.negative
+def test_odolne_negativni(fix_parametry):
+    rozpocet = RozpocetOpakovani(kapacita=0, doplneni=0)
+    conn = OdolnePripojeni(fix_parametry, kontrola_po=3600, zaklad_ms=1, rozpocet=rozpocet)
+    aplikovat_migrace(conn)
+
+    cursor = conn.cursor()
+    conn._conn.close()
+    with pytest.raises(mysql.connector.Error):
+        cursor.execute("SELECT COUNT(*) FROM ukoly")
+
+    rozpocet.nastavit(kapacita=10)
+    cursor = conn.cursor()
+    conn._conn.close()
+    with pytest.raises(mysql.connector.Error):
+        cursor.execute("INSERT INTO ukoly (nazev, popis) VALUES (%s, %s)", ("úkol", "popis"))
+    conn.rollback()                                     # odvolání na ztraceném připojení chybu nehlásí
+    assert pridat_ukol_db("další úkol", "popis úkolu", conn) is True
+    assert [ukol.nazev for ukol in zobrazit_vsechny_ukoly(conn)] == ["další úkol"]
+    assert rozpocet.zbyva == 10
+    conn.close()
+
+    with pytest.raises(ValueError):
+        OdolnePripojeni(fix_parametry, pokusy=0)
+
+    # společný rozpočet procesu: další připojení z odolne_pripojeni() ho nenaplní znovu
+    odolne_pripojeni(fix_parametry).close()
+    kapacita = rozpocet_opakovani.kapacita
+    rozpocet_opakovani.nastavit(kapacita=0)
+    try:
+        odolne_pripojeni(fix_parametry).close()
+        assert rozpocet_opakovani.zbyva == 0
+    finally:
+        rozpocet_opakovani.nastavit(kapacita=kapacita)
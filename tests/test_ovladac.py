@@ -0,0 +1,69 @@
+"""
+=================================================================================
+PyTest – testy rychlého importu a volby ovladače (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy hlídají dobu importu balíčku task_manager_mysql: import nesmí načíst ovladač
+mysql.connector, python-dotenv ani asyncio a musí se vejít do časového rozpočtu
+(IMPORT_BUDGET_MS, výchozí 100 ms – nejlepší ze tří měření v novém procesu).
+Dále ověřují volbu implementace ovladače podle DB_DRIVER (auto / cext / pure).
+
+Testy nepotřebují databázi.
+================================================================================
+"""
+
+
+import os
+import subprocess
+import sys
+
+import pytest
+from task_manager_mysql.ovladac import cisty_python, mysql
+
+# kód spuštěný v novém procesu – vypíše dobu importu (ms) a seznam těžkých modulů, které import načetl
+MERENI_IMPORTU = """
+import sys, time
+zacatek = time.perf_counter()
+import task_manager_mysql
+doba = (time.perf_counter() - zacatek) * 1000
+nactene = [m for m in ("mysql.connector.connection", "dotenv", "asyncio") if m in sys.modules]
+print(doba, ",".join(nactene))
+"""
+
+
+def _zmerit_import():
+    prostredi = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    vystup = subprocess.run([sys.executable, "-c", MERENI_IMPORTU], capture_output=True, text=True, env=prostredi,
+                            check=True)
+    doba, nactene = vystup.stdout.split(" ")
+    return float(doba), nactene.strip()
+
+
+# 1) pozitivní test: import balíčku nenačte ovladač ani .env a vejde se do rozpočtu; DB_DRIVER=pure volí čistý Python
+@pytest.mark.positive
+def test_ovladac_pozitivni(monkeypatch):
+    mereni = [_zmerit_import() for _ in range(3)]
+    assert all(nactene == "" for _, nactene in mereni)
+    rozpocet = float(os.getenv("IMPORT_BUDGET_MS", "100"))
+    assert min(doba for doba, _ in mereni) < rozpocet
+
+    monkeypatch.setenv("DB_DRIVER", "pure")
+    assert cisty_python() is True
+    monkeypatch.setenv("DB_DRIVER", "auto")
+    assert cisty_python() is (not mysql.connector.HAVE_CEXT)
+
+# 2) negativní test: neplatná hodnota DB_DRIVER a DB_DRIVER=cext bez C rozšíření vyvolají ValueError
+@pytest.mark.negative
+def test_ovladac_negativni(monkeypatch):
+    monkeypatch.setenv("DB_DRIVER", "rychly")
+    with pytest.raises(ValueError):
+        cisty_python()
+
+    monkeypatch.setenv("DB_DRIVER", "cext")
+    if mysql.connector.HAVE_CEXT:
+        assert cisty_python() is False
+    else:
+        with pytest.raises(ValueError):
+            cisty_python()
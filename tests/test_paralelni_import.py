@@ -0,0 +1,80 @@
+"""
+=================================================================================
+PyTest – testy paralelního importu úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují rozdělení souboru na části zarovnané na začátky řádků, import
+po částech s pořadím chybných řádků v rámci celého souboru a navázání importu
+po pádu – dávky potvrzené před pádem se nevloží znovu.
+Části se zpracovávají v procesu testu (procesu=1), pozice importu se potvrzují,
+proto testy používají fixture fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import io
+
+import pytest
+from task_manager_mysql.paralelni_import import importovat_paralelne, rozdelit_soubor
+from task_manager_mysql.prenos import Prubeh
+from task_manager_mysql.task_manager_mysql_p2 import zobrazit_vsechny_ukoly
+
+
+# průběh, který po zpracování první části simuluje pád importu
+class PadPoPrvniCasti(Prubeh):
+    def pridat(self, pocet=1):
+        super().pridat(pocet)
+        raise RuntimeError("pád importu")
+
+
+# 1) pozitivní test: soubor rozdělený na více částí se vloží celý, chybné řádky mají pořadí v rámci celého souboru
+@pytest.mark.positive
+def test_paralelni_import_pozitivni(fix_test_conn_potvrzene, tmp_path):
+    conn = fix_test_conn_potvrzene
+    radky = [f'{{"nazev": "Úkol {i}", "popis": "Popis {i}"}}' for i in range(10)]
+    radky[3] = '{"nazev": "", "popis": "Popis"}'
+    radky[7] = "neplatný json"
+    cesta = tmp_path / "ukoly.jsonl"
+    cesta.write_text("\n".join(radky) + "\n", encoding="utf-8")
+
+    _, casti = rozdelit_soubor(cesta, "jsonl", velikost_casti=60)
+    obsah = cesta.read_bytes()
+    assert len(casti) > 2 and casti[0][0] == 0 and casti[-1][1] == len(obsah)
+    assert all(konec == dalsi for (_, konec), (dalsi, _) in zip(casti, casti[1:]))
+    assert all(obsah[zacatek - 1:zacatek] == b"\n" for zacatek, _ in casti[1:])
+
+    vlozeno, chyby = importovat_paralelne(cesta, conn, procesu=1, batch_size=2, velikost_casti=60,
+                                          prubeh=Prubeh("Import", vystup=io.StringIO()))
+    assert vlozeno == 8
+    assert [poradi for poradi, _ in chyby] == [3, 7]
+    ocekavane = sorted(f"Úkol {i}" for i in range(10) if i not in (3, 7))
+    assert sorted(ukol.nazev for ukol in zobrazit_vsechny_ukoly(conn)) == ocekavane
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ukoly_import")
+    assert cursor.fetchone()[0] == 0                            # pozice dokončeného importu se smažou
+    cursor.close()
+
+# 2) negativní test: import přerušený po první části naváže bez duplicit;
+# více procesů bez parametrů připojení vyvolá ValueError
+@pytest.mark.negative
+def test_paralelni_import_negativni(fix_test_conn_potvrzene, tmp_path):
+    conn = fix_test_conn_potvrzene
+    cesta = tmp_path / "ukoly.csv"
+    cesta.write_text("nazev,popis\n" + "".join(f"Úkol {i},Popis {i}\n" for i in range(6)), encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        importovat_paralelne(cesta, conn, procesu=1, velikost_casti=40,
+                             prubeh=PadPoPrvniCasti("Import", vystup=io.StringIO()))
+    pred_navazanim = len(zobrazit_vsechny_ukoly(conn))
+    assert 0 < pred_navazanim < 6
+
+    vlozeno, chyby = importovat_paralelne(cesta, conn, procesu=1, velikost_casti=40,
+                                          prubeh=Prubeh("Import", vystup=io.StringIO()))
+    assert (vlozeno, chyby) == (6, [])
+    assert sorted(ukol.nazev for ukol in zobrazit_vsechny_ukoly(conn)) == [f"Úkol {i}" for i in range(6)]
+
+    with pytest.raises(ValueError):
+        importovat_paralelne(cesta, conn, parametry=None, procesu=2)
@@ -0,0 +1,61 @@
+"""
+=================================================================================
+PyTest – testy poolu připojení (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že DB funkce fungují i s poolem připojení (PoolDB) předaným místo conn,
+že se vypůjčená připojení do poolu vracejí a že vyčerpaný pool vede k návratu False.
+
+Testy pracují s testovací databází definovanou v .env souboru a využívají fixtures z
+conftest.py (fix_create_db_table předává pool připojení k test db).
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.pool import PoolDB, parametry_pripojeni
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, zobrazit_ukoly
+
+
+# 1) pozitivní test: DB funkce si připojení z poolu vypůjčí a po svém běhu ho vrátí
+# (změny potvrzuje jiné připojení než fixture)
+@pytest.mark.positive
+def test_pool_db_funkce_pozitivni(fix_create_db_table, fix_test_conn_potvrzene):
+    pool = fix_create_db_table
+
+    assert pridat_ukol_db("úkol přes pool", "popis úkolu přes pool", pool) is True
+    ukoly = zobrazit_ukoly(pool)
+    assert [ukol["nazev"] for ukol in ukoly] == ["úkol přes pool"]
+
+    # vypůjčené je pouze připojení fixture fix_test_conn_potvrzene, ostatní jsou vrácená mezi volnými
+    assert pool.otevreno - pool.volna == 1
+
+# 2) pozitivní test: nepotvrzená transakce se při vrácení připojení do poolu odvolá
+@pytest.mark.positive
+def test_pool_vraceni_rollback_pozitivni(fix_create_db_table, fix_test_conn):
+    pool = fix_create_db_table
+
+    with pool.spojeni() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO ukoly (nazev, popis, datum_vytvoreni) VALUES ('neuloženo', 'bez commitu', CURDATE())")
+        cursor.close()
+
+    cursor = fix_test_conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ukoly")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    assert count == 0
+
+# 3) negativní test: vyčerpaný pool (bez přetečení) – DB funkce po vypršení timeoutu vrací False
+@pytest.mark.negative
+def test_pool_vycerpany_negativni(fix_test_conn):
+    pool = PoolDB(parametry_pripojeni(test_db=True), velikost=1, max_preteceni=0, timeout=0.1)
+    conn = pool.vypujcit()
+    try:
+        assert pridat_ukol_db("úkol", "popis", pool) is False
+    finally:
+        pool.vratit(conn)
+        pool.zavrit()
@@ -0,0 +1,60 @@
+"""
+=================================================================================
+PyTest – testy importu a exportu úkolů CSV / JSONL (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují import úkolů ze souboru CSV po dávkách, export do JSONL s filtrem
+stavů a navázáním od id a to, že chybné řádky vstupu (neplatný JSON, prázdný název)
+skončí v seznamu chyb pod svým pořadím, zatímco platné řádky se vloží.
+================================================================================
+"""
+
+
+import io
+import json
+
+import pytest
+from task_manager_mysql.prenos import Prubeh, exportovat_ukoly, importovat_ukoly, urcit_format
+from task_manager_mysql.task_manager_mysql_p2 import aktualizovat_ukol_db, zobrazit_vsechny_ukoly
+
+
+# 1) pozitivní test: import CSV po dávkách a export JSONL jen hotových úkolů od zadaného id
+@pytest.mark.positive
+def test_prenos_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    vstup = io.StringIO("nazev,popis\nÚkol 1,Popis 1\nÚkol 2,Popis 2\nÚkol 3,\"Popis, s čárkou\"\n")
+    prubeh = Prubeh("Import", vystup=io.StringIO())
+    assert importovat_ukoly(vstup, conn, format="csv", batch_size=2, prubeh=prubeh) == (3, [])
+
+    ukoly = zobrazit_vsechny_ukoly(conn)
+    assert [ukol["popis"] for ukol in ukoly] == ["Popis 1", "Popis 2", "Popis, s čárkou"]
+    for ukol in ukoly:
+        assert aktualizovat_ukol_db(ukol["id"], "hotovo", conn) is True
+
+    vystup = io.StringIO()
+    prvni_id = ukoly[0]["id"]
+    vysledek = exportovat_ukoly(vystup, conn, format="jsonl", stavy=("hotovo",), od_id=prvni_id,
+                                prubeh=Prubeh("Export", vystup=io.StringIO()))
+    radky = [json.loads(radek) for radek in vystup.getvalue().splitlines()]
+
+    assert vysledek == (2, ukoly[-1]["id"])
+    assert [radek["nazev"] for radek in radky] == ["Úkol 2", "Úkol 3"]
+    assert radky[0]["stav"] == "hotovo" and isinstance(radky[0]["datum_vytvoreni"], str)
+
+# 2) negativní test: neplatný řádek JSONL a prázdný název se odmítnou, platný řádek se vloží;
+# nepodporovaný formát vyvolá ValueError
+@pytest.mark.negative
+def test_prenos_negativni(fix_test_conn):
+    conn = fix_test_conn
+    vstup = io.StringIO('{"nazev": "Platný", "popis": "Popis"}\nneplatný json\n{"nazev": "", "popis": "Popis"}\n')
+    vlozeno, chyby = importovat_ukoly(vstup, conn, format="jsonl", prubeh=Prubeh("Import", vystup=io.StringIO()))
+
+    assert vlozeno == 1
+    assert [poradi for poradi, _ in chyby] == [1, 2]
+    assert "JSONL" in chyby[0][1]
+    assert len(zobrazit_vsechny_ukoly(conn)) == 1
+
+    with pytest.raises(ValueError):
+        urcit_format("ukoly.xml", "xml")
@@ -0,0 +1,61 @@
+"""
+=================================================================================
+PyTest – testy cache připravených SQL příkazů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že DB funkce připraví každý pevný příkaz na připojení jen jednou
+a při dalších voláních ho znovu použijí, že po znovupřipojení se příkazy připraví
+znovu a funkce dál fungují a že chyba připraveného příkazu neovlivní další volání.
+Znovupřipojení ukončí rozpracovanou transakci, proto pozitivní test používá fixture
+fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.pripravene import nastavit_pripravene, pocet_pripravenych
+from task_manager_mysql.task_manager_mysql_p2 import (
+    pridat_ukol_db,
+    najit_ukol_db,
+    aktualizovat_ukol_db,
+    odstranit_ukol_db,
+    zobrazit_vsechny_ukoly,
+)
+
+
+# 1) pozitivní test: opakovaná volání používají stejné připravené příkazy, po znovupřipojení se připraví znovu
+@pytest.mark.positive
+def test_pripravene_pozitivni(fix_test_conn_potvrzene, fix_citace):
+    conn = fix_test_conn_potvrzene
+    for i in range(3):
+        assert pridat_ukol_db(f"úkol {i}", "popis úkolu", conn) is True
+    ukol_id = zobrazit_vsechny_ukoly(conn)[0]["id"]
+    assert najit_ukol_db(ukol_id, conn)["nazev"] == "úkol 0"
+    assert aktualizovat_ukol_db(ukol_id, "hotovo", conn) is True
+    # 3 příkazy úkolů + 2 příkazy čítačů souhrnu (změna čítače, původní stav)
+    assert pocet_pripravenych(conn) == 5
+
+    conn.reconnect()
+    assert najit_ukol_db(ukol_id, conn)["stav"] == "hotovo"
+    assert odstranit_ukol_db(ukol_id, conn) is True
+    assert pocet_pripravenych(conn) == 6
+    assert najit_ukol_db(ukol_id, conn) is None
+
+# 2) negativní test: chyba připraveného příkazu (neplatný stav) nebrání dalším voláním; vypnutá cache nic nepřipravuje
+@pytest.mark.negative
+def test_pripravene_negativni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukol_db("úkol", "popis úkolu", conn)
+    ukol_id = zobrazit_vsechny_ukoly(conn)[0]["id"]
+    assert aktualizovat_ukol_db(ukol_id, "neplatný stav", conn) is False
+    assert aktualizovat_ukol_db(ukol_id, "probíhá", conn) is True
+
+    nastavit_pripravene(False)
+    try:
+        pocet = pocet_pripravenych(conn)
+        assert odstranit_ukol_db(ukol_id, conn) is True
+        assert pocet_pripravenych(conn) == pocet
+    finally:
+        nastavit_pripravene(True)
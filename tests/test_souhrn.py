@@ -0,0 +1,86 @@
+"""
+=================================================================================
+PyTest – testy souhrnu úkolů a čítačů podle stavu (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že zapnuté čítače v tabulce 'ukoly_citace' (fixture fix_citace) po jednotlivých
+i hromadných zápisech odpovídají tabulce 'ukoly', že čítače jsou ve výchozím nastavení vypnuté
+a po zapnutí se před prvním souhrnem přepočítají, že souhrn po dnech počítá dnešní úkoly po stavech
+a že kontrola čítačů najde a opraví rozdíl vzniklý zápisem mimo DB funkce aplikace.
+================================================================================
+"""
+
+
+from datetime import date
+
+import pytest
+from task_manager_mysql.souhrn import (
+    citace_zapnuty, nastavit_citace, pocty_podle_dnu, pocty_podle_stavu, zkontrolovat_citace)
+from task_manager_mysql.transakce import _potvrdit
+from task_manager_mysql.task_manager_mysql_p2 import (
+    pridat_ukol_db,
+    pridat_ukoly_db,
+    aktualizovat_ukol_db,
+    aktualizovat_ukoly_db,
+    odstranit_ukol_db,
+    odstranit_ukoly_db,
+    zobrazit_vsechny_ukoly,
+)
+
+
+# 1) pozitivní test: čítače sledují jednotlivé i hromadné zápisy, souhrn po dnech odpovídá dnešním úkolům
+@pytest.mark.positive
+def test_souhrn_pozitivni(fix_test_conn, fix_citace):
+    conn = fix_test_conn
+    for i in range(3):
+        pridat_ukol_db(f"úkol {i}", "popis úkolu", conn)
+    pridat_ukoly_db([("hromadný 1", "popis"), ("hromadný 2", "popis")], conn, batch_size=1)
+    ids = [ukol["id"] for ukol in zobrazit_vsechny_ukoly(conn)]
+
+    aktualizovat_ukol_db(ids[0], "hotovo", conn)
+    aktualizovat_ukol_db(ids[0], "hotovo", conn)                # stejný stav – čítače se nemění
+    aktualizovat_ukoly_db(ids[1:3], "probíhá", conn)
+    odstranit_ukol_db(ids[1], conn)
+    odstranit_ukoly_db(None, conn, stav="nezahájeno")
+
+    assert pocty_podle_stavu(conn) == {"nezahájeno": 0, "probíhá": 1, "hotovo": 1}
+    assert pocty_podle_dnu(conn) == [(date.today(), 0, 1, 1)]
+    assert zkontrolovat_citace(conn) == []
+
+    nastavit_citace(False)          # bez čítačů se souhrn počítá GROUP BY nad tabulkou 'ukoly'
+    assert pocty_podle_stavu(conn) == {"nezahájeno": 0, "probíhá": 1, "hotovo": 1}
+
+# 2) negativní test: výmaz mimo DB funkce aplikace čítače nezachytí – kontrola rozdíl vrátí a čítače přepočítá
+@pytest.mark.negative
+def test_souhrn_negativni(fix_test_conn, fix_citace):
+    conn = fix_test_conn
+    pridat_ukol_db("úkol", "popis úkolu", conn)
+    pridat_ukol_db("úkol 2", "popis úkolu", conn)
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM ukoly WHERE nazev = 'úkol 2'")
+    _potvrdit(conn)         # ve vnější transakci fixture jen posune bod uložení
+    cursor.close()
+
+    assert pocty_podle_stavu(conn)["nezahájeno"] == 2
+    assert zkontrolovat_citace(conn, opravit=False) == [("nezahájeno", 2, 1)]
+    assert zkontrolovat_citace(conn) == [("nezahájeno", 2, 1)]
+    assert zkontrolovat_citace(conn) == []
+    assert pocty_podle_stavu(conn)["nezahájeno"] == 1
+    assert pocty_podle_dnu(conn, dnu=1) == [(date.today(), 1, 0, 0)]
+
+# 3) negativní test: ve výchozím nastavení zápisy čítače neupravují; po zapnutí je první souhrn přepočítá
+@pytest.mark.negative
+def test_souhrn_citace_vypnute(fix_test_conn):
+    conn = fix_test_conn
+    assert citace_zapnuty() is False
+    pridat_ukol_db("úkol bez čítače", "popis úkolu", conn)
+    assert zkontrolovat_citace(conn, opravit=False) == [("nezahájeno", 0, 1)]
+
+    nastavit_citace(True)
+    try:
+        assert pocty_podle_stavu(conn)["nezahájeno"] == 1
+        assert zkontrolovat_citace(conn, opravit=False) == []
+    finally:
+        nastavit_citace(False)
@@ -20,6 +20,10 @@ Testy tedy ověřují pouze správnost funkcí:
     • pridat_ukol_db()
     • aktualizovat_ukol_db()
     • odstranit_ukol_db()
+    • pridat_ukoly_db()
+    • stranky_ukolu() / prochazet_ukoly()
+    • aktualizovat_ukoly_db() / odstranit_ukoly_db()
+    • existuji_ukoly() / najit_ukol_db()
 
 Každá funkce má dva testy:
     – pozitivní scénář (platné vstupy)
@@ -32,8 +36,12 @@ conftest.py pro vytvoření tabulky 'ukoly' a izolaci jednotlivých testovacích
 
 
 import pytest
-from datetime import date
+from datetime import date, timedelta
 from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, aktualizovat_ukol_db, odstranit_ukol_db
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukoly_db
+from task_manager_mysql.task_manager_mysql_p2 import stranky_ukolu, prochazet_ukoly, NEDOKONCENE_STAVY
+from task_manager_mysql.task_manager_mysql_p2 import aktualizovat_ukoly_db, odstranit_ukoly_db
+from task_manager_mysql.task_manager_mysql_p2 import existuji_ukoly, najit_ukol_db
 
 
 # 1) TESTY PRO DB FUNKCI pridat_ukol_db()
@@ -145,3 +153,119 @@ def test_odstranit_ukol_negativni(fix_test_conn):
     assert result is False
     
 # ==================================================================================================================================
+# 4) TESTY PRO DB FUNKCI pridat_ukoly_db()
+# a) pozitivní test: hromadné vložení úkolů z generátoru po dávkách, neplatné řádky se odmítnou, ostatní se vloží
+@pytest.mark.positive
+def test_pridat_ukoly_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    # generátor s 5 platnými a 2 neplatnými řádky (prázdný název, příliš dlouhý popis)
+    def ukoly():
+        for i in range(5):
+            yield (f"hromadný úkol {i}", f"popis hromadného úkolu {i}")
+        yield ("", "popis bez názvu")
+        yield ("název", "x" * 101)
+
+    vlozeno, chyby = pridat_ukoly_db(ukoly(), conn, batch_size=2)
+    assert vlozeno == 5
+    assert [poradi for poradi, _ in chyby] == [5, 6]
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ukoly WHERE stav = 'nezahájeno'")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    assert count == 5
+
+# b) negativní test: samé neplatné řádky – nic se nevloží, každý řádek má svou chybu
+@pytest.mark.negative
+def test_pridat_ukoly_negativni(fix_test_conn):
+    conn = fix_test_conn
+    vlozeno, chyby = pridat_ukoly_db([("", "popis"), ("název", ""), ("jen název",)], conn)
+    assert vlozeno == 0
+    assert len(chyby) == 3
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ukoly")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    assert count == 0
+
+# ======================================================================================================================
+# 5) TESTY PRO GENERÁTORY stranky_ukolu() / prochazet_ukoly()
+# a) pozitivní test: stránkování nedokončených úkolů podle id, hotový úkol se nevypíše
+@pytest.mark.positive
+def test_stranky_ukolu_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukoly_db([(f"úkol {i}", f"popis {i}") for i in range(5)], conn)
+    ids = [ukol["id"] for ukol in prochazet_ukoly(conn)]
+    aktualizovat_ukol_db(ids[2], "hotovo", conn)
+
+    stranky = list(stranky_ukolu(conn, NEDOKONCENE_STAVY, velikost_stranky=2))
+    assert [len(stranka) for stranka in stranky] == [2, 2]
+    assert [ukol["id"] for stranka in stranky for ukol in stranka] == [ids[0], ids[1], ids[3], ids[4]]
+
+    # pokračování za posledním zpracovaným úkolem (od_id)
+    assert [ukol["id"] for ukol in prochazet_ukoly(conn, velikost_stranky=2, od_id=ids[2])] == ids[3:]
+
+# b) negativní test: prázdná tabulka – generátor nevrátí žádnou stránku
+@pytest.mark.negative
+def test_stranky_ukolu_negativni(fix_test_conn):
+    conn = fix_test_conn
+    assert list(stranky_ukolu(conn, NEDOKONCENE_STAVY, velikost_stranky=2)) == []
+
+# ======================================================================================================================
+# 6) TESTY PRO HROMADNÉ DB FUNKCE aktualizovat_ukoly_db() / odstranit_ukoly_db()
+# a) pozitivní test: změna stavu podle seznamu ID (včetně neexistujícího ID) a výmaz podle podmínky (stav, datum)
+@pytest.mark.positive
+def test_hromadne_funkce_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukoly_db([(f"úkol {i}", f"popis {i}") for i in range(5)], conn)
+    ids = [ukol["id"] for ukol in prochazet_ukoly(conn)]
+
+    zmenene, chybejici = aktualizovat_ukoly_db(ids[:3] + [999999999], "hotovo", conn, batch_size=2)
+    assert zmenene == ids[:3]
+    assert chybejici == [999999999]
+
+    zitra = date.today() + timedelta(days=1)
+    odstranene, chybejici = odstranit_ukoly_db(None, conn, stav="hotovo", starsi_nez=zitra, batch_size=2)
+    assert odstranene == ids[:3]
+    assert chybejici == []
+    assert [ukol["id"] for ukol in prochazet_ukoly(conn)] == ids[3:]
+
+# b) negativní test: neexistující ID se jen nahlásí, neplatný stav vrací False a nic se nezmění
+@pytest.mark.negative
+def test_hromadne_funkce_negativni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukol_db("úkol", "popis úkolu", conn)
+    ukol_id = next(prochazet_ukoly(conn))["id"]
+
+    assert odstranit_ukoly_db([999999998, 999999999], conn) == ([], [999999998, 999999999])
+    assert aktualizovat_ukoly_db([ukol_id], "neplatný stav", conn) is False
+
+    cursor = conn.cursor()
+    cursor.execute("SELECT stav FROM ukoly WHERE id = %s", (ukol_id,))
+    stav = cursor.fetchone()[0]
+    cursor.close()
+    assert stav == "nezahájeno"
+
+# ======================================================================================================================
+# 7) TESTY PRO DB FUNKCE existuji_ukoly() / najit_ukol_db()
+# a) pozitivní test: neprázdná tabulka a nalezení úkolu podle ID
+@pytest.mark.positive
+def test_existence_ukolu_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukol_db("hledaný úkol", "popis hledaného úkolu", conn)
+    ukol_id = next(prochazet_ukoly(conn))["id"]
+
+    assert existuji_ukoly(conn) is True
+    ukol = najit_ukol_db(ukol_id, conn)
+    assert ukol["nazev"] == "hledaný úkol"
+    assert ukol["stav"] == "nezahájeno"
+
+# b) negativní test: prázdná tabulka vrací [], neexistující ID vrací None
+@pytest.mark.negative
+def test_existence_ukolu_negativni(fix_test_conn):
+    conn = fix_test_conn
+    assert existuji_ukoly(conn) == []
+    assert najit_ukol_db(999999999, conn) is None
+
+# ======================================================================================================================
@@ -0,0 +1,52 @@
+"""
+=================================================================================
+PyTest – testy transakcí řízených volajícím (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že DB funkce ve vnější transakci (vnejsi_transakce()) své změny
+nepotvrzují – o výsledku rozhodne až konec bloku (potvrdit=True / odvolání) –
+a že odvolání práce DB funkce (_odvolat()) nezruší celou transakci, jen změny od
+posledního potvrzení.
+Testy řídí transakce samy, proto používají fixture fix_test_conn_potvrzene.
+================================================================================
+"""
+
+
+import pytest
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, zobrazit_vsechny_ukoly
+from task_manager_mysql.transakce import _odvolat, ve_vnejsi_transakci, vnejsi_transakce
+
+
+# 1) pozitivní test: odvolaná vnější transakce nezanechá data, potvrzená ano
+@pytest.mark.positive
+def test_transakce_pozitivni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    with vnejsi_transakce(conn):
+        assert ve_vnejsi_transakci(conn) is True
+        assert pridat_ukol_db("odvolaný úkol", "popis úkolu", conn) is True
+        assert [ukol["nazev"] for ukol in zobrazit_vsechny_ukoly(conn)] == ["odvolaný úkol"]
+    assert ve_vnejsi_transakci(conn) is False
+    assert zobrazit_vsechny_ukoly(conn) == []
+
+    with vnejsi_transakce(conn, potvrdit=True):
+        assert pridat_ukol_db("potvrzený úkol", "popis úkolu", conn) is True
+    assert [ukol["nazev"] for ukol in zobrazit_vsechny_ukoly(conn)] == ["potvrzený úkol"]
+
+# 2) negativní test: odvolání práce DB funkce vrátí jen změny od posledního potvrzení,
+# výjimka v bloku odvolá vše i s potvrdit=True
+@pytest.mark.negative
+def test_transakce_negativni(fix_test_conn_potvrzene):
+    conn = fix_test_conn_potvrzene
+    with pytest.raises(RuntimeError):
+        with vnejsi_transakce(conn, potvrdit=True):
+            assert pridat_ukol_db("první úkol", "popis úkolu", conn) is True
+            cursor = conn.cursor()
+            cursor.execute("INSERT INTO ukoly (nazev, popis, datum_vytvoreni) VALUES ('odvolaný', 'popis', CURDATE())")
+            cursor.close()
+            _odvolat(conn)
+            assert [ukol["nazev"] for ukol in zobrazit_vsechny_ukoly(conn)] == ["první úkol"]
+            raise RuntimeError("chyba volajícího")
+
+    assert zobrazit_vsechny_ukoly(conn) == []
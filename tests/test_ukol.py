@@ -0,0 +1,44 @@
+"""
+=================================================================================
+PyTest – testy záznamu úkolu Ukol (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že výpisy vracejí záznamy Ukol s přístupem jako ke slovníku
+(ukol['nazev'], get, keys, dict(ukol)) i k atributům a že neexistující sloupec
+vyvolá KeyError stejně jako u slovníku.
+================================================================================
+"""
+
+
+from datetime import date
+
+import pytest
+from task_manager_mysql.task_manager_mysql_p2 import pridat_ukol_db, zobrazit_vsechny_ukoly, najit_ukol_db
+from task_manager_mysql.ukol import SLOUPCE_UKOLU, Ukol
+
+
+# 1) pozitivní test: výpis i načtení jednoho úkolu vracejí Ukol se slovníkovým přístupem
+@pytest.mark.positive
+def test_ukol_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    pridat_ukol_db("záznam úkolu", "popis záznamu úkolu", conn)
+    ukol = zobrazit_vsechny_ukoly(conn)[0]
+
+    assert isinstance(ukol, Ukol)
+    assert ukol["nazev"] == ukol.nazev == "záznam úkolu"
+    assert ukol.get("stav") == "nezahájeno"
+    assert isinstance(ukol["datum_vytvoreni"], date)
+    assert tuple(ukol.keys()) == SLOUPCE_UKOLU
+    assert dict(ukol) == ukol.jako_slovnik()
+    assert najit_ukol_db(ukol["id"], conn) == ukol
+
+# 2) negativní test: neexistující sloupec – KeyError u ukol[...], výchozí hodnota u get()
+@pytest.mark.negative
+def test_ukol_negativni():
+    ukol = Ukol(1, "název", "popis", "hotovo", date(2025, 1, 1))
+    with pytest.raises(KeyError):
+        ukol["neexistujici"]
+    assert ukol.get("neexistujici", "výchozí") == "výchozí"
+    assert ukol[0] == 1
@@ -0,0 +1,71 @@
+"""
+=================================================================================
+PyTest – testy výpisu a stránkování úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují stránkovaný výpis (další / předchozí stránka, konec), zkracování
+řádků podle šířky na terminálu (diakritika v rozloženém tvaru, široké znaky)
+a tichý režim, ve kterém výpisy úkolů nic nevypisují.
+Testy nepotřebují databázi – stránky úkolů se načítají ze seznamu v paměti.
+================================================================================
+"""
+
+
+import io
+import unicodedata
+
+import pytest
+from task_manager_mysql.ukol import Ukol
+from task_manager_mysql.vypis import nastavit_vypis, oriznout, sirka_textu, strankovat, vypsat_ukoly
+
+UKOLY = [Ukol(i, f"Úkol {i}", f"Popis {i}", "nezahájeno", None) for i in range(1, 6)]
+
+
+@pytest.fixture
+def fix_vypis():
+    yield
+    nastavit_vypis(tichy=False, velikost_stranky=20)
+
+
+# 1) pozitivní test: navigace další → předchozí → další → konec načítá stránky na pokyn;
+# šířka textu ve sloupcích terminálu
+@pytest.mark.positive
+def test_vypis_pozitivni(fix_vypis, capsys):
+    nactene = []
+    def nacist_stranku(cislo):
+        nactene.append(cislo)
+        return UKOLY[cislo * 2:cislo * 2 + 2]
+    volby = iter(["", "p", "", "", "x", "k"])
+
+    assert strankovat(nacist_stranku, "SEZNAM ÚKOLŮ:", velikost_stranky=2, vstup=lambda _: next(volby)) is True
+    vystup = capsys.readouterr().out
+    assert nactene == [0, 1, 0, 1, 2]
+    assert "(strana 3)" in vystup and "5. Úkol 5 - Popis 5 (nezahájeno)" in vystup
+    assert "Neplatná volba." in vystup
+
+    rozlozeny = unicodedata.normalize("NFD", "Úkol č. 1")
+    assert sirka_textu(rozlozeny) == sirka_textu("Úkol č. 1") == 9
+    assert sirka_textu("úkol 任务") == 9
+    assert oriznout("任务任务", 5) == "任务…"
+    assert oriznout("Úkol", 10) == "Úkol"
+
+# 2) negativní test: v tichém režimu se nic nevypisuje ani se nečeká na volbu;
+# neplatná velikost stránky vyvolá ValueError
+@pytest.mark.negative
+def test_vypis_negativni(fix_vypis, capsys):
+    nastavit_vypis(tichy=True)
+    vystup = io.StringIO()
+    vypsat_ukoly(UKOLY, nadpis="SEZNAM ÚKOLŮ:", vystup=vystup)
+    assert vystup.getvalue() == ""
+
+    def bez_vstupu(_):
+        raise AssertionError("V tichém režimu se na volbu nečeká.")
+    assert strankovat(lambda cislo: UKOLY[cislo * 2:cislo * 2 + 2], "SEZNAM ÚKOLŮ:", velikost_stranky=2,
+                      vstup=bez_vstupu) is True
+    assert strankovat(lambda cislo: [], "SEZNAM ÚKOLŮ:") == []
+    assert capsys.readouterr().out == ""
+
+    with pytest.raises(ValueError):
+        nastavit_vypis(velikost_stranky=0)
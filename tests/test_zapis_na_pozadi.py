@@ -0,0 +1,71 @@
+"""
+=================================================================================
+PyTest – testy zápisu na pozadí se skupinovým commitem (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že změny zařazené do ZapisNaPozadi se po vyprazdnit() zapíšou v pořadí
+zařazení a jejich Future vracejí stejné hodnoty jako synchronní DB funkce, a to i ve
+skupině s chybnou změnou, že výmaz skupinou zapíše záznam o smazání pro přehled změn
+(zmeny_od) a že po zavrit() nelze zařadit další změnu.
+================================================================================
+"""
+
+
+import time
+
+import pytest
+from task_manager_mysql.souhrn import pocty_podle_stavu
+from task_manager_mysql.task_manager_mysql_p2 import zobrazit_vsechny_ukoly
+from task_manager_mysql.zapis_na_pozadi import ZapisNaPozadi
+from task_manager_mysql.zmeny import zmeny_od
+
+
+# 1) pozitivní test: přidání, změna stavu a výmaz zapsané jednou skupinou; výmaz skupinou se objeví v přehledu změn
+@pytest.mark.positive
+def test_zapis_na_pozadi_pozitivni(fix_test_conn, fix_citace):
+    conn = fix_test_conn
+    with ZapisNaPozadi(conn, max_zpozdeni=1) as zapis:
+        pridani = [zapis.pridat_ukol(f"úkol {i}", "popis úkolu") for i in range(3)]
+        assert zapis.vyprazdnit(timeout=10) is True
+        assert [budouci.result() for budouci in pridani] == [True] * 3
+
+        ids = [ukol["id"] for ukol in zobrazit_vsechny_ukoly(conn)]
+        zmena = zapis.aktualizovat_ukol(ids[0], "hotovo")
+        vymaz = zapis.odstranit_ukol(ids[1])
+        assert zapis.vyprazdnit(timeout=10) is True
+        assert zmena.result() is True
+        assert vymaz.result() is True
+        assert zapis.statistiky()["po_jedne"] == 0
+
+    ukoly = zobrazit_vsechny_ukoly(conn)
+    assert [(ukol["id"], ukol["stav"]) for ukol in ukoly] == [(ids[0], "hotovo"), (ids[2], "nezahájeno")]
+    assert pocty_podle_stavu(conn) == {"nezahájeno": 1, "probíhá": 0, "hotovo": 1}     # čítače souhrnu změněné skupinou
+
+    time.sleep(0.01)                                    # čas změn musí být starší než čas serveru při čtení
+    zmenene, smazane, _ = zmeny_od(conn, zpozdeni=0)
+    assert sorted(ukol.id for ukol in zmenene) == [ids[0], ids[2]]
+    assert smazane == [ids[1]]
+
+# 2) negativní test: neplatná změna ve skupině vrátí False, ostatní změny skupiny se zapíšou;
+# po zavrit() nelze zařadit změnu
+@pytest.mark.negative
+def test_zapis_na_pozadi_negativni(fix_test_conn):
+    conn = fix_test_conn
+    zapis = ZapisNaPozadi(conn, max_zpozdeni=1)
+    prazdny = zapis.pridat_ukol("", "popis úkolu")
+    platny = zapis.pridat_ukol("platný úkol", "popis úkolu")
+    neexistujici = zapis.odstranit_ukol(999999)
+    zapis.vyprazdnit(timeout=10)
+    ukol_id = zobrazit_vsechny_ukoly(conn)[0]["id"]
+    neplatny_stav = zapis.aktualizovat_ukol(ukol_id, "neplatný stav")
+    dalsi = zapis.pridat_ukol("další úkol", "popis úkolu")
+    zapis.zavrit()
+
+    assert [prazdny.result(), platny.result(), neexistujici.result()] == [False, True, False]
+    assert neplatny_stav.result() is False
+    assert dalsi.result() is True
+    assert [ukol["nazev"] for ukol in zobrazit_vsechny_ukoly(conn)] == ["platný úkol", "další úkol"]
+    with pytest.raises(RuntimeError):
+        zapis.pridat_ukol("po ukončení", "popis úkolu")
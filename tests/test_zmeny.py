@@ -0,0 +1,91 @@
+"""
+=================================================================================
+PyTest – testy přehledu změn úkolů (Task Manager – Python + MySQL)
+---------------------------------------------------------------------------------
+Python:       3.10+
+
+Popis:
+Testy ověřují, že zmeny_od() vrací od značky jen vložené, změněné a odstraněné
+úkoly, po stránkách podle limitu, a že bez nových změn vrací prázdné seznamy
+se stejnou značkou, a že vycistit_smazane() odstraní jen staré záznamy o smazání.
+Testy volají zmeny_od() se zpozdeni=0 – změny provedené
+v testu jsou vidět hned (vlastní transakce testu).
+================================================================================
+"""
+
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from task_manager_mysql.task_manager_mysql_p2 import (
+    aktualizovat_ukol_db,
+    odstranit_ukol_db,
+    pridat_ukol_db,
+    zobrazit_vsechny_ukoly,
+)
+from task_manager_mysql.transakce import _potvrdit
+from task_manager_mysql.zmeny import vycistit_smazane, zmeny_od
+
+
+# 1) pozitivní test: vložené úkoly se vrátí po stránkách, od značky už jen změna stavu a odstranění
+@pytest.mark.positive
+def test_zmeny_od_pozitivni(fix_test_conn):
+    conn = fix_test_conn
+    for i in range(3):
+        assert pridat_ukol_db(f"Úkol {i}", "popis úkolu", conn) is True
+    time.sleep(0.01)                                    # čas vložení musí být starší než čas serveru při čtení
+
+    zmenene, smazane, znacka = zmeny_od(conn, limit=2, zpozdeni=0)
+    assert ([ukol.nazev for ukol in zmenene], smazane) == (["Úkol 0", "Úkol 1"], [])
+    zmenene, smazane, znacka = zmeny_od(conn, znacka, limit=2, zpozdeni=0)
+    assert ([ukol.nazev for ukol in zmenene], smazane) == (["Úkol 2"], [])
+
+    prvni, druhy, _ = zobrazit_vsechny_ukoly(conn)
+    assert aktualizovat_ukol_db(prvni.id, "hotovo", conn) is True
+    assert odstranit_ukol_db(druhy.id, conn) is True
+    time.sleep(0.01)
+    zmenene, smazane, znacka = zmeny_od(conn, znacka, zpozdeni=0)
+    assert [(ukol.id, ukol.stav) for ukol in zmenene] == [(prvni.id, "hotovo")]
+    assert smazane == [druhy.id]
+
+# 2) negativní test: bez nových změn (i po změně na stejný stav a výmazu neexistujícího úkolu) se vrací prázdné seznamy
+# a stejná značka; neplatná značka vyvolá ValueError
+@pytest.mark.negative
+def test_zmeny_od_negativni(fix_test_conn):
+    conn = fix_test_conn
+    assert pridat_ukol_db("Úkol", "popis úkolu", conn) is True
+    time.sleep(0.01)
+    _, _, znacka = zmeny_od(conn, zpozdeni=0)
+
+    id_ukolu = zobrazit_vsechny_ukoly(conn)[0].id
+    assert aktualizovat_ukol_db(id_ukolu, "nezahájeno", conn) is False
+    assert odstranit_ukol_db(id_ukolu + 1, conn) is False
+    time.sleep(0.01)
+    assert zmeny_od(conn, znacka, zpozdeni=0) == ([], [], znacka)
+
+    for neplatna in ("bez lomítka", "2026-01-01 00:00:00/x", 42):
+        with pytest.raises(ValueError):
+            zmeny_od(conn, neplatna)
+
+# 3) pozitivní test: čištění odstraní po dávkách jen záznamy o smazání starší než zadaný počet dní
+@pytest.mark.positive
+def test_zmeny_vycistit_smazane(fix_test_conn):
+    conn = fix_test_conn
+    for i in range(4):
+        assert pridat_ukol_db(f"Úkol {i}", "popis úkolu", conn) is True
+    ids = [ukol.id for ukol in zobrazit_vsechny_ukoly(conn)]
+    for id_ukolu in ids:
+        assert odstranit_ukol_db(id_ukolu, conn) is True
+    cursor = conn.cursor()
+    cursor.execute(f"UPDATE ukoly_smazane SET smazano = %s WHERE id IN ({ids[0]}, {ids[1]}, {ids[2]})",
+                   (datetime.now() - timedelta(days=60),))
+    _potvrdit(conn)         # ve vnější transakci fixture jen posune bod uložení
+    cursor.close()
+
+    assert vycistit_smazane(conn, starsi_nez_dnu=30, batch_size=2) == 3
+    assert vycistit_smazane(conn, starsi_nez_dnu=30) == 0
+    time.sleep(0.01)
+    assert zmeny_od(conn, zpozdeni=0)[1] == [ids[3]]
+    with pytest.raises(ValueError):
+        vycistit_smazane(conn, batch_size=0)